@@ -24,7 +24,7 @@ from jobx.model import Country, JobResponse, Location, SalarySource, ScraperInpu
 from jobx.scoring import calculate_confidence_score
 from jobx.util import (
     column_renames,
-    convert_to_annual,
+    convert_to_annual_df,
     create_logger,
     desired_order,
     extract_salary,
@@ -138,6 +138,8 @@ def scrape_jobs(
             site_to_jobs_dict[site_value] = scraped_data
 
     jobs_dfs: list[pd.DataFrame] = []
+    # Row positions whose direct compensation should be annualized
+    annualize_rows: list[int] = []
 
     for site, job_response in site_to_jobs_dict.items():
         for job in job_response.jobs:
@@ -176,7 +178,7 @@ def scrape_jobs(
                     and job_data["min_amount"]
                     and job_data["max_amount"]
                 ):
-                    convert_to_annual(job_data)
+                    annualize_rows.append(len(jobs_dfs))
             else:
                 if country_enum == Country.USA:
                     (
@@ -213,6 +215,12 @@ def scrape_jobs(
         # Step 2: Concatenate the filtered DataFrames
         jobs_df = pd.concat(filtered_dfs, ignore_index=True)
 
+        # Annualize direct compensation in one vectorized pass
+        if annualize_rows:
+            mask = pd.Series(False, index=jobs_df.index)
+            mask.iloc[annualize_rows] = True
+            convert_to_annual_df(jobs_df, mask)
+
         # Step 3: Ensure all desired columns are present, adding missing ones as empty
         for column in desired_order:
             if column not in jobs_df.columns:
@@ -10,11 +10,13 @@ randomization, and CAPTCHA detection capabilities.
 from __future__ import annotations
 
 import random
+import re
 import secrets
 import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import numpy as np
@@ -103,17 +105,21 @@ class UserAgentRotator:
         },
     }
     
+    _BROWSERS = tuple(BrowserType)
+    
     def __init__(self, device_types: Optional[List[DeviceType]] = None):
         """Initialize user agent rotator with specified device types."""
         self.device_types = device_types or [DeviceType.DESKTOP]
         self.current_profile: Optional[BrowserProfile] = None
-        self._used_agents: List[str] = []
+        # Recent agents in order, mirrored by a set for O(1) membership checks
+        self._used_agents: Deque[str] = deque()
+        self._used_set: Set[str] = set()
         self._max_history = 10
     
     def get_random_user_agent(self) -> str:
         """Get a random user agent string."""
         device = random.choice(self.device_types)
-        browser = random.choice(list(BrowserType))
+        browser = random.choice(self._BROWSERS)
         
         agents = self.USER_AGENTS.get(device, {}).get(browser, [])
         if not agents:
@@ -121,15 +127,18 @@ class UserAgentRotator:
             agents = self.USER_AGENTS[DeviceType.DESKTOP][BrowserType.CHROME]
         
         # Try to avoid recently used agents
-        available = [a for a in agents if a not in self._used_agents]
+        used = self._used_set
+        available = [a for a in agents if a not in used]
         if not available:
             available = agents
-            self._used_agents = []
+            self._used_agents.clear()
+            used.clear()
         
         agent = random.choice(available)
         self._used_agents.append(agent)
-        if len(self._used_agents) > self._max_history:
-            self._used_agents.pop(0)
+        used.add(agent)
+        while len(self._used_agents) > self._max_history:
+            used.discard(self._used_agents.popleft())
         
         return agent
     
@@ -317,19 +326,53 @@ class CaptchaDetector:
         "please verify",
     ]
     
+    RATE_LIMIT_PHRASES = [
+        "rate limit",
+        "too many requests",
+        "slow down",
+        "try again later",
+        "temporarily blocked",
+    ]
+    
+    # All indicators in one pattern, one named group per CAPTCHA type
+    _INDICATOR_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{captcha_type}>{'|'.join(re.escape(i) for i in indicators)})"
+            for captcha_type, indicators in CAPTCHA_INDICATORS.items()
+        ),
+        re.IGNORECASE,
+    )
+    # Position in CAPTCHA_INDICATORS decides which type wins when several match
+    _INDICATOR_RANK = {captcha_type: rank for rank, captcha_type in enumerate(CAPTCHA_INDICATORS)}
+    
+    # Every structural check below needs one of these words somewhere in the
+    # page, so pages without them skip the HTML parse entirely
+    _STRUCTURE_HINT = re.compile(
+        "|".join(re.escape(title.split("'")[0]) for title in CAPTCHA_TITLES + ["noindex"])
+    )
+    
+    _RATE_LIMIT_PATTERN = re.compile("|".join(map(re.escape, RATE_LIMIT_PHRASES)))
+    
     @classmethod
     def detect_captcha(cls, html_content: str, url: str = "") -> Tuple[bool, Optional[str]]:
         """Detect if page contains a CAPTCHA challenge."""
         if not html_content:
             return False, None
         
-        html_lower = html_content.lower()
+        # Check for CAPTCHA indicators in HTML in a single scan
+        best = None
+        for match in cls._INDICATOR_PATTERN.finditer(html_content):
+            rank = cls._INDICATOR_RANK[match.lastgroup]
+            if best is None or rank < best[0]:
+                best = (rank, match.lastgroup)
+                if rank == 0:
+                    break
+        if best is not None:
+            return True, best[1]
         
-        # Check for CAPTCHA indicators in HTML
-        for captcha_type, indicators in cls.CAPTCHA_INDICATORS.items():
-            for indicator in indicators:
-                if indicator.lower() in html_lower:
-                    return True, captcha_type
+        html_lower = html_content.lower()
+        if not cls._STRUCTURE_HINT.search(html_lower):
+            return False, None
         
         # Check page title
         soup = BeautifulSoup(html_content, 'html.parser')
@@ -370,15 +413,7 @@ class CaptchaDetector:
         
         if response_code == 403:
             # Check if it's a rate limit 403 vs access denied
-            rate_limit_phrases = [
-                "rate limit",
-                "too many requests",
-                "slow down",
-                "try again later",
-                "temporarily blocked",
-            ]
-            html_lower = html_content.lower()
-            return any(phrase in html_lower for phrase in rate_limit_phrases)
+            return cls._RATE_LIMIT_PATTERN.search(html_content.lower()) is not None
         
         return False
 
@@ -386,11 +421,14 @@ class CaptchaDetector:
 class IntelligentDelayManager:
     """Manages delays with adaptive patterns based on response times."""
     
+    # Number of recent response times kept
+    RESPONSE_WINDOW = 10
+    
     def __init__(self, base_delay: float = 1.0, max_delay: float = 10.0):
         """Initialize delay manager."""
         self.base_delay = base_delay
         self.max_delay = max_delay
-        self.recent_response_times: List[float] = []
+        self.recent_response_times: Deque[float] = deque(maxlen=self.RESPONSE_WINDOW)
         self.consecutive_fast_responses = 0
         self.consecutive_slow_responses = 0
         self.last_request_time = 0
@@ -400,8 +438,6 @@ class IntelligentDelayManager:
         """Calculate next delay based on patterns."""
         if last_response_time is not None:
             self.recent_response_times.append(last_response_time)
-            if len(self.recent_response_times) > 10:
-                self.recent_response_times.pop(0)
             
             # Detect patterns
             if last_response_time < 0.5:  # Very fast response
@@ -439,97 +475,117 @@ class IntelligentDelayManager:
     
     def reset(self):
         """Reset delay manager state."""
-        self.recent_response_times = []
+        self.recent_response_times.clear()
         self.consecutive_fast_responses = 0
         self.consecutive_slow_responses = 0
         self.backoff_multiplier = 1.0
 
 
 class ProxyRotator:
-    """Manages proxy rotation with health checking."""
+    """Manages proxy rotation with health checking.
+
+    Health is kept as parallel arrays indexed by position in ``proxies`` so
+    picking the next healthy proxy is a single vectorized mask rather than a
+    loop over per-proxy dicts.
+    """
     
-    def __init__(self, proxies: List[str]):
-        """Initialize proxy rotator with list of proxies."""
-        self.proxies = proxies
+    def __init__(self, proxies: List[str], time_fn: Callable[[], float] = time.time):
+        """Initialize proxy rotator with list of proxies.
+
+        Args:
+            proxies: Proxy URLs to rotate through.
+            time_fn: Clock used for cooldowns and the per-proxy rate limit.
+        """
+        # Duplicates would split one proxy's health across two slots
+        self.proxies = list(dict.fromkeys(proxies))
         self.current_index = 0
-        self.proxy_health: Dict[str, Dict[str, Any]] = {}
+        self._now = time_fn
+        self._proxy_idx = {proxy: i for i, proxy in enumerate(self.proxies)}
         self.initialize_health_tracking()
     
     def initialize_health_tracking(self):
         """Initialize health tracking for all proxies."""
-        for proxy in self.proxies:
-            self.proxy_health[proxy] = {
-                "failures": 0,
-                "successes": 0,
-                "last_used": 0,
-                "last_failure": 0,
-                "response_times": [],
-                "blacklisted": False,
-            }
+        n = len(self.proxies)
+        self.failures = np.zeros(n, dtype=np.int32)
+        self.successes = np.zeros(n, dtype=np.int32)
+        self.last_used = np.zeros(n, dtype=np.float64)
+        self.last_failure = np.zeros(n, dtype=np.float64)
+        self.blacklisted = np.zeros(n, dtype=bool)
+        self.response_times: List[deque] = [deque(maxlen=10) for _ in range(n)]
+    
+    def get_proxy_health(self, proxy: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of one proxy's health, or None for an unknown proxy.
+
+        The dict is built from the health arrays on each call; writing to it
+        does not change the rotator's state.
+        """
+        i = self._proxy_idx.get(proxy)
+        if i is None:
+            return None
+        return {
+            "failures": int(self.failures[i]),
+            "successes": int(self.successes[i]),
+            "last_used": float(self.last_used[i]),
+            "last_failure": float(self.last_failure[i]),
+            "response_times": list(self.response_times[i]),
+            "blacklisted": bool(self.blacklisted[i]),
+        }
+    
+    def health_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of every proxy's health, keyed by proxy."""
+        return {proxy: self.get_proxy_health(proxy) for proxy in self.proxies}
     
     def get_next_proxy(self) -> Optional[str]:
         """Get next healthy proxy from rotation."""
-        attempts = 0
-        while attempts < len(self.proxies):
-            proxy = self.proxies[self.current_index]
-            self.current_index = (self.current_index + 1) % len(self.proxies)
-            
-            health = self.proxy_health[proxy]
-            
-            # Skip blacklisted proxies
-            if health["blacklisted"]:
-                attempts += 1
-                continue
-            
-            # Skip recently failed proxies (cooldown period)
-            if health["last_failure"] > 0:
-                cooldown = min(300, 30 * health["failures"])  # Exponential cooldown
-                if time.time() - health["last_failure"] < cooldown:
-                    attempts += 1
-                    continue
-            
-            # Skip overused proxies (rate limiting)
-            if health["last_used"] > 0:
-                if time.time() - health["last_used"] < 1:  # Minimum 1 second between uses
-                    attempts += 1
-                    continue
-            
-            health["last_used"] = time.time()
-            return proxy
-        
-        # All proxies are unhealthy
-        return None
+        now = self._now()
+        
+        # Skip blacklisted proxies
+        available = ~self.blacklisted
+        # Skip recently failed proxies (cooldown period)
+        cooldown = np.minimum(300, 30 * self.failures)  # Exponential cooldown
+        available &= (self.last_failure == 0) | (now - self.last_failure >= cooldown)
+        # Skip overused proxies (minimum 1 second between uses)
+        available &= (self.last_used == 0) | (now - self.last_used >= 1)
+        
+        candidates = np.flatnonzero(available)
+        if candidates.size == 0:
+            # All proxies are unhealthy
+            return None
+        
+        # First healthy proxy at or after the rotation cursor, wrapping around
+        i = int(candidates[np.searchsorted(candidates, self.current_index) % candidates.size])
+        self.current_index = (i + 1) % len(self.proxies)
+        self.last_used[i] = now
+        return self.proxies[i]
     
     def mark_success(self, proxy: str, response_time: float):
         """Mark a successful request for a proxy."""
-        if proxy in self.proxy_health:
-            health = self.proxy_health[proxy]
-            health["successes"] += 1
-            health["failures"] = max(0, health["failures"] - 1)  # Reduce failure count
-            health["response_times"].append(response_time)
-            if len(health["response_times"]) > 10:
-                health["response_times"].pop(0)
+        i = self._proxy_idx.get(proxy)
+        if i is not None:
+            self.successes[i] += 1
+            self.failures[i] = max(0, self.failures[i] - 1)  # Reduce failure count
+            self.response_times[i].append(response_time)
     
     def mark_failure(self, proxy: str, error_type: str = "unknown"):
         """Mark a failed request for a proxy."""
-        if proxy in self.proxy_health:
-            health = self.proxy_health[proxy]
-            health["failures"] += 1
-            health["last_failure"] = time.time()
+        i = self._proxy_idx.get(proxy)
+        if i is not None:
+            self.failures[i] += 1
+            self.last_failure[i] = self._now()
             
             # Blacklist after too many failures
-            if health["failures"] >= 5:
-                health["blacklisted"] = True
+            if self.failures[i] >= 5:
+                self.blacklisted[i] = True
     
     def get_proxy_stats(self) -> Dict[str, Any]:
         """Get statistics about proxy health."""
         total = len(self.proxies)
-        healthy = sum(1 for h in self.proxy_health.values() if not h["blacklisted"])
+        healthy = int(np.count_nonzero(~self.blacklisted))
         
         avg_response_times = {}
-        for proxy, health in self.proxy_health.items():
-            if health["response_times"]:
-                avg_response_times[proxy] = np.mean(health["response_times"])
+        for proxy, i in self._proxy_idx.items():
+            if self.response_times[i]:
+                avg_response_times[proxy] = np.mean(self.response_times[i])
         
         return {
             "total_proxies": total,
@@ -540,15 +596,14 @@ class ProxyRotator:
     
     def reset_proxy(self, proxy: str):
         """Reset a proxy's health stats."""
-        if proxy in self.proxy_health:
-            self.proxy_health[proxy] = {
-                "failures": 0,
-                "successes": 0,
-                "last_used": 0,
-                "last_failure": 0,
-                "response_times": [],
-                "blacklisted": False,
-            }
+        i = self._proxy_idx.get(proxy)
+        if i is not None:
+            self.failures[i] = 0
+            self.successes[i] = 0
+            self.last_used[i] = 0
+            self.last_failure[i] = 0
+            self.blacklisted[i] = False
+            self.response_times[i].clear()
 
 
 class StealthSession:
@@ -5,6 +5,7 @@ import argparse
 import json
 import os
 import sys
+from functools import cache
 
 import pandas as pd
 
@@ -45,8 +46,9 @@ def _df_to_json(df: pd.DataFrame) -> str:
     return json.dumps({"jobs": jobs}, indent=2, default=str)
 
 
-def main() -> None:
-    """Main CLI entry point for jobx."""
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the jobx argument parser once; parse_args does not mutate it."""
     parser = argparse.ArgumentParser(
         prog="jobx",
         description="Scrape job listings from LinkedIn and Indeed",
@@ -141,7 +143,12 @@ Examples:
         help="Show program version and exit",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """Main CLI entry point for jobx."""
+    args = _build_parser().parse_args()
 
     # Support environment variable for my-company names
     if not args.my_company:
@@ -186,12 +193,12 @@ Examples:
             if not args.output:
                 print("Error: Parquet format requires an output file (-o/--output)", file=sys.stderr)
                 sys.exit(1)
-            df.to_parquet(args.output, index=False)
+            df.to_parquet(args.output, index=False, compression="zstd")
         else:
             if args.output:
                 df.to_csv(args.output, index=False)
             else:
-                print(df.to_csv(index=False))
+                df.to_csv(sys.stdout, index=False)
 
         if args.verbose and args.output:
             print(f"Saved {len(df)} jobs to {args.output} in {args.format} format")
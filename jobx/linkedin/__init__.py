@@ -36,6 +36,7 @@ from jobx.model import (
 )
 from jobx.serp import LinkedInSerpParser, is_my_company, normalize_company_name
 from jobx.util import (
+    HTML_PARSER,
     create_logger,
     create_session,
     currency_parser,
@@ -158,7 +159,7 @@ class LinkedIn(Scraper):
                     log.error(f"LinkedIn: {e!s}")
                 return JobResponse(jobs=job_list)
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
                 return JobResponse(jobs=job_list)
@@ -0,0 +1,24 @@
+"""YAML helpers for the market analysis tool.
+
+Resolves the libyaml-backed ``CSafeLoader``/``CSafeDumper`` once at import,
+falling back to the pure-Python safe loader/dumper when PyYAML was built
+without libyaml.
+"""
+
+from typing import Any, Optional
+
+import yaml
+
+# CSafeLoader/CSafeDumper are only defined when PyYAML was built with libyaml
+SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def safe_load(stream: Any) -> Any:
+    """Parse YAML from a string or stream with the fastest safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)  # noqa: S506 - SafeLoader is (C)SafeLoader
+
+
+def safe_dump(data: Any, stream: Optional[Any] = None, **kwargs: Any) -> Any:
+    """Serialize data to YAML with the fastest safe dumper."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
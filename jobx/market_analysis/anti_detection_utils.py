@@ -4,14 +4,29 @@ Provides scheduling, monitoring, and safety features.
 """
 
 import json
+import os
 import random
 import threading
 import time
 from pathlib import Path
 from datetime import datetime, time as datetime_time, timedelta
-from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
-import yaml
+from typing import Deque, Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+import numpy as np
+
+from jobx.market_analysis import _yaml
+
+_RNG = np.random.default_rng()
+
+
+def _minute_of_day(t: datetime_time) -> int:
+    """Minutes since midnight for a wall-clock time."""
+    return t.hour * 60 + t.minute
+
+
+def _fractional_minute(now: datetime) -> float:
+    """Minutes since midnight including seconds, so inclusive window ends stay exact."""
+    return now.hour * 60 + now.minute + (now.second + now.microsecond / 1e6) / 60
 
 
 class SmartScheduler:
@@ -24,6 +39,23 @@ class SmartScheduler:
         (datetime_time(16, 0), datetime_time(18, 0)),    # After work searches
         (datetime_time(19, 30), datetime_time(21, 30)),  # Evening searches
     ]
+
+    # PEAK_HOURS as (start, end, reason) in minutes since midnight, so the
+    # time checks compare plain numbers
+    _PEAK_WINDOWS = tuple(
+        (
+            _minute_of_day(start),
+            _minute_of_day(end),
+            f"Peak hour window: {start.strftime('%H:%M')}-{end.strftime('%H:%M')}",
+        )
+        for start, end in PEAK_HOURS
+    )
+    # Late night/early morning to avoid (2 AM - 6 AM)
+    _NIGHT = (2 * 60, 6 * 60)
+    # Off-peak but acceptable hours (6 AM - 10 PM)
+    _DAY = (6 * 60, 22 * 60)
+    # Minutes at which a search window opens, in order
+    _WINDOW_OPENS = tuple(sorted({_DAY[0]} | {start for start, _, _ in _PEAK_WINDOWS}))
     
     # Days with different patterns
     WEEKDAY_MULTIPLIER = 1.0
@@ -31,25 +63,30 @@ class SmartScheduler:
     SUNDAY_MULTIPLIER = 0.5     # Least traffic
     
     @classmethod
-    def is_good_time_to_search(cls) -> Tuple[bool, str]:
-        """Check if current time is good for searching."""
-        now = datetime.now()
-        current_time = now.time()
+    def is_good_time_to_search(cls, now: Optional[datetime] = None) -> Tuple[bool, str]:
+        """Check if current time is good for searching.
+
+        Args:
+            now: Time to check; defaults to the current local time.
+        """
+        if now is None:
+            now = datetime.now()
+        minute = _fractional_minute(now)
         
         # Check day of week (0=Monday, 6=Sunday)
         day_of_week = now.weekday()
         
         # Avoid late night/early morning (2 AM - 6 AM)
-        if datetime_time(2, 0) <= current_time <= datetime_time(6, 0):
+        if cls._NIGHT[0] <= minute <= cls._NIGHT[1]:
             return False, "Too early - wait until business hours"
         
         # Check if in peak hours
-        for start, end in cls.PEAK_HOURS:
-            if start <= current_time <= end:
-                return True, f"Peak hour window: {start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
+        for start, end, reason in cls._PEAK_WINDOWS:
+            if start <= minute <= end:
+                return True, reason
         
         # Off-peak but acceptable hours (6 AM - 10 PM)
-        if datetime_time(6, 0) <= current_time <= datetime_time(22, 0):
+        if cls._DAY[0] <= minute <= cls._DAY[1]:
             if day_of_week < 5:  # Weekday
                 return True, "Weekday off-peak (acceptable)"
             else:  # Weekend
@@ -58,9 +95,10 @@ class SmartScheduler:
         return False, "Outside optimal search hours"
     
     @classmethod
-    def get_delay_multiplier(cls) -> float:
+    def get_delay_multiplier(cls, now: Optional[datetime] = None) -> float:
         """Get delay multiplier based on time and day."""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         day_of_week = now.weekday()
         
         if day_of_week < 5:  # Weekday
@@ -70,11 +108,25 @@ class SmartScheduler:
         else:  # Sunday
             return cls.SUNDAY_MULTIPLIER
     
+    @classmethod
+    def _seconds_until_next_window(cls, now: datetime) -> float:
+        """Seconds from ``now`` until the next search window opens.
+
+        Window ends are inclusive, so the result lands one second past the
+        boundary. Wraps to the next day after the last window of the day.
+        """
+        minute = _fractional_minute(now)
+        for start in cls._WINDOW_OPENS:
+            if start >= minute:
+                return (start - minute) * 60 + 1
+        return (cls._WINDOW_OPENS[0] + 24 * 60 - minute) * 60 + 1
+    
     @classmethod
     def wait_for_good_time(cls, logger=None):
         """Wait until a good time to search."""
         while True:
-            is_good, reason = cls.is_good_time_to_search()
+            now = datetime.now()
+            is_good, reason = cls.is_good_time_to_search(now)
             if is_good:
                 if logger:
                     logger.info(f"Good time to search: {reason}")
@@ -86,76 +138,140 @@ class SmartScheduler:
                     logger.info(f"Waiting: {reason}")
                 else:
                     print(f"⏸ {reason}")
-                # Check every 30 minutes
-                wait_minutes = 30 + random.randint(-5, 5)
+                # Sleep once until the next window opens, with a little jitter
+                delay = cls._seconds_until_next_window(now) + random.uniform(0, 60)
+                wait_minutes = round(delay / 60)
                 if logger:
                     logger.info(f"Waiting {wait_minutes} minutes...")
                 else:
                     print(f"  Waiting {wait_minutes} minutes...")
-                time.sleep(wait_minutes * 60)
+                time.sleep(delay)
     
     @classmethod
-    def get_human_like_delay(cls, base_delay: float = 5.0) -> float:
+    def get_human_like_delay(cls, base_delay: float = 5.0, now: Optional[datetime] = None) -> float:
         """Get a human-like delay with time-of-day variation."""
-        multiplier = cls.get_delay_multiplier()
+        return float(cls.get_human_like_delays(1, base_delay, now)[0])
+    
+    @classmethod
+    def get_human_like_delays(
+        cls, n: int, base_delay: float = 5.0, now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Get ``n`` human-like delays at once, drawing all randomness in bulk."""
+        multiplier = cls.get_delay_multiplier(now)
         
         # Add "typing time" - humans don't search instantly
-        typing_delay = random.uniform(0.5, 2.0)
+        typing_delay = _RNG.uniform(0.5, 2.0, n)
         
         # Add "reading time" - humans read results
-        reading_delay = random.uniform(2.0, 5.0)
+        reading_delay = _RNG.uniform(2.0, 5.0, n)
         
         # Total delay with variation
         total = (base_delay * multiplier) + typing_delay + reading_delay
         
         # Add random "distraction" delays occasionally (checking email, etc)
-        if random.random() < 0.1:  # 10% chance
-            distraction = random.uniform(10, 30)
-            total += distraction
+        distracted = _RNG.random(n) < 0.1  # 10% chance
+        total += _RNG.uniform(10, 30, n) * distracted
         
         return total
 
 
 class SearchMonitor:
-    """Monitor search success rates and detect when being blocked."""
-    
+    """Monitor search success rates and detect when being blocked.
+
+    Aggregate counters live in ``search_monitor.json``; individual failures are
+    appended to ``search_monitor.failures.jsonl`` so each write is O(1)
+    regardless of how much history has accumulated.
+    """
+
+    # Number of recent failure timestamps kept in memory for pause checks
+    RECENT_FAILURES = 100
+    # Failures older than this no longer count towards the pause threshold
+    RECENT_FAILURE_WINDOW = timedelta(hours=1)
+
+    _SUMMARY_TEMPLATE = """
+Search Statistics:
+- Total searches: {total}
+- Success rate: {success_rate:.1f}%
+- Last success: {last_success}
+- Unique locations: {locations}
+- Session start: {session_start}
+"""
+
     def __init__(self, output_dir: str = "."):
         self.log_file = Path(output_dir) / "search_monitor.json"
+        self.failure_log = self.log_file.with_suffix(".failures.jsonl")
+        self._recent_failures: Deque[datetime] = deque(maxlen=self.RECENT_FAILURES)
         self.stats = self.load_stats()
-    
+        self._load_recent_failures()
+
     def load_stats(self) -> Dict:
         """Load existing stats or create new."""
         if self.log_file.exists():
             with open(self.log_file, 'r') as f:
-                return json.load(f)
+                stats = json.load(f)
+            # Older stats files embedded the failure history; move it into
+            # the JSONL failure log.
+            legacy_failures = stats.pop("failure_patterns", None)
+            if legacy_failures and not self.failure_log.exists():
+                for record in legacy_failures:
+                    self._append_failure(record)
+            return stats
         return {
             "locations": {},
-            "failure_patterns": [],
             "last_success": None,
             "total_searches": 0,
             "total_failures": 0,
             "session_start": datetime.now().isoformat()
         }
-    
+
+    def _load_recent_failures(self):
+        """Seed the in-memory failure window from the tail of the failure log."""
+        if not self.failure_log.exists():
+            return
+        with open(self.failure_log, 'r') as f:
+            tail = deque(f, maxlen=self.RECENT_FAILURES)
+        for line in tail:
+            try:
+                self._recent_failures.append(datetime.fromisoformat(json.loads(line)["time"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    def _prune_recent_failures(self, now: datetime):
+        """Drop failure timestamps that have aged out of the recent window."""
+        cutoff = now - self.RECENT_FAILURE_WINDOW
+        recent = self._recent_failures
+        while recent and recent[0] < cutoff:
+            recent.popleft()
+
+    def _recent_failure_count(self) -> int:
+        """Number of failures recorded within the recent window."""
+        self._prune_recent_failures(datetime.now())
+        return len(self._recent_failures)
+
+    def _append_failure(self, record: Dict):
+        """Append a single failure record to the JSONL failure log."""
+        with open(self.failure_log, 'a') as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
     def save_stats(self):
         """Save stats to file."""
         with open(self.log_file, 'w') as f:
             json.dump(self.stats, f, indent=2, default=str)
-    
+
     def record_search(self, location: str, success: bool, jobs_found: int = 0, error: str = None):
         """Record a search attempt."""
         self.stats["total_searches"] += 1
-        
+
         if not success:
             self.stats["total_failures"] += 1
-            self.stats["failure_patterns"].append({
-                "time": datetime.now().isoformat(),
+            now = datetime.now()
+            self._recent_failures.append(now)
+            self._prune_recent_failures(now)
+            self._append_failure({
+                "time": now.isoformat(),
                 "location": location,
                 "error": error
             })
-            # Keep only last 100 failures to avoid memory issues
-            if len(self.stats["failure_patterns"]) > 100:
-                self.stats["failure_patterns"] = self.stats["failure_patterns"][-100:]
         else:
             self.stats["last_success"] = datetime.now().isoformat()
         
@@ -181,30 +297,15 @@ class SearchMonitor:
     def should_pause(self) -> Tuple[bool, str]:
         """Check if we should pause based on failure patterns."""
         # Check recent failure rate
-        recent_failures = []
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-        
-        for f in self.stats["failure_patterns"]:
-            try:
-                failure_time = datetime.fromisoformat(f["time"])
-                if failure_time > one_hour_ago:
-                    recent_failures.append(f)
-            except:
-                continue
+        recent_failures = self._recent_failure_count()
         
-        if len(recent_failures) > 5:
-            return True, f"Too many recent failures ({len(recent_failures)} in last hour)"
+        if recent_failures > 5:
+            return True, f"Too many recent failures ({recent_failures} in last hour)"
         
-        # Check consecutive failures
-        if len(self.stats["failure_patterns"]) >= 3:
-            last_failures = self.stats["failure_patterns"][-3:]
-            # Check if all within 5 minutes
-            try:
-                times = [datetime.fromisoformat(f["time"]) for f in last_failures]
-                if (times[-1] - times[0]).total_seconds() < 300:
-                    return True, "3 consecutive failures within 5 minutes"
-            except:
-                pass
+        # Check consecutive failures (all within 5 minutes)
+        if len(self._recent_failures) >= 3:
+            if (self._recent_failures[-1] - self._recent_failures[-3]).total_seconds() < 300:
+                return True, "3 consecutive failures within 5 minutes"
         
         # Check overall failure rate
         if self.stats["total_searches"] > 20:
@@ -221,45 +322,75 @@ class SearchMonitor:
             return "No searches recorded yet"
         
         success_rate = (total - self.stats["total_failures"]) / total * 100
-        
-        return f"""
-Search Statistics:
-- Total searches: {total}
-- Success rate: {success_rate:.1f}%
-- Last success: {self.stats.get('last_success', 'Never')}
-- Unique locations: {len(self.stats['locations'])}
-- Session start: {self.stats.get('session_start', 'Unknown')}
-"""
+
+        return self._SUMMARY_TEMPLATE.format(
+            total=total,
+            success_rate=success_rate,
+            last_success=self.stats.get('last_success', 'Never'),
+            locations=len(self.stats['locations']),
+            session_start=self.stats.get('session_start', 'Unknown'),
+        )
 
 
 class SafetyManager:
     """Manages safety features like breaks, region rotation, and progress tracking.
 
     Tracks progress at the task level (center_code:role_id) and supports
-    resuming from checkpoints after crashes or interruptions.
+    resuming from checkpoints after crashes or interruptions. Each mark is
+    appended to ``progress_journal.jsonl``; the ``search_progress.json``
+    snapshot is only rewritten when the journal is compacted. Snapshots from
+    older versions in ``search_progress.yaml`` are still read and converted.
     """
 
     SCHEMA_VERSION = 2
 
-    def __init__(self, output_dir: str = "."):
+    # Marks are appended to a JSONL journal; the JSON snapshot is rewritten
+    # (and the journal truncated) once this many have accumulated.
+    COMPACT_AFTER = 1000
+
+    def __init__(self, output_dir: str = ".", fsync: bool = False):
+        """Initialize the safety manager and load any existing progress.
+
+        Args:
+            output_dir: Directory holding the progress snapshot and journal
+            fsync: Flush journal appends and snapshot replaces (including the
+                parent directory entry) to disk, so checkpoints also survive
+                power loss rather than only process crashes
+        """
         self.output_dir = Path(output_dir)
-        self.progress_file = self.output_dir / "search_progress.yaml"
+        self.progress_file = self.output_dir / "search_progress.json"
+        self.legacy_progress_file = self.output_dir / "search_progress.yaml"
+        self.journal_file = self.output_dir / "progress_journal.jsonl"
+        self.fsync = fsync
         self._lock = threading.Lock()
+        self._pending = 0
         self.load_progress()
 
     def load_progress(self):
-        """Load search progress, migrating from v1 if needed."""
+        """Load search progress, migrating from v1 if needed, then replay the journal."""
+        migrated = False
         if self.progress_file.exists():
             with open(self.progress_file, 'r') as f:
-                raw = yaml.safe_load(f) or {}
-
-            if raw.get("schema_version", 1) < self.SCHEMA_VERSION:
-                self.progress = self._migrate_v1(raw)
-                self.save_progress()
-            else:
-                self.progress = raw
+                raw = json.load(f)
+        elif self.legacy_progress_file.exists():
+            with open(self.legacy_progress_file, 'r') as f:
+                raw = _yaml.safe_load(f) or {}
+            migrated = True
         else:
+            raw = None
+
+        if raw is None:
             self.progress = self._new_progress()
+        elif raw.get("schema_version", 1) < self.SCHEMA_VERSION:
+            self.progress = self._migrate_v1(raw)
+            migrated = True
+        else:
+            self.progress = raw
+
+        self._pending = self._replay_journal()
+        if migrated:
+            self.save_progress()
+            self.legacy_progress_file.unlink(missing_ok=True)
 
     @classmethod
     def _new_progress(cls) -> dict:
@@ -293,11 +424,98 @@ class SafetyManager:
         return f"{center_code}:{role_id}"
 
     def save_progress(self):
-        """Save search progress atomically."""
-        tmp = self.progress_file.with_suffix('.yaml.tmp')
+        """Save search progress atomically and truncate the journal it now covers."""
+        tmp = self.progress_file.with_suffix('.json.tmp')
         with open(tmp, 'w') as f:
-            yaml.dump(self.progress, f, default_flow_style=False)
+            json.dump(self.progress, f, separators=(",", ":"))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
         tmp.replace(self.progress_file)
+        self.journal_file.unlink(missing_ok=True)
+        if self.fsync:
+            self._fsync_dir()
+        self._pending = 0
+
+    def _fsync_dir(self):
+        """Persist the directory entries changed by a rename or unlink."""
+        if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - Windows
+            return
+        fd = os.open(self.output_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def flush(self):
+        """Fold any journaled marks into the JSON snapshot."""
+        with self._lock:
+            if self._pending:
+                self.save_progress()
+
+    # ── Journal ────────────────────────────────────────────────
+
+    def _record(self, op: str, **fields):
+        """Append a mark to the journal and apply it to ``self.progress``.
+
+        Must be called with ``self._lock`` held.
+        """
+        event = {"op": op, "ts": datetime.now().isoformat(), **fields}
+        with open(self.journal_file, 'a') as f:
+            f.write(json.dumps(event) + "\n")
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._apply(event)
+        self._pending += 1
+        if self._pending >= self.COMPACT_AFTER:
+            self.save_progress()
+
+    def _replay_journal(self) -> int:
+        """Apply journaled marks on top of the loaded snapshot; return how many."""
+        if not self.journal_file.exists():
+            return 0
+        count = 0
+        with open(self.journal_file, 'r') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave a truncated last line
+                    continue
+                self._apply(event)
+                count += 1
+        return count
+
+    def _apply(self, event: dict):
+        """Apply one journal event to ``self.progress``; replaying is idempotent."""
+        op, ts = event["op"], event["ts"]
+        if op == "complete":
+            key = event["key"]
+            self.progress["completed_tasks"][key] = {
+                "status": "success",
+                "jobs_found": event["jobs_found"],
+                "jobs_with_salary": event["jobs_with_salary"],
+                "csv_file": event["csv_file"],
+                "completed_at": ts,
+            }
+            # Remove from failed if it was there (retry succeeded)
+            self.progress["failed_tasks"].pop(key, None)
+            self.progress["last_checkpoint_at"] = ts
+        elif op == "failed":
+            self.progress["failed_tasks"][event["key"]] = {
+                "error": event["error"],
+                "attempts": event["attempts"],
+                "last_attempt_at": ts,
+            }
+            self.progress["last_checkpoint_at"] = ts
+        elif op == "region":
+            if event["name"] not in self.progress["completed_regions"]:
+                self.progress["completed_regions"].append(event["name"])
+            self.progress["last_search_time"] = ts
+        elif op == "center":
+            if event["code"] not in self.progress["completed_centers"]:
+                self.progress["completed_centers"].append(event["code"])
 
     # ── Task-level checkpoint methods ──────────────────────────
 
@@ -307,30 +525,15 @@ class SafetyManager:
         """Record a successfully completed task."""
         key = self._task_key(center_code, role_id)
         with self._lock:
-            self.progress["completed_tasks"][key] = {
-                "status": "success",
-                "jobs_found": jobs_found,
-                "jobs_with_salary": jobs_with_salary,
-                "csv_file": csv_file,
-                "completed_at": datetime.now().isoformat(),
-            }
-            # Remove from failed if it was there (retry succeeded)
-            self.progress["failed_tasks"].pop(key, None)
-            self.progress["last_checkpoint_at"] = datetime.now().isoformat()
-            self.save_progress()
+            self._record("complete", key=key, jobs_found=jobs_found,
+                         jobs_with_salary=jobs_with_salary, csv_file=csv_file)
 
     def mark_task_failed(self, center_code: str, role_id: str,
                          error: str, attempts: int):
         """Record a task that exhausted all retries."""
         key = self._task_key(center_code, role_id)
         with self._lock:
-            self.progress["failed_tasks"][key] = {
-                "error": str(error),
-                "attempts": attempts,
-                "last_attempt_at": datetime.now().isoformat(),
-            }
-            self.progress["last_checkpoint_at"] = datetime.now().isoformat()
-            self.save_progress()
+            self._record("failed", key=key, error=str(error), attempts=attempts)
 
     def is_task_done(self, center_code: str, role_id: str) -> bool:
         """True if the task already succeeded or exhausted retries."""
@@ -338,10 +541,14 @@ class SafetyManager:
         return (key in self.progress.get("completed_tasks", {})
                 or key in self.progress.get("failed_tasks", {}))
 
+    def get_completed_task(self, center_code: str, role_id: str) -> Optional[dict]:
+        """Return the checkpoint entry for a completed task, or None."""
+        key = self._task_key(center_code, role_id)
+        return self.progress.get("completed_tasks", {}).get(key)
+
     def get_completed_task_csv(self, center_code: str, role_id: str) -> Optional[str]:
         """Return the CSV path for a completed task, or None."""
-        key = self._task_key(center_code, role_id)
-        entry = self.progress.get("completed_tasks", {}).get(key)
+        entry = self.get_completed_task(center_code, role_id)
         if entry:
             return entry.get("csv_file")
         return None
@@ -369,17 +576,12 @@ class SafetyManager:
     def mark_region_complete(self, region_name: str):
         """Mark a region as complete."""
         with self._lock:
-            if region_name not in self.progress["completed_regions"]:
-                self.progress["completed_regions"].append(region_name)
-            self.progress["last_search_time"] = datetime.now().isoformat()
-            self.save_progress()
+            self._record("region", name=region_name)
 
     def mark_center_complete(self, center_code: str):
         """Mark a center as complete."""
         with self._lock:
-            if center_code not in self.progress["completed_centers"]:
-                self.progress["completed_centers"].append(center_code)
-            self.save_progress()
+            self._record("center", code=center_code)
 
     def is_region_complete(self, region_name: str) -> bool:
         """Check if region is already complete."""
@@ -4,16 +4,20 @@ This module handles concurrent execution of job searches across multiple locatio
 and roles, with proper rate limiting and error handling.
 """
 
+import operator
 import os
 import random
+import re
 import threading
 import time
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from jobx import scrape_jobs
@@ -41,41 +45,55 @@ class ErrorCategory(str, Enum):
     UNKNOWN = "unknown"
 
 
-def classify_error(error_str: str) -> ErrorCategory:
-    """Classify an error message into an operational category.
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compile a case-insensitive pattern matching any of the substrings."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
 
-    Uses keyword matching on the lowercased error string.  The order of checks
-    matters — more specific categories are tested before generic ones.
-    """
-    lower = error_str.lower()
 
+# (category, pattern) pairs in priority order — more specific categories are
+# tested before generic ones.
+_ERROR_PATTERNS = (
     # Rate limiting (check before network — a 429 is a network response)
-    if any(kw in lower for kw in ("429", "rate limit", "too many requests", "blocked", "throttl")):
-        return ErrorCategory.RATE_LIMIT
-
+    (ErrorCategory.RATE_LIMIT, _keyword_pattern(
+        "429", "rate limit", "too many requests", "blocked", "throttl",
+    )),
     # Auth / access blocks
-    if any(kw in lower for kw in ("captcha", "403", "forbidden", "access denied", "challenge")):
-        return ErrorCategory.AUTH_BLOCK
-
+    (ErrorCategory.AUTH_BLOCK, _keyword_pattern(
+        "captcha", "403", "forbidden", "access denied", "challenge",
+    )),
     # Network / connectivity
-    if any(kw in lower for kw in (
+    (ErrorCategory.NETWORK, _keyword_pattern(
         "timeout", "timed out", "connection", "proxy", "dns", "ssl",
         "socket", "network", "unreachable", "reset by peer",
-    )):
-        return ErrorCategory.NETWORK
-
+    )),
     # Structural no-data
-    if any(kw in lower for kw in ("no jobs found", "no results", "empty")):
-        return ErrorCategory.NO_DATA
-
+    (ErrorCategory.NO_DATA, _keyword_pattern("no jobs found", "no results", "empty")),
     # Parse / data errors
-    if any(kw in lower for kw in ("valueerror", "parse", "json", "decode", "keyerror", "index")):
-        return ErrorCategory.PARSE_ERROR
+    (ErrorCategory.PARSE_ERROR, _keyword_pattern(
+        "valueerror", "parse", "json", "decode", "keyerror", "index",
+    )),
+)
 
+
+@lru_cache(maxsize=4096)
+def classify_error(error_str: str) -> ErrorCategory:
+    """Classify an error message into an operational category.
+
+    Uses case-insensitive keyword matching on the error string.  The order of
+    checks matters — more specific categories are tested before generic ones.
+    Results are memoized since the same messages recur across many tasks.
+    """
+    for category, pattern in _ERROR_PATTERNS:
+        if pattern.search(error_str):
+            return category
     return ErrorCategory.UNKNOWN
 
 
-@dataclass
+# Salary columns of the raw job CSVs; declaring them skips type inference
+_SALARY_DTYPES = {"min_amount": "float64", "max_amount": "float64"}
+
+
+@dataclass(slots=True)
 class LocationResult:
     """Result from searching a single location for a specific role."""
     center: Center
@@ -100,13 +118,33 @@ class LocationResult:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class _ResultColumns:
+    """Per-result columns gathered in one pass for the summary statistics."""
+    source: Tuple[LocationResult, ...]  # the results the columns were built from
+    durations: np.ndarray  # float64, NaN where no duration was recorded
+    success: np.ndarray  # bool
+    jobs_found: np.ndarray  # int64
+    jobs_with_salary: np.ndarray  # int64
+    role_ids: np.ndarray  # str
+    center_codes: Set[str]
+    failures: List[Tuple[str, str]]  # (message, category) per failed result
+
+
+@dataclass(frozen=True, slots=True)
 class RoleSearchTask:
     """Represents a search task for a specific role at a specific center."""
     role: Role
     center: Center
     market_name: str
     region_name: str
+    # Derived once at construction: checkpoint key and raw CSV file name
+    key: str = field(init=False, repr=False, compare=False)
+    csv_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "key", SafetyManager._task_key(self.center.code, self.role.id))
+        object.__setattr__(self, "csv_name", f"raw_jobs_{self.center.code}_{self.role.id}.csv")
 
 
 class BatchExecutor:
@@ -114,7 +152,8 @@ class BatchExecutor:
     
     def __init__(self, config: Config, logger: MarketAnalysisLogger,
                  output_dir: str = ".", enable_safety: bool = True,
-                 max_retries: Optional[int] = None):
+                 max_retries: Optional[int] = None,
+                 durable_checkpoints: bool = False):
         """Initialize batch executor with anti-detection features.
 
         Args:
@@ -123,6 +162,7 @@ class BatchExecutor:
             output_dir: Output directory for monitoring files
             enable_safety: Enable anti-detection safety features
             max_retries: Max retry attempts per task (default: from config)
+            durable_checkpoints: fsync checkpoint writes (see SafetyManager)
         """
         self.config = config
         self.logger = logger
@@ -134,12 +174,13 @@ class BatchExecutor:
         if self.enable_safety:
             self.scheduler = SmartScheduler()
             self.monitor = SearchMonitor(output_dir)
-            self.safety = SafetyManager(output_dir)
+            self.safety = SafetyManager(output_dir, fsync=durable_checkpoints)
         else:
             self.scheduler = None
             self.monitor = None
             self.safety = None
         self.results: List[LocationResult] = []
+        self._columns: Optional[_ResultColumns] = None
         self._shutdown_event = threading.Event()
         self.shutdown_requested = False
     
@@ -333,7 +374,7 @@ class BatchExecutor:
             
             # Save raw data for debugging (if output_dir is set)
             if self.output_dir:
-                raw_file = os.path.join(self.output_dir, f"raw_jobs_{task.center.code}_{task.role.id}.csv")
+                raw_file = os.path.join(self.output_dir, task.csv_name)
                 df.to_csv(raw_file, index=False)
                 self.logger.debug(f"Saved raw job data to {raw_file}")
             
@@ -411,17 +452,17 @@ class BatchExecutor:
                 return result
 
             if attempt < self.max_retries:
-                delay = base_backoff * (2 ** (attempt - 1)) + random.uniform(0, 10)
+                delay = base_backoff * (1 << (attempt - 1)) + random.uniform(0, 10)
                 self.logger.warning(
                     f"Attempt {attempt}/{self.max_retries} failed for "
-                    f"{task.center.code}:{task.role.id} — "
+                    f"{task.key} — "
                     f"retrying in {delay:.0f}s: {result.error}"
                 )
                 time.sleep(delay)
 
         self.logger.error(
             f"All {self.max_retries} attempts exhausted for "
-            f"{task.center.code}:{task.role.id}: {last_result.error}"
+            f"{task.key}: {last_result.error}"
         )
         return last_result
 
@@ -431,10 +472,7 @@ class BatchExecutor:
             return
 
         if result.success:
-            csv_file = os.path.join(
-                self.output_dir,
-                f"raw_jobs_{task.center.code}_{task.role.id}.csv",
-            )
+            csv_file = os.path.join(self.output_dir, task.csv_name)
             self.safety.mark_task_complete(
                 task.center.code, task.role.id,
                 result.jobs_found, result.jobs_with_salary, csv_file,
@@ -453,6 +491,9 @@ class BatchExecutor:
     def execute_batch(self, tasks: List[RoleSearchTask]) -> List[LocationResult]:
         """Execute a batch of searches concurrently.
 
+        Results are processed in completion order, so a slow search does not
+        hold up checkpointing the ones that finish before it.
+
         Args:
             tasks: List of search tasks to execute
 
@@ -536,44 +577,45 @@ class BatchExecutor:
         """Reload results from a previous checkpoint's CSVs.
 
         Returns LocationResult objects for tasks that completed previously.
-        Tasks whose CSV is missing are silently skipped (they'll re-run).
+        Job counts come from the checkpoint entry; the CSV is only read for
+        the jobs themselves. Tasks whose CSV is missing are silently skipped
+        (they'll re-run).
         """
         reloaded: List[LocationResult] = []
         if not self.safety:
             return reloaded
 
         for task in all_tasks:
-            csv_path = self.safety.get_completed_task_csv(task.center.code, task.role.id)
-            if csv_path is None:
+            entry = self.safety.get_completed_task(task.center.code, task.role.id)
+            if entry is None or entry.get("csv_file") is None:
                 continue
+            csv_path = entry["csv_file"]
 
             full_path = os.path.join(self.output_dir, os.path.basename(csv_path))
             if not os.path.exists(full_path):
                 self.logger.warning(
-                    f"CSV missing for {task.center.code}:{task.role.id} "
+                    f"CSV missing for {task.key} "
                     f"({full_path}) — task will re-run"
                 )
                 # Remove stale entry so the task is re-executed
-                key = self.safety._task_key(task.center.code, task.role.id)
-                self.safety.progress["completed_tasks"].pop(key, None)
+                self.safety.progress["completed_tasks"].pop(task.key, None)
                 continue
 
             try:
-                df = pd.read_csv(full_path)
-                salary_mask = df['min_amount'].notna() | df['max_amount'].notna()
+                df = pd.read_csv(full_path, engine="c", dtype=_SALARY_DTYPES)
                 reloaded.append(LocationResult(
                     center=task.center,
                     role=task.role,
                     success=True,
                     jobs_df=df,
-                    jobs_found=len(df),
-                    jobs_with_salary=int(salary_mask.sum()),
+                    jobs_found=entry.get("jobs_found", 0),
+                    jobs_with_salary=entry.get("jobs_with_salary", 0),
                     market_name=task.market_name,
                     region_name=task.region_name,
                 ))
             except Exception as e:
                 self.logger.warning(
-                    f"Failed to reload CSV for {task.center.code}:{task.role.id}: {e}"
+                    f"Failed to reload CSV for {task.key}: {e}"
                 )
 
         return reloaded
@@ -625,8 +667,9 @@ class BatchExecutor:
 
         # Execute in batches (with shutdown support)
         batch_size = self.config.search.batch_size
+        stop_requested = self._shutdown_event.is_set
         for i in range(0, len(all_tasks), batch_size):
-            if self._shutdown_event.is_set():
+            if stop_requested():
                 self.logger.warning("Shutdown requested — stopping after current batch")
                 break
 
@@ -641,6 +684,9 @@ class BatchExecutor:
             if i + batch_size < len(all_tasks):
                 time.sleep(self.config.search.delay_between_batches)
 
+        if self.safety:
+            self.safety.flush()
+
         # Group results by market
         market_results: Dict[str, List[LocationResult]] = {}
         for result in self.results:
@@ -691,6 +737,9 @@ class BatchExecutor:
             if i + batch_size < len(tasks):
                 time.sleep(self.config.search.delay_between_batches)
 
+        if self.safety:
+            self.safety.flush()
+
         # Group results by market
         market_results: Dict[str, List[LocationResult]] = {}
         for result in self.results:
@@ -701,20 +750,66 @@ class BatchExecutor:
         
         return market_results
     
+    def _result_columns(self) -> _ResultColumns:
+        """Gather the fields the summary statistics need in a single pass.
+
+        The columns are cached until any entry of ``self.results`` is added,
+        removed or swapped for another object, so the summary helpers called
+        back-to-back share one walk over the results.
+        """
+        cached = self._columns
+        if (
+            cached is not None
+            and len(cached.source) == len(self.results)
+            and all(map(operator.is_, cached.source, self.results))
+        ):
+            return cached
+
+        durations: List[float] = []
+        success: List[bool] = []
+        jobs_found: List[int] = []
+        jobs_with_salary: List[int] = []
+        role_ids: List[str] = []
+        center_codes: Set[str] = set()
+        failures: List[Tuple[str, str]] = []
+        for r in self.results:
+            durations.append(np.nan if r.duration_seconds is None else r.duration_seconds)
+            success.append(r.success)
+            jobs_found.append(r.jobs_found)
+            jobs_with_salary.append(r.jobs_with_salary)
+            role_ids.append(r.role.id)
+            center_codes.add(r.center.code)
+            if not r.success:
+                failures.append((
+                    r.error or "Unknown error",
+                    r.error_category or ErrorCategory.UNKNOWN.value,
+                ))
+
+        self._columns = _ResultColumns(
+            source=tuple(self.results),
+            durations=np.array(durations, dtype=np.float64),
+            success=np.array(success, dtype=bool),
+            jobs_found=np.array(jobs_found, dtype=np.int64),
+            jobs_with_salary=np.array(jobs_with_salary, dtype=np.int64),
+            role_ids=np.array(role_ids, dtype=str),
+            center_codes=center_codes,
+            failures=failures,
+        )
+        return self._columns
+
     def get_summary_stats(self) -> Dict[str, int]:
         """Get summary statistics from all executed searches.
         
         Returns:
             Dictionary with summary statistics
         """
+        columns = self._result_columns()
         total_tasks = len(self.results)
-        successful_tasks = sum(1 for r in self.results if r.success)
-        total_jobs = sum(r.jobs_found for r in self.results)
-        jobs_with_salary = sum(r.jobs_with_salary for r in self.results)
+        successful_tasks = int(columns.success.sum())
         
         # Count unique locations and roles
-        unique_centers = len(set(r.center.code for r in self.results))
-        unique_roles = len(set(r.role.id for r in self.results))
+        unique_centers = len(columns.center_codes)
+        unique_roles = len(np.unique(columns.role_ids))
         
         return {
             'total_tasks': total_tasks,
@@ -722,8 +817,8 @@ class BatchExecutor:
             'total_locations': unique_centers,
             'successful_locations': unique_centers,  # For backward compat
             'total_roles': unique_roles,
-            'total_jobs': total_jobs,
-            'jobs_with_salary': jobs_with_salary,
+            'total_jobs': int(columns.jobs_found.sum()),
+            'jobs_with_salary': int(columns.jobs_with_salary.sum()),
             'success_rate': (successful_tasks / total_tasks * 100) if total_tasks > 0 else 0
         }
     
@@ -736,9 +831,11 @@ class BatchExecutor:
         Returns:
             Dictionary with role-specific statistics
         """
-        role_results = [r for r in self.results if r.role.id == role_id]
+        columns = self._result_columns()
+        mask = columns.role_ids == role_id
+        total = int(mask.sum())
         
-        if not role_results:
+        if not total:
             return {
                 'total_tasks': 0,
                 'successful_tasks': 0,
@@ -747,15 +844,14 @@ class BatchExecutor:
                 'success_rate': 0
             }
         
-        successful = sum(1 for r in role_results if r.success)
-        total = len(role_results)
+        successful = int(columns.success[mask].sum())
         
         return {
             'total_tasks': total,
             'successful_tasks': successful,
-            'total_jobs': sum(r.jobs_found for r in role_results),
-            'jobs_with_salary': sum(r.jobs_with_salary for r in role_results),
-            'success_rate': (successful / total * 100) if total > 0 else 0
+            'total_jobs': int(columns.jobs_found[mask].sum()),
+            'jobs_with_salary': int(columns.jobs_with_salary[mask].sum()),
+            'success_rate': successful / total * 100
         }
 
     # ── Observability helpers ────────────────────────────────────
@@ -767,15 +863,19 @@ class BatchExecutor:
             Dict with keys ``p50``, ``p95``, ``max``, ``count``.
             All values are ``0`` when no durations have been recorded.
         """
-        durations = [r.duration_seconds for r in self.results if r.duration_seconds is not None]
-        if not durations:
+        durations = self._result_columns().durations
+        durations = durations[~np.isnan(durations)]
+        n = durations.size
+        if not n:
             return {"p50": 0, "p95": 0, "max": 0, "count": 0}
-        durations.sort()
-        n = len(durations)
+        # Nearest-rank percentiles by index; partitioning selects them in O(n)
+        # without sorting the whole array.
+        i50, i95 = int(n * 0.50), min(int(n * 0.95), n - 1)
+        selected = np.partition(durations, (i50, i95, n - 1))
         return {
-            "p50": round(durations[int(n * 0.50)], 2),
-            "p95": round(durations[min(int(n * 0.95), n - 1)], 2),
-            "max": round(durations[-1], 2),
+            "p50": round(float(selected[i50]), 2),
+            "p95": round(float(selected[i95]), 2),
+            "max": round(float(selected[-1]), 2),
             "count": n,
         }
 
@@ -785,20 +885,14 @@ class BatchExecutor:
         Returns:
             Dict with ``total_failures``, ``by_category``, and ``top_errors``.
         """
-        failed = [r for r in self.results if not r.success]
+        failed = self._result_columns().failures
         if not failed:
             return {"total_failures": 0, "by_category": {}, "top_errors": []}
 
         # Count by category
-        by_category: Dict[str, int] = Counter()
-        error_counter: Counter[str] = Counter()
-        error_to_category: Dict[str, str] = {}
-        for r in failed:
-            cat = r.error_category or ErrorCategory.UNKNOWN.value
-            by_category[cat] += 1
-            msg = r.error or "Unknown error"
-            error_counter[msg] += 1
-            error_to_category[msg] = cat
+        by_category = Counter(cat for _, cat in failed)
+        error_counter = Counter(msg for msg, _ in failed)
+        error_to_category: Dict[str, str] = dict(failed)
 
         top_errors = [
             {"message": msg, "count": count, "category": error_to_category.get(msg, "unknown")}
@@ -817,8 +911,20 @@ class BatchExecutor:
         Returns:
             List of dicts with ``center``, ``role``, ``duration_seconds``, ``success``.
         """
-        timed = [r for r in self.results if r.duration_seconds is not None]
-        timed.sort(key=lambda r: r.duration_seconds, reverse=True)  # type: ignore[arg-type]
+        durations = self._result_columns().durations
+        timed = np.flatnonzero(~np.isnan(durations))
+        k = min(n, timed.size)
+        if k <= 0:
+            return []
+
+        # Select the k-th largest duration in O(n), then keep everything above
+        # it plus the earliest ties at it, so ties stay in result order.
+        values = durations[timed]
+        cutoff = np.partition(values, values.size - k)[values.size - k]
+        above = timed[values > cutoff]
+        top = np.concatenate((above, timed[values == cutoff][:k - above.size]))
+        top = top[np.argsort(-durations[top], kind="stable")]
+
         return [
             {
                 "center": r.center.code,
@@ -826,7 +932,7 @@ class BatchExecutor:
                 "duration_seconds": r.duration_seconds,
                 "success": r.success,
             }
-            for r in timed[:n]
+            for r in (self.results[i] for i in top)
         ]
 
 
@@ -8,7 +8,8 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from types import ModuleType
+from typing import Any, Dict, Optional
 
 # Exit codes
 EXIT_SUCCESS = 0       # All tasks completed successfully
@@ -16,8 +17,19 @@ EXIT_FAILURE = 1       # No tasks succeeded or config error
 EXIT_PARTIAL = 2       # Some tasks succeeded, some failed
 EXIT_INTERRUPTED = 130 # SIGTERM/SIGINT, progress checkpointed
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from jobx.market_analysis.batch_executor import BatchExecutor, ErrorCategory
-from jobx.market_analysis.config_loader import Config, load_config, validate_config
+from jobx.market_analysis.config_loader import (
+    Config,
+    load_config,
+    read_config_file,
+    validate_config,
+)
 from jobx.market_analysis.data_aggregator import DataAggregator
 from jobx.market_analysis.logger import setup_logger
 from jobx.market_analysis.report_generator import ReportGenerator
@@ -26,15 +38,31 @@ from jobx.market_analysis.visualization import CompensationBandVisualizer
 
 def _format_duration(seconds: float) -> str:
     """Format seconds into a human-readable string like '2h 27m 33s'."""
-    h, remainder = divmod(int(seconds), 3600)
-    m, s = divmod(remainder, 60)
-    parts = []
+    m, s = divmod(int(seconds), 60)
+    if not m:
+        return f"{s}s"
+    h, m = divmod(m, 60)
     if h:
-        parts.append(f"{h}h")
-    if m or h:
-        parts.append(f"{m}m")
-    parts.append(f"{s}s")
-    return " ".join(parts)
+        return f"{h}h {m}m {s}s"
+    return f"{m}m {s}s"
+
+
+def _dump_run_summary(summary: Dict[str, Any]) -> bytes:
+    """Serialize a run summary as indented UTF-8 JSON, with orjson when installed.
+
+    Both paths write non-ASCII text as raw UTF-8, so the file does not depend
+    on which encoder ran or on the locale's default encoding.
+    """
+    if orjson is not None:
+        try:
+            data: bytes = orjson.dumps(
+                summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+            return data
+        except TypeError:
+            # orjson is stricter than json (e.g. ints beyond 64 bits)
+            pass
+    return json.dumps(summary, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 def _generate_recommendation(
@@ -307,7 +335,8 @@ Examples:
     try:
         # Load configuration
         print(f"Loading configuration from: {args.config}")
-        config = load_config(args.config)
+        config_dict = read_config_file(args.config)
+        config = load_config(config_dict)
         
         # Validate configuration
         warnings = validate_config(config)
@@ -354,11 +383,6 @@ Examples:
             print("\nGenerating compensation band charts...")
             visualizer = CompensationBandVisualizer(output_dir)
             
-            # Load config as dict for visualization
-            import yaml
-            with open(args.config, 'r') as f:
-                config_dict = yaml.safe_load(f)
-            
             generated_charts = visualizer.generate_all_charts(config_dict, aggregated_markets)
             
             print(f"\nGenerated {len(generated_charts)} charts:")
@@ -409,6 +433,7 @@ Examples:
         executor = BatchExecutor(
             config, logger, output_dir=str(output_dir),
             enable_safety=enable_safety, max_retries=args.max_retries,
+            durable_checkpoints=True,
         )
 
         # Register signal handlers for graceful shutdown
@@ -451,11 +476,6 @@ Examples:
             print("\nGenerating compensation band charts...")
             visualizer = CompensationBandVisualizer(output_dir)
             
-            # Load config as dict for visualization
-            import yaml
-            with open(args.config, 'r') as f:
-                config_dict = yaml.safe_load(f)
-            
             generated_charts = visualizer.generate_all_charts(config_dict, aggregated_markets)
             generated_files.extend(generated_charts)
             
@@ -518,7 +538,7 @@ Examples:
             aggregated_markets=aggregated_markets,
         )
         summary_path = output_dir / "run_summary.json"
-        summary_path.write_text(json.dumps(run_summary, indent=2))
+        summary_path.write_bytes(_dump_run_summary(run_summary))
         logger.info(f"Run summary written to {summary_path}")
 
         # Print summary to console
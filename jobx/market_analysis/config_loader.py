@@ -5,13 +5,23 @@ market analysis tool, supporting role-based compensation bands across multiple
 geographic markets and centers.
 """
 
+import copy
 import warnings
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import AbstractSet, Any, Dict, List, Optional, TextIO, Union
 
-import yaml
+from jobx.market_analysis import _yaml
+
+
+# Title keywords excluded for BCBA roles that don't configure their own
+_BCBA_EXCLUDED_TITLE_KEYWORDS = (
+    'teacher', 'specialist', 'technician', 'tech',
+    'nurse', 'rn', 'therapist',
+)
 
 
 class PayType(str, Enum):
@@ -20,7 +30,7 @@ class PayType(str, Enum):
     SALARY = "salary"
 
 
-@dataclass
+@dataclass(slots=True)
 class Meta:
     """Configuration metadata."""
     version: int = 1
@@ -31,7 +41,7 @@ class Meta:
     })
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """Job role definition."""
     id: str
@@ -50,7 +60,7 @@ class Role:
             self.search_terms = [self.name]
 
 
-@dataclass
+@dataclass(slots=True)
 class Payband:
     """Compensation range for a specific role."""
     min: float
@@ -85,7 +95,7 @@ class Payband:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class Center:
     """Physical location/center definition."""
     code: str
@@ -123,7 +133,7 @@ class Center:
         return self.paybands.get(role_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     """Market with paybands and centers."""
     name: str
@@ -141,30 +151,37 @@ class Market:
         """
         return self.paybands.get(role_id)
     
-    def validate_paybands(self, roles: List[Role]) -> List[str]:
+    def validate_paybands(
+        self, roles: List[Role], role_ids: Optional[AbstractSet[str]] = None
+    ) -> List[str]:
         """Validate paybands match defined roles.
         
         Args:
             roles: List of defined roles
+            role_ids: IDs of ``roles``, when the caller already has them as a
+                set; built from ``roles`` otherwise
             
         Returns:
             List of validation warnings
         """
-        warnings = []
-        role_ids = {role.id for role in roles}
-        
-        for role_id in self.paybands:
-            if role_id not in role_ids:
-                warnings.append(f"Market '{self.name}' has payband for undefined role: {role_id}")
+        if role_ids is None:
+            role_ids = {role.id for role in roles}
         
-        for role in roles:
-            if role.id not in self.paybands:
-                warnings.append(f"Market '{self.name}' missing payband for role: {role.id}")
+        warnings = [
+            f"Market '{self.name}' has payband for undefined role: {role_id}"
+            for role_id in self.paybands
+            if role_id not in role_ids
+        ]
+        warnings.extend(
+            f"Market '{self.name}' missing payband for role: {role.id}"
+            for role in roles
+            if role.id not in self.paybands
+        )
         
         return warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class Region:
     """Geographic region containing markets."""
     name: str
@@ -179,7 +196,7 @@ class Region:
         return centers
 
 
-@dataclass
+@dataclass(slots=True)
 class SalaryFilterConfig:
     """Salary filtering and outlier detection parameters."""
     hourly_rate_threshold: float = 500.0
@@ -193,7 +210,7 @@ class SalaryFilterConfig:
     default_salary_max: float = 500000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchConfig:
     """Search configuration parameters."""
     radius_miles: int = 25
@@ -254,23 +271,20 @@ class Config:
             )
             self.search.batch_size = self.batch_size
     
-    @property
+    # The region/market/center tree is fixed once loaded, so the flattened
+    # views below are computed on first access and then reused.
+    
+    @cached_property
     def all_centers(self) -> List[Center]:
         """Get all centers across all regions and markets."""
-        centers = []
-        for region in self.regions:
-            centers.extend(region.all_centers)
-        return centers
+        return [center for market in self.all_markets for center in market.centers]
     
-    @property
+    @cached_property
     def all_markets(self) -> List[Market]:
         """Get all markets across all regions."""
-        markets = []
-        for region in self.regions:
-            markets.extend(region.markets)
-        return markets
+        return [market for region in self.regions for market in region.markets]
     
-    @property
+    @cached_property
     def total_locations(self) -> int:
         """Get total number of centers/locations."""
         return len(self.all_centers)
@@ -284,10 +298,15 @@ class Config:
         Returns:
             Role if exists, None otherwise
         """
+        return self._roles_by_id.get(role_id)
+    
+    @cached_property
+    def _roles_by_id(self) -> Dict[str, Role]:
+        """Index of roles by ID; the first role wins if an ID repeats."""
+        index: Dict[str, Role] = {}
         for role in self.roles:
-            if role.id == role_id:
-                return role
-        return None
+            index.setdefault(role.id, role)
+        return index
     
     def validate(self) -> List[str]:
         """Validate entire configuration.
@@ -330,19 +349,28 @@ class Config:
                 f"salary_min ({sf.salary_min}) >= salary_max ({sf.salary_max})"
             )
 
+        centers = self.all_centers
+        
         # Check for duplicate center codes
-        center_codes = [center.code for center in self.all_centers]
-        if len(center_codes) != len(set(center_codes)):
-            warnings.append("Duplicate center codes found in configuration")
+        code_counts = Counter(center.code for center in centers)
+        duplicate_codes = [code for code, count in code_counts.items() if count > 1]
+        if duplicate_codes:
+            warnings.append(
+                f"Duplicate center codes found in configuration: {', '.join(duplicate_codes)}"
+            )
         
         # Check for duplicate zip codes
-        zip_codes = [center.zip_code for center in self.all_centers]
-        if len(zip_codes) != len(set(zip_codes)):
-            warnings.append("Duplicate zip codes found in configuration")
+        zip_counts = Counter(center.zip_code for center in centers)
+        duplicate_zips = [zip_code for zip_code, count in zip_counts.items() if count > 1]
+        if duplicate_zips:
+            warnings.append(
+                f"Duplicate zip codes found in configuration: {', '.join(duplicate_zips)}"
+            )
         
         # Validate paybands
+        role_ids = self._roles_by_id.keys()
         for market in self.all_markets:
-            market_warnings = market.validate_paybands(self.roles)
+            market_warnings = market.validate_paybands(self.roles, role_ids)
             warnings.extend(market_warnings)
             
             for role_id, payband in market.paybands.items():
@@ -355,7 +383,7 @@ class Config:
 
 
 # Backward compatibility types
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Legacy location type for backward compatibility.
     
@@ -388,14 +416,47 @@ class Location:
         )
 
 
-def load_config(config_path: str) -> Config:
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; cached on path, modification time and size."""
+    with open(path, 'r') as f:
+        return _yaml.safe_load(f)
+
+
+def read_config_file(config_path: Union[str, Path]) -> Any:
+    """Read and parse a YAML configuration file.
+
+    Repeated reads of an unchanged file reuse the earlier parse. Callers get
+    their own deep copy, so mutating the result never affects the cache.
+
+    Args:
+        config_path: Path to YAML configuration file
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+    """
+    path = Path(config_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    st = path.stat()
+    data = _parse_config_file(str(path.resolve()), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(data)
+
+
+def load_config(config_path: Union[str, Path, TextIO, Dict[str, Any]]) -> Config:
     """Load configuration from YAML file.
     
     Supports both new schema (with roles and paybands) and legacy schema
     (with job_title) for backward compatibility.
     
     Args:
-        config_path: Path to YAML configuration file
+        config_path: Path to YAML configuration file, an open text stream of
+            YAML, or configuration data already parsed with
+            :func:`read_config_file`
         
     Returns:
         Config object with all settings and locations
@@ -404,12 +465,12 @@ def load_config(config_path: str) -> Config:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config file is invalid
     """
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(path, 'r') as f:
-        data = yaml.safe_load(f)
+    if isinstance(config_path, (str, Path)):
+        data = read_config_file(config_path)
+    elif hasattr(config_path, 'read'):
+        data = _yaml.safe_load(config_path)
+    else:
+        data = config_path
     
     if not data:
         raise ValueError("Configuration file is empty")
@@ -472,10 +533,7 @@ def _load_new_config(data: Dict[str, Any]) -> Config:
         if not role.excluded_title_keywords and (
             role.id == 'bcba' or 'bcba' in role.name.lower()
         ):
-            role.excluded_title_keywords = [
-                'teacher', 'specialist', 'technician', 'tech',
-                'nurse', 'rn', 'therapist',
-            ]
+            role.excluded_title_keywords = list(_BCBA_EXCLUDED_TITLE_KEYWORDS)
 
     # Parse search config
     search_data = data.get('search', {})
@@ -634,8 +692,8 @@ def _load_legacy_config(data: Dict[str, Any]) -> Config:
                 market = Market(name=region_data['name'])
                 
                 # Convert locations to centers
-                for loc_data in region_data.get('locations', []):
-                    center = Center(
+                market.centers = [
+                    Center(
                         code=f"{market.name}_{loc_data['name']}".replace(' ', '_'),
                         name=loc_data['name'],
                         address_1=loc_data['address'],
@@ -644,7 +702,8 @@ def _load_legacy_config(data: Dict[str, Any]) -> Config:
                         state=loc_data.get('state', ''),
                         zip_code=str(loc_data['zip_code'])
                     )
-                    market.centers.append(center)
+                    for loc_data in region_data.get('locations', [])
+                ]
                 
                 region.markets.append(market)
             
@@ -655,8 +714,8 @@ def _load_legacy_config(data: Dict[str, Any]) -> Config:
             market = Market(name=market_data['name'])
             
             # Convert locations to centers
-            for loc_data in market_data.get('locations', []):
-                center = Center(
+            market.centers = [
+                Center(
                     code=f"{market.name}_{loc_data['name']}".replace(' ', '_'),
                     name=loc_data['name'],
                     address_1=loc_data.get('address', ''),
@@ -665,7 +724,8 @@ def _load_legacy_config(data: Dict[str, Any]) -> Config:
                     state=loc_data.get('state', ''),
                     zip_code=str(loc_data['zip_code'])
                 )
-                market.centers.append(center)
+                for loc_data in market_data.get('locations', [])
+            ]
             
             region.markets.append(market)
             regions.append(region)
@@ -780,6 +840,6 @@ def migrate_config(old_config_path: str, new_config_path: str) -> None:
     
     # Save new format
     with open(new_config_path, 'w') as f:
-        yaml.dump(new_data, f, default_flow_style=False, sort_keys=False)
+        _yaml.safe_dump(new_data, f, default_flow_style=False, sort_keys=False)
     
     print(f"Configuration migrated successfully to: {new_config_path}")
\ No newline at end of file
@@ -92,10 +92,9 @@ class Country(Enum):
     def from_string(cls, country_str: str) -> Country:
         """Convert a string to the corresponding Country enum."""
         country_str = country_str.strip().lower()
-        for country in cls:
-            country_names = country.value[0].split(",")
-            if country_str in country_names:
-                return country
+        country = _COUNTRY_BY_NAME.get(country_str)
+        if country is not None:
+            return country
         valid_countries = [country.value for country in cls]
         valid_country_names = [country[0] for country in valid_countries]
         raise ValueError(
@@ -103,6 +102,12 @@ class Country(Enum):
         )
 
 
+# Built in reverse so a name shared by several countries maps to the first one
+_COUNTRY_BY_NAME: dict[str, Country] = {
+    name: country for country in reversed(Country) for name in country.value[0].split(",")
+}
+
+
 class Location(BaseModel):
     """Represents a job location with city, state, and country."""
     country: Union[Country, str, None] = None
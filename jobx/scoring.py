@@ -9,21 +9,51 @@ scoring to rank job postings by relevance.
 
 from __future__ import annotations
 
-from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Literal, overload
+
+import numpy as np
+from rapidfuzz.fuzz import ratio as _indel_ratio
 
 from jobx.model import JobPost
 
+DEFAULT_WEIGHTS: dict[str, float] = {
+    'title': 0.5,       # Title match is most important
+    'description': 0.3, # Description match is secondary
+    'location': 0.2     # Location match is tertiary
+}
 
-def normalize_text(text: str) -> str:
-    """Normalize text for comparison by lowercasing and removing extra whitespace."""
+
+def _normalize(text: str | None) -> str:
+    """Lowercase and collapse whitespace without caching, for long job text."""
     if not text:
         return ""
     # Remove extra whitespace and lowercase
     return " ".join(text.lower().split())
 
 
+@lru_cache(maxsize=16384)
+def normalize_text(text: str) -> str:
+    """Normalize text for comparison by lowercasing and removing extra whitespace.
+
+    Memoized, since scoring a batch normalizes the same query, title and
+    location several times. Descriptions go through the uncached
+    ``_normalize`` so the cache does not pin every description in memory.
+    """
+    return _normalize(text)
+
+
+@lru_cache(maxsize=1024)
+def _query_keywords(query: str) -> frozenset[str]:
+    """Return the distinct normalized keywords of a search query."""
+    return frozenset(normalize_text(query).split())
+
+
 def calculate_text_similarity(text1: str, text2: str) -> float:
-    """Calculate similarity between two text strings using SequenceMatcher.
+    """Calculate similarity between two text strings.
+
+    Uses rapidfuzz's InDel ratio, ``2 * M / T`` where ``M`` is the length of
+    the longest common subsequence and ``T`` the combined length.
 
     Returns a float between 0 and 1, where 1 is exact match.
     """
@@ -34,8 +64,7 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
     norm_text1 = normalize_text(text1)
     norm_text2 = normalize_text(text2)
 
-    # Use SequenceMatcher for similarity
-    return SequenceMatcher(None, norm_text1, norm_text2).ratio()
+    return _indel_ratio(norm_text1, norm_text2) / 100.0
 
 
 def calculate_keyword_match_score(query: str, text: str) -> float:
@@ -46,9 +75,13 @@ def calculate_keyword_match_score(query: str, text: str) -> float:
     if not query or not text:
         return 0.0
 
+    return _keyword_coverage(query, _normalize(text))
+
+
+def _keyword_coverage(query: str, text_normalized: str) -> float:
+    """Return the share of query keywords found in already-normalized text."""
     # Split query into keywords
-    query_keywords = set(normalize_text(query).split())
-    text_normalized = normalize_text(text)
+    query_keywords = _query_keywords(query)
 
     # Count how many query keywords appear in text
     matches = sum(1 for keyword in query_keywords if keyword in text_normalized)
@@ -57,6 +90,7 @@ def calculate_keyword_match_score(query: str, text: str) -> float:
     return matches / len(query_keywords) if query_keywords else 0.0
 
 
+@lru_cache(maxsize=8192)
 def calculate_title_score(query: str, job_title: str) -> float:
     """Calculate confidence score for job title match.
 
@@ -64,6 +98,9 @@ def calculate_title_score(query: str, job_title: str) -> float:
     - Direct similarity matching
     - Keyword matching
     - Partial phrase matching
+
+    Memoized per (query, title); it does not depend on the search location,
+    so a job seen again from another location is not rescored.
     """
     if not query or not job_title:
         return 0.0
@@ -89,20 +126,24 @@ def calculate_title_score(query: str, job_title: str) -> float:
     return min(score, 1.0)
 
 
+@lru_cache(maxsize=2048)
 def calculate_description_score(query: str, description: str | None) -> float:
     """Calculate confidence score for job description match.
 
     Focuses on keyword matching since descriptions are typically long.
+    Memoized per (query, description) like calculate_title_score.
     """
     if not query or not description:
         return 0.0
 
+    # Normalized once, outside the normalize_text cache
+    desc_norm = _normalize(description)
+
     # For descriptions, keyword matching is more relevant than full similarity
-    keyword_score = calculate_keyword_match_score(query, description)
+    keyword_score = _keyword_coverage(query, desc_norm)
 
     # Also check for exact phrase matches
     query_norm = normalize_text(query)
-    desc_norm = normalize_text(description)
 
     exact_phrase_bonus = 0.2 if query_norm in desc_norm else 0.0
 
@@ -174,11 +215,7 @@ def calculate_confidence_score(
     """
     # Default weights if not provided
     if weights is None:
-        weights = {
-            'title': 0.5,      # Title match is most important
-            'description': 0.3, # Description match is secondary
-            'location': 0.2    # Location match is tertiary
-        }
+        weights = DEFAULT_WEIGHTS
 
     scores = {}
 
@@ -203,25 +240,89 @@ def calculate_confidence_score(
     return max(0.0, min(1.0, total_score))
 
 
+@overload
 def score_jobs(
     jobs: list[JobPost],
     search_query: str,
     search_location: str | None = None,
-    weights: dict[str, float] | None = None
-) -> list[tuple[JobPost, float]]:
+    weights: dict[str, float] | None = None,
+    return_arrays: Literal[False] = False
+) -> list[tuple[JobPost, float]]: ...
+
+
+@overload
+def score_jobs(
+    jobs: list[JobPost],
+    search_query: str,
+    search_location: str | None = None,
+    weights: dict[str, float] | None = None,
+    *,
+    return_arrays: Literal[True]
+) -> tuple[np.ndarray, np.ndarray]: ...
+
+
+@overload
+def score_jobs(
+    jobs: list[JobPost],
+    search_query: str,
+    search_location: str | None = None,
+    weights: dict[str, float] | None = None,
+    return_arrays: bool = False
+) -> list[tuple[JobPost, float]] | tuple[np.ndarray, np.ndarray]: ...
+
+
+def score_jobs(
+    jobs: list[JobPost],
+    search_query: str,
+    search_location: str | None = None,
+    weights: dict[str, float] | None = None,
+    return_arrays: bool = False
+) -> list[tuple[JobPost, float]] | tuple[np.ndarray, np.ndarray]:
     """Score a list of jobs and return them with their confidence scores.
 
+    Component scores are collected into one array per component and combined
+    with a single weighted sum, giving the same scores as
+    calculate_confidence_score.
+
     Returns:
-        List of tuples containing (job, confidence_score), sorted by score descending
+        List of tuples containing (job, confidence_score), sorted by score descending.
+        With ``return_arrays=True``, a ``(jobs, scores)`` pair of parallel arrays
+        (object and float64 dtype) in the same order instead.
     """
-    scored_jobs = []
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
 
-    for job in jobs:
-        score = calculate_confidence_score(job, search_query, search_location, weights)
-        scored_jobs.append((job, score))
+    count = len(jobs)
+    title_scores = np.fromiter(
+        (calculate_title_score(search_query, job.title) for job in jobs),
+        dtype=np.float64, count=count,
+    )
+    description_scores = np.fromiter(
+        (calculate_description_score(search_query, job.description) for job in jobs),
+        dtype=np.float64, count=count,
+    )
+    location_scores = np.fromiter(
+        (
+            calculate_location_score(
+                search_location,
+                job.location.display_location() if job.location else None,
+                job.is_remote,
+            )
+            for job in jobs
+        ),
+        dtype=np.float64, count=count,
+    )
 
-    # Sort by score descending
-    scored_jobs.sort(key=lambda x: x[1], reverse=True)
+    scores = np.clip(
+        title_scores * weights.get('title', 0)
+        + description_scores * weights.get('description', 0)
+        + location_scores * weights.get('location', 0),
+        0.0, 1.0,
+    )
 
-    return scored_jobs
+    # Sort by score descending; stable so ties keep their input order
+    order = np.argsort(-scores, kind="stable")
+    if return_arrays:
+        return np.fromiter(jobs, dtype=object, count=count)[order], scores[order]
+    return [(jobs[i], score) for i, score in zip(order.tolist(), scores[order].tolist())]
 
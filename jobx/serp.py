@@ -8,8 +8,10 @@ for monitoring job posting positions and visibility metrics across job sites.
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Optional, Set, Union
 
 from bs4 import BeautifulSoup
@@ -76,6 +78,10 @@ class SerpParser(ABC):
         ...
 
 
+# Promoted/sponsored markers, matched anywhere in a card's text or classes
+_LINKEDIN_SPONSORED_RE = re.compile("promoted|sponsored|featured|ad")
+
+
 class LinkedInSerpParser(SerpParser):
     """SERP parser for LinkedIn job listings."""
 
@@ -92,17 +98,12 @@ class LinkedInSerpParser(SerpParser):
         items = []
         job_cards = soup.find_all("div", class_="base-search-card")
 
-        # Filter out non-organic widgets (e.g., "People also searched")
-        organic_cards = []
-        for card in job_cards:
-            if not isinstance(card, Tag):
+        # Skip non-organic widgets (e.g., "People also searched"); only
+        # actual job cards count towards the position on the page
+        index = 0
+        for job_card in job_cards:
+            if not isinstance(job_card, Tag):
                 continue
-            # Check if it's an actual job card
-            href_tag = card.find("a", class_="base-card__full-link")
-            if href_tag and hasattr(href_tag, 'attrs') and "href" in href_tag.attrs:
-                organic_cards.append(card)
-
-        for index, job_card in enumerate(organic_cards):
             href_tag = job_card.find("a", class_="base-card__full-link")
             if not href_tag or not hasattr(href_tag, 'attrs') or "href" not in href_tag.attrs:
                 continue
@@ -127,23 +128,16 @@ class LinkedInSerpParser(SerpParser):
                 is_sponsored=is_sponsored,
                 company_name=company_name
             ))
+            index += 1
 
         return items
 
     def detect_sponsored(self, element: Tag) -> Optional[bool]:
         """Detect sponsored LinkedIn postings."""
         # Look for promoted/sponsored indicators
-        sponsored_indicators = [
-            "promoted",
-            "sponsored",
-            "featured",
-            "ad"
-        ]
-
         element_text = element.get_text().lower() if element else ""
-        for indicator in sponsored_indicators:
-            if indicator in element_text:
-                return True
+        if _LINKEDIN_SPONSORED_RE.search(element_text):
+            return True
 
         # Check for specific sponsored classes (LinkedIn may use these)
         if element:
@@ -152,9 +146,8 @@ class LinkedInSerpParser(SerpParser):
                 class_str = " ".join(str(c) for c in classes).lower()
             else:
                 class_str = str(classes).lower()
-            for indicator in sponsored_indicators:
-                if indicator in class_str:
-                    return True
+            if _LINKEDIN_SPONSORED_RE.search(class_str):
+                return True
 
         return False
 
@@ -235,8 +228,14 @@ class IndeedSerpParser(SerpParser):
         return False
 
 
+_CLEANER = Cleaner()
+
+
+@lru_cache(maxsize=4096)
 def normalize_company_name(company_name: str) -> str:
     """Normalize company name for matching using tidyname library.
+
+    Results are memoized; the same employers recur across SERP pages.
     
     Args:
         company_name: Raw company name
@@ -249,8 +248,7 @@ def normalize_company_name(company_name: str) -> str:
 
     # Use tidyname to clean and normalize the company name
     # tidyname handles removal of legal suffixes, punctuation, and standardization
-    cleaner = Cleaner()
-    result = cleaner.clean(company_name)
+    result = _CLEANER.clean(company_name)
     normalized = result.cleaned
     
     # Convert to lowercase for case-insensitive matching
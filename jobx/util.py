@@ -14,13 +14,16 @@ import json
 import logging
 import os
 import re
-from collections.abc import Generator, Iterator
+from collections.abc import Callable, Generator, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import cycle
+from types import ModuleType
 from typing import Any
 
 import numpy as np
+import pandas as pd
 import pricetag
 import requests
 import tls_client
@@ -30,6 +33,19 @@ from requests.adapters import HTTPAdapter, Retry
 
 from jobx.model import CompensationInterval, JobType, Site
 
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional speedup
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Salary processing constants
@@ -42,8 +58,33 @@ MONTHLY_THRESHOLD = 30000
 MIN_SALARY_LIMIT = 1000
 MAX_SALARY_LIMIT = 700000
 
+# Keywords that mark a job as remote, matched case-insensitively
+_REMOTE_RE = re.compile(r"remote|work from home|wfh", re.IGNORECASE)
+
+# Loggers handed out by create_logger, keyed by name suffix
+_LOGGERS: dict[str, logging.Logger] = {}
+
+# Multipliers that convert a per-interval amount to an annual amount
+_ANNUAL_MULT = {
+    CompensationInterval.HOURLY.value: HOURS_PER_YEAR,
+    CompensationInterval.DAILY.value: DAYS_PER_YEAR,
+    CompensationInterval.WEEKLY.value: WEEKS_PER_YEAR,
+    CompensationInterval.MONTHLY.value: MONTHS_PER_YEAR,
+    CompensationInterval.YEARLY.value: 1,
+}
+
+# Map pricetag's period types onto CompensationInterval values
+_PRICETAG_INTERVALS = {
+    "hourly": CompensationInterval.HOURLY.value,
+    "daily": CompensationInterval.DAILY.value,
+    "weekly": CompensationInterval.WEEKLY.value,
+    "monthly": CompensationInterval.MONTHLY.value,
+    "yearly": CompensationInterval.YEARLY.value,
+    "annual": CompensationInterval.YEARLY.value,
+}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogConfig:
     """Configuration for logging setup."""
 
@@ -52,8 +93,13 @@ class LogConfig:
     include_context: bool = True
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> LogConfig:
-        """Create LogConfig from environment variables."""
+        """Create LogConfig from environment variables.
+
+        The result is cached since the environment is read once at startup;
+        call ``LogConfig.from_env.cache_clear()`` after changing it.
+        """
         return cls(
             use_json=os.getenv("JOBX_LOG_JSON", "false").lower() == "true",
             level=os.getenv("JOBX_LOG_LEVEL", "INFO").upper(),
@@ -84,6 +130,13 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
+        if orjson is not None:
+            try:
+                encoded: bytes = orjson.dumps(log_data)
+                return encoded.decode()
+            except TypeError:
+                # orjson is stricter than json (e.g. ints beyond 64 bits)
+                pass
         return json.dumps(log_data)
 
 
@@ -97,6 +150,10 @@ def create_logger(name: str, use_json: bool | None = None) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    cached = _LOGGERS.get(name)
+    if cached is not None:
+        return cached
+
     logger = logging.getLogger(f"JobX:{name}")
     logger.propagate = False
 
@@ -106,7 +163,7 @@ def create_logger(name: str, use_json: bool | None = None) -> logging.Logger:
 
         # Determine format based on parameter or environment
         if use_json is None:
-            use_json = os.getenv("JOBX_LOG_JSON", "false").lower() == "true"
+            use_json = LogConfig.from_env().use_json
 
         formatter: logging.Formatter
         if use_json:
@@ -119,6 +176,7 @@ def create_logger(name: str, use_json: bool | None = None) -> logging.Logger:
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
+    _LOGGERS[name] = logger
     return logger
 
 
@@ -400,9 +458,8 @@ def set_logger_level(verbose: int | None) -> None:
     level_name = {2: "INFO", 1: "WARNING", 0: "ERROR"}.get(verbose, "INFO")
     level = getattr(logging, level_name.upper(), None)
     if level is not None:
-        for logger_name in logging.root.manager.loggerDict:
-            if logger_name.startswith("JobX:"):
-                logging.getLogger(logger_name).setLevel(level)
+        for logger in _LOGGERS.values():
+            logger.setLevel(level)
 
         # Also set the base JobX logger level if it exists
         base_logger = logging.getLogger("JobX")
@@ -413,19 +470,32 @@ def set_logger_level(verbose: int | None) -> None:
 
 
 def markdown_converter(description_html: str | None) -> str | None:
-    """Convert HTML description to markdown format."""
+    """Convert HTML description to markdown format.
+
+    Descriptions without markup or entities are returned as-is (stripped),
+    keeping their original line breaks.
+    """
     if description_html is None:
         return None
-    markdown = md(description_html)
-    return str(markdown).strip()
+    if "<" not in description_html and "&" not in description_html:
+        return description_html.strip()
+    return str(md(description_html)).strip()
+
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 
 
 def extract_emails_from_text(text: str) -> list[str] | None:
     """Extract email addresses from text using regex."""
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return _EMAIL_RE.findall(text)
+
+
+# Built in reverse so an alias shared by several job types maps to the first one
+_JOB_TYPE_BY_ALIAS: dict[str, JobType] = {
+    alias: job_type for job_type in reversed(JobType) for alias in job_type.value
+}
 
 
 def parse_job_type_enum(job_type_str: str | None) -> JobType | None:
@@ -437,10 +507,7 @@ def parse_job_type_enum(job_type_str: str | None) -> JobType | None:
         return None
 
     job_type_str = job_type_str.lower().replace("-", "").replace(" ", "")
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return job_type
-    return None
+    return _JOB_TYPE_BY_ALIAS.get(job_type_str)
 
 
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
@@ -451,17 +518,22 @@ def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     return parse_job_type_enum(job_type_str)
 
 
+_NON_NUMERIC_RE = re.compile("[^-0-9.,]")
+_THOUSANDS_SEPARATORS = str.maketrans("", "", ".,")
+
+
 def currency_parser(cur_str: str) -> float:
     """Parse currency string to float value."""
     # Remove any non-numerical characters
     # except for ',' '.' or '-' (e.g. EUR)
-    cur_str = re.sub("[^-0-9.,]", "", cur_str)
+    cur_str = _NON_NUMERIC_RE.sub("", cur_str)
     # Remove any 000s separators (either , or .)
-    cur_str = re.sub("[.,]", "", cur_str[:-3]) + cur_str[-3:]
+    tail = cur_str[-3:]
+    cur_str = cur_str[:-3].translate(_THOUSANDS_SEPARATORS) + tail
 
-    if "." in list(cur_str[-3:]):
+    if "." in tail:
         num = float(cur_str)
-    elif "," in list(cur_str[-3:]):
+    elif "," in tail:
         num = float(cur_str.replace(",", "."))
     else:
         num = float(cur_str)
@@ -471,149 +543,133 @@ def currency_parser(cur_str: str) -> float:
 
 def remove_attributes(tag: Any) -> Any:
     """Remove all attributes from a BeautifulSoup tag."""
-    for attr in list(tag.attrs):
-        del tag[attr]
+    try:
+        tag.attrs.clear()
+    except AttributeError:
+        tag.attrs = {}
     return tag
 
 
-def extract_salary(
-    salary_str: str | None,
-    lower_limit: float = MIN_SALARY_LIMIT,
-    upper_limit: float = MAX_SALARY_LIMIT,
-    hourly_threshold: float = HOURLY_THRESHOLD,
-    monthly_threshold: float = MONTHLY_THRESHOLD,
-    enforce_annual_salary: bool = False,
-) -> tuple[str | None, float | None, float | None, str | None]:
-    """Extract salary information from a string using pricetag library.
+@lru_cache(maxsize=16)
+def _get_price_extractor(
+    lower_limit: float, upper_limit: float, hours_per_year: int
+) -> pricetag.PriceExtractor:
+    """Return a shared pricetag extractor for the given limits.
 
-    Returns the salary interval, min and max salary values, and currency.
+    Extractors hold no per-call state, so one instance per configuration is
+    reused across calls instead of being rebuilt for every salary string.
     """
-    if not salary_str:
-        return None, None, None, None
-
-    # Create pricetag extractor with configuration
-    extractor = pricetag.PriceExtractor(
+    return pricetag.PriceExtractor(
         normalize_to_annual=False,  # We'll handle normalization ourselves
         min_salary=lower_limit,
         max_salary=upper_limit,
-        assume_hours_per_year=HOURS_PER_YEAR,
+        assume_hours_per_year=hours_per_year,
     )
 
-    # Extract price information
-    results = extractor.extract(salary_str)
 
-    if not results:
-        return None, None, None, None
+@lru_cache(maxsize=32)
+def _make_extract_salary(
+    enforce_annual_salary: bool,
+    lower_limit: float,
+    upper_limit: float,
+    hourly_threshold: float,
+    monthly_threshold: float,
+) -> Callable[[str], tuple[str | None, float | None, float | None, str | None]]:
+    """Build an extract_salary implementation specialized for fixed settings.
 
-    # Get the first extracted price
-    result = results[0]
+    A scrape uses the same limits and thresholds for every job, so they are
+    bound once as closure locals along with the pricetag extractor.
+    """
+    extractor = _get_price_extractor(lower_limit, upper_limit, HOURS_PER_YEAR)
+    extract = extractor.extract
+    intervals = _PRICETAG_INTERVALS
+    annual_mult = _ANNUAL_MULT
+    hourly = CompensationInterval.HOURLY.value
+    monthly = CompensationInterval.MONTHLY.value
+    yearly = CompensationInterval.YEARLY.value
+    no_salary = (None, None, None, None)
+
+    def _extract(salary_str: str) -> tuple[str | None, float | None, float | None, str | None]:
+        # Extract price information
+        results = extract(salary_str)
+        if not results:
+            return no_salary
+
+        # Get the first extracted price
+        result = results[0]
+
+        # Extract values from pricetag result
+        value = result['value']
+        if isinstance(value, tuple):
+            min_salary, max_salary = value[0], value[1]
+        else:
+            min_salary = max_salary = value
 
-    # Extract values from pricetag result
-    if isinstance(result['value'], tuple):
-        min_salary = result['value'][0]
-        max_salary = result['value'][1]
-    else:
-        min_salary = result['value']
-        max_salary = result['value']
-
-    currency = result.get('currency', 'USD')
-
-    # Determine interval based on type from pricetag
-    type_mapping = {
-        "hourly": CompensationInterval.HOURLY.value,
-        "daily": CompensationInterval.DAILY.value,
-        "weekly": CompensationInterval.WEEKLY.value,
-        "monthly": CompensationInterval.MONTHLY.value,
-        "yearly": CompensationInterval.YEARLY.value,
-        "annual": CompensationInterval.YEARLY.value,
-    }
-
-    # Get interval from pricetag type
-    interval = type_mapping.get(result.get('type', ''), None)
-
-    if not interval:
-        # Fall back to threshold-based detection
-        if min_salary is not None:
+        # Check for None values before calculations
+        if min_salary is None or max_salary is None:
+            return no_salary
+
+        currency = result.get('currency', 'USD')
+
+        # Get interval from pricetag type, falling back to threshold-based detection
+        interval = intervals.get(result.get('type', ''))
+        if not interval:
             if min_salary < hourly_threshold:
-                interval = CompensationInterval.HOURLY.value
+                interval = hourly
             elif min_salary < monthly_threshold:
-                interval = CompensationInterval.MONTHLY.value
+                interval = monthly
             else:
-                interval = CompensationInterval.YEARLY.value
-        else:
-            # Default to yearly if no salary to check
-            interval = CompensationInterval.YEARLY.value
+                interval = yearly
 
-    # Convert to annual if requested
-    if enforce_annual_salary:
-        # Check for None values before calculations
-        if min_salary is None or max_salary is None:
-            return None, None, None, None
-            
-        annual_min_salary = min_salary
-        annual_max_salary = max_salary
-
-        if interval == CompensationInterval.HOURLY.value:
-            annual_min_salary = min_salary * HOURS_PER_YEAR
-            annual_max_salary = max_salary * HOURS_PER_YEAR
-        elif interval == CompensationInterval.DAILY.value:
-            annual_min_salary = min_salary * DAYS_PER_YEAR
-            annual_max_salary = max_salary * DAYS_PER_YEAR
-        elif interval == CompensationInterval.WEEKLY.value:
-            annual_min_salary = min_salary * WEEKS_PER_YEAR
-            annual_max_salary = max_salary * WEEKS_PER_YEAR
-        elif interval == CompensationInterval.MONTHLY.value:
-            annual_min_salary = min_salary * MONTHS_PER_YEAR
-            annual_max_salary = max_salary * MONTHS_PER_YEAR
-
-        # Validate against limits
-        if (
+        # Validate against limits using annualized values
+        mult = annual_mult.get(interval, 1)
+        annual_min_salary = min_salary * mult
+        annual_max_salary = max_salary * mult
+        if not (
             lower_limit <= annual_min_salary <= upper_limit
             and lower_limit <= annual_max_salary <= upper_limit
             and annual_min_salary <= annual_max_salary
         ):
+            return no_salary
+
+        if enforce_annual_salary:
             return interval, annual_min_salary, annual_max_salary, currency
-        else:
-            return None, None, None, None
-    else:
-        # Check for None values before calculations
-        if min_salary is None or max_salary is None:
-            return None, None, None, None
-            
-        # Validate against limits (check annualized values)
-        check_min = min_salary
-        check_max = max_salary
-
-        if interval == CompensationInterval.HOURLY.value:
-            check_min = min_salary * HOURS_PER_YEAR
-            check_max = max_salary * HOURS_PER_YEAR
-        elif interval == CompensationInterval.DAILY.value:
-            check_min = min_salary * DAYS_PER_YEAR
-            check_max = max_salary * DAYS_PER_YEAR
-        elif interval == CompensationInterval.WEEKLY.value:
-            check_min = min_salary * WEEKS_PER_YEAR
-            check_max = max_salary * WEEKS_PER_YEAR
-        elif interval == CompensationInterval.MONTHLY.value:
-            check_min = min_salary * MONTHS_PER_YEAR
-            check_max = max_salary * MONTHS_PER_YEAR
-
-        if (
-            lower_limit <= check_min <= upper_limit
-            and lower_limit <= check_max <= upper_limit
-            and check_min <= check_max
-        ):
-            return interval, min_salary, max_salary, currency
-        else:
-            return None, None, None, None
+        return interval, min_salary, max_salary, currency
 
+    return _extract
 
 
+@lru_cache(maxsize=2048)
+def extract_salary(
+    salary_str: str | None,
+    lower_limit: float = MIN_SALARY_LIMIT,
+    upper_limit: float = MAX_SALARY_LIMIT,
+    hourly_threshold: float = HOURLY_THRESHOLD,
+    monthly_threshold: float = MONTHLY_THRESHOLD,
+    enforce_annual_salary: bool = False,
+) -> tuple[str | None, float | None, float | None, str | None]:
+    """Extract salary information from a string using pricetag library.
+
+    Returns the salary interval, min and max salary values, and currency.
+    Results are memoized, since cross-posted jobs repeat the same description.
+    """
+    if not salary_str:
+        return None, None, None, None
+
+    return _make_extract_salary(
+        enforce_annual_salary, lower_limit, upper_limit, hourly_threshold, monthly_threshold
+    )(salary_str)
+
 
 def is_remote_job(title: str = "", description: str = "", location: str = "") -> bool:
     """Detects if a job is remote based on title, description, and location."""
-    remote_keywords = ["remote", "work from home", "wfh"]
-    combined_text = f"{title} {description} {location}".lower()
-    return any(keyword in combined_text for keyword in remote_keywords)
+    # Check the short fields first; the description is usually the longest
+    search = _REMOTE_RE.search
+    return bool(
+        (title and search(title))
+        or (location and search(location))
+        or (description and search(description))
+    )
 
 
 def map_str_to_site(site_name: str) -> Site:
@@ -646,6 +702,27 @@ def convert_to_annual(job_data: dict[str, Any]) -> None:
     job_data["interval"] = "yearly"
 
 
+def convert_to_annual_df(df: pd.DataFrame, mask: np.ndarray | pd.Series | None = None) -> None:
+    """Convert salary columns of a jobs DataFrame to annual amounts in place.
+
+    Vectorized counterpart of :func:`convert_to_annual`.
+
+    Args:
+        df: DataFrame with ``interval``, ``min_amount`` and ``max_amount`` columns
+        mask: Optional boolean row mask; only these rows are converted
+    """
+    mult = df["interval"].map(_ANNUAL_MULT).fillna(1).to_numpy(dtype=float)
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        mult = np.where(mask, mult, 1.0)
+    for column in ("min_amount", "max_amount"):
+        df[column] = df[column].to_numpy(dtype=float) * mult
+    if mask is None:
+        df["interval"] = CompensationInterval.YEARLY.value
+    else:
+        df.loc[mask, "interval"] = CompensationInterval.YEARLY.value
+
+
 desired_order = [
     "uuid",
     "site",
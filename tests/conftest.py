@@ -12,14 +12,16 @@ from unittest.mock import Mock
 import pytest
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def setup_test_logging() -> Generator[None, None, None]:
-    """Set up logging for tests."""
+    """Set up logging for the test session."""
     # Disable logging during tests unless specifically enabled
-    if not os.getenv("JOBX_TEST_LOGGING"):
+    disabled = not os.getenv("JOBX_TEST_LOGGING")
+    if disabled:
         logging.disable(logging.CRITICAL)
     yield
-    logging.disable(logging.NOTSET)
+    if disabled:
+        logging.disable(logging.NOTSET)
 
 
 @pytest.fixture
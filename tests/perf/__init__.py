@@ -0,0 +1,5 @@
+# Copyright (c) 2025 Michelle Pellon. MIT License..
+
+"""
+Micro-benchmarks for jobx hot paths.
+"""
@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Michelle Pellon. MIT License..
+
+"""
+Micro-benchmarks for salary parsing and description conversion helpers.
+
+These tests are marked as perf tests and can be skipped with:
+pytest -m "not perf"
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from jobx.util import currency_parser, extract_salary, markdown_converter
+
+pytestmark = pytest.mark.perf
+
+
+def test_bench_currency_parser(benchmark):
+    """Benchmark parsing a formatted amount."""
+    assert benchmark(currency_parser, "$75,500.50") == 75500.50
+
+
+def test_bench_extract_salary(benchmark):
+    """Benchmark the uncached salary parse; repeated calls would only hit the cache."""
+    result = benchmark(extract_salary.__wrapped__, "Salary: $80,000 - $120,000 per year")
+    assert result == ("yearly", 80000, 120000, "USD")
+
+
+_LINKEDIN_DESCRIPTION = (
+    "<div class=\"show-more-less-html__markup\"><strong>About the role</strong><br><br>"
+    + "<p>Acme is hiring a <em>Senior Data Engineer</em> to build pipelines in Python &amp; SQL.</p>"
+    "<ul><li>Design ETL for snake_case schemas</li><li>Review <a href=\"https://acme.example\">PRs</a></li></ul>" * 40
+    + "</div>"
+)
+
+
+def test_bench_markdown_converter(benchmark):
+    """Benchmark converting a long LinkedIn-style description."""
+    result = benchmark(markdown_converter, _LINKEDIN_DESCRIPTION)
+    assert result.startswith("**About the role**")
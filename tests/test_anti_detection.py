@@ -2,7 +2,6 @@
 
 """Tests for anti-detection and anti-scraping measures."""
 
-import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -62,6 +61,7 @@ class TestUserAgentRotator:
         for _ in range(5):
             rotator.get_random_user_agent()
         assert len(rotator._used_agents) <= rotator._max_history
+        assert rotator._used_set == set(rotator._used_agents)
     
     def test_generate_browser_profile(self):
         """Test complete browser profile generation."""
@@ -163,6 +163,19 @@ class TestCaptchaDetector:
         assert detected is False
         assert captcha_type is None
     
+    def test_indicator_priority(self):
+        """Test earlier CAPTCHA types win regardless of position in the page."""
+        html = '<script src="https://challenges.cloudflare.com/x.js"></script><div class="g-recaptcha"></div>'
+        assert CaptchaDetector.detect_captcha(html) == (True, "recaptcha")
+    
+    def test_detect_structural_captcha(self):
+        """Test form and iframe CAPTCHAs are still found by parsing."""
+        html = '<form id="loginCaptchaForm"></form>'
+        assert CaptchaDetector.detect_captcha(html) == (True, "form_captcha")
+        
+        html = '<iframe src="https://example.com/captcha/frame"></iframe>'
+        assert CaptchaDetector.detect_captcha(html) == (True, "iframe_captcha")
+    
     def test_detect_rate_limit(self):
         """Test rate limit detection."""
         # HTTP 429
@@ -250,6 +263,28 @@ class TestIntelligentDelayManager:
         assert manager.consecutive_fast_responses == 0
         assert manager.backoff_multiplier == 1.0
         assert len(manager.recent_response_times) == 0
+    
+    def test_mean_response_time_window(self):
+        """Test only the last RESPONSE_WINDOW response times are kept."""
+        manager = IntelligentDelayManager()
+        
+        for response_time in range(1, 16):
+            manager.calculate_delay(float(response_time))
+        
+        assert list(manager.recent_response_times) == [float(t) for t in range(6, 16)]
+
+
+class FakeClock:
+    """Manually advanced clock for ProxyRotator tests."""
+    
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += seconds
 
 
 class TestProxyRotator:
@@ -261,17 +296,30 @@ class TestProxyRotator:
         rotator = ProxyRotator(proxies)
         
         assert len(rotator.proxies) == 3
-        assert len(rotator.proxy_health) == 3
+        health = rotator.health_snapshot()
+        assert len(health) == 3
         
         for proxy in proxies:
-            assert proxy in rotator.proxy_health
-            assert rotator.proxy_health[proxy]["failures"] == 0
-            assert rotator.proxy_health[proxy]["blacklisted"] is False
+            assert proxy in health
+            assert health[proxy]["failures"] == 0
+            assert health[proxy]["blacklisted"] is False
+        assert rotator.get_proxy_health("unknown:8080") is None
+    
+    def test_duplicate_proxies_share_health(self):
+        """Test duplicate proxies are collapsed so failures are not split."""
+        rotator = ProxyRotator(["proxy1:8080", "proxy2:8080", "proxy1:8080"])
+        
+        assert rotator.proxies == ["proxy1:8080", "proxy2:8080"]
+        for _ in range(5):
+            rotator.mark_failure("proxy1:8080")
+        assert rotator.get_proxy_health("proxy1:8080")["blacklisted"] is True
+        assert rotator.get_next_proxy() == "proxy2:8080"
     
     def test_get_next_proxy(self):
         """Test getting next proxy in rotation."""
         proxies = ["proxy1:8080", "proxy2:8080", "proxy3:8080"]
-        rotator = ProxyRotator(proxies)
+        clock = FakeClock()
+        rotator = ProxyRotator(proxies, time_fn=clock)
         
         # Should rotate through all proxies
         used_proxies = []
@@ -279,30 +327,32 @@ class TestProxyRotator:
             proxy = rotator.get_next_proxy()
             assert proxy is not None
             used_proxies.append(proxy)
-            time.sleep(1.1)  # Avoid rate limiting
+            clock.advance(1.1)  # Avoid rate limiting
         
         assert set(used_proxies) == set(proxies)
     
     def test_blacklisting(self):
         """Test proxy blacklisting after failures."""
         proxies = ["proxy1:8080", "proxy2:8080"]
-        rotator = ProxyRotator(proxies)
+        clock = FakeClock()
+        rotator = ProxyRotator(proxies, time_fn=clock)
         
         # Mark many failures for proxy1
         for _ in range(5):
             rotator.mark_failure("proxy1:8080")
         
-        assert rotator.proxy_health["proxy1:8080"]["blacklisted"] is True
+        assert rotator.get_proxy_health("proxy1:8080")["blacklisted"] is True
         
         # Should only return proxy2 now
-        time.sleep(1.1)
+        clock.advance(1.1)
         proxy = rotator.get_next_proxy()
         assert proxy == "proxy2:8080"
     
     def test_cooldown_period(self):
         """Test cooldown after failure."""
         proxies = ["proxy1:8080", "proxy2:8080"]
-        rotator = ProxyRotator(proxies)
+        clock = FakeClock()
+        rotator = ProxyRotator(proxies, time_fn=clock)
         
         # Mark failure for proxy1
         rotator.mark_failure("proxy1:8080")
@@ -313,7 +363,7 @@ class TestProxyRotator:
             proxy = rotator.get_next_proxy()
             if proxy:
                 proxies_returned.append(proxy)
-            time.sleep(0.1)
+            clock.advance(0.1)
         
         # Should mostly return proxy2 during cooldown
         assert proxies_returned.count("proxy2:8080") > proxies_returned.count("proxy1:8080")
@@ -323,12 +373,37 @@ class TestProxyRotator:
         proxies = ["proxy1:8080"]
         rotator = ProxyRotator(proxies)
         
-        rotator.proxy_health["proxy1:8080"]["failures"] = 3
+        rotator.failures[0] = 3
         rotator.mark_success("proxy1:8080", 1.5)
         
-        assert rotator.proxy_health["proxy1:8080"]["failures"] == 2
-        assert rotator.proxy_health["proxy1:8080"]["successes"] == 1
-        assert 1.5 in rotator.proxy_health["proxy1:8080"]["response_times"]
+        health = rotator.get_proxy_health("proxy1:8080")
+        assert health["failures"] == 2
+        assert health["successes"] == 1
+        assert 1.5 in health["response_times"]
+    
+    def test_rotation_wraps_past_unhealthy(self):
+        """Test rotation skips blacklisted proxies and wraps to the start."""
+        proxies = ["proxy1:8080", "proxy2:8080", "proxy3:8080"]
+        rotator = ProxyRotator(proxies)
+        rotator.blacklisted[2] = True
+        rotator.current_index = 2
+        
+        assert rotator.get_next_proxy() == "proxy1:8080"
+        assert rotator.current_index == 1
+        assert rotator.get_next_proxy() == "proxy2:8080"
+        # Both remaining proxies were just used
+        assert rotator.get_next_proxy() is None
+    
+    def test_cooldown_expires(self):
+        """Test a failed proxy returns to rotation once its cooldown passes."""
+        clock = FakeClock()
+        rotator = ProxyRotator(["proxy1:8080"], time_fn=clock)
+        
+        rotator.mark_failure("proxy1:8080")
+        assert rotator.get_next_proxy() is None
+        
+        clock.advance(30)
+        assert rotator.get_next_proxy() == "proxy1:8080"
     
     def test_get_proxy_stats(self):
         """Test getting proxy statistics."""
@@ -1,11 +1,18 @@
 """Tests for the configuration loader with role-based paybands."""
 
-import tempfile
-from pathlib import Path
+import copy
+import dataclasses
+import io
+import json
 
 import pytest
-import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from jobx.market_analysis import _yaml
 from jobx.market_analysis.config_loader import (
     Center,
     Config,
@@ -20,10 +27,251 @@ from jobx.market_analysis.config_loader import (
     SearchConfig,
     load_config,
     migrate_config,
+    read_config_file,
     validate_config,
 )
 
 
+# Minimal valid new-format config; copy before mutating
+_BASE_CONFIG_TEMPLATE = {
+    "roles": [
+        {
+            "id": "rbt",
+            "name": "RBT",
+            "pay_type": "hourly",
+            "default_unit": "USD/hour",
+        }
+    ],
+    "search": {"radius_miles": 25},
+    "regions": [
+        {
+            "name": "Central",
+            "markets": [
+                {
+                    "name": "Texas",
+                    "paybands": {
+                        "rbt": {"min": 15, "max": 22, "pay_type": "hourly"}
+                    },
+                    "centers": [
+                        {
+                            "code": "HOU",
+                            "name": "Houston",
+                            "address_1": "123 Main",
+                            "city": "Houston",
+                            "state": "TX",
+                            "zip_code": "77001",
+                        }
+                    ],
+                }
+            ],
+        }
+    ],
+}
+
+
+def _dumps(data) -> str:
+    """Serialize config data as JSON text, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+# Prototypes for tests that only care about one or two fields
+_PROTO_CENTER = Center(
+    code="X", name="X", address_1="X", city="X", state="X", zip_code="00000"
+)
+_SALARY_ROLE = Role(id="r", name="R", pay_type="salary", default_unit="USD/year")
+
+
+def _center(**changes) -> Center:
+    """Copy the prototype center with ``changes`` and a fresh paybands dict."""
+    return dataclasses.replace(_PROTO_CENTER, paybands={}, **changes)
+
+
+# The fixtures below are serialized as JSON: JSON is valid YAML and either
+# JSON encoder is much cheaper than a YAML dump.
+
+# New-format config with one role, market and center
+_NEW_FORMAT_YAML = _dumps({
+    "meta": {
+        "version": 1,
+        "currency_default": "USD",
+        "unit_defaults": {
+            "hourly": "USD/hour",
+            "salary": "USD/year"
+        }
+    },
+    "roles": [
+        {
+            "id": "rbt",
+            "name": "RBT",
+            "pay_type": "hourly",
+            "default_unit": "USD/hour"
+        }
+    ],
+    "search": {
+        "radius_miles": 25,
+        "results_per_location": 200,
+        "batch_size": 5
+    },
+    "regions": [
+        {
+            "name": "Central",
+            "markets": [
+                {
+                    "name": "Texas",
+                    "paybands": {
+                        "rbt": {
+                            "min": 15,
+                            "max": 22.50,
+                            "currency": "USD",
+                            "unit": "USD/hour",
+                            "pay_type": "hourly"
+                        }
+                    },
+                    "centers": [
+                        {
+                            "code": "HOU-001",
+                            "name": "Houston Center",
+                            "address_1": "123 Main St",
+                            "city": "Houston",
+                            "state": "TX",
+                            "zip_code": "77001"
+                        }
+                    ]
+                }
+            ]
+        }
+    ]
+})
+
+
+# Legacy job_title config with markets -> regions -> locations
+_LEGACY_FORMAT_YAML = _dumps({
+    "job_title": "Software Engineer",
+    "search_radius": 30,
+    "results_per_location": 150,
+    "batch_size": 3,
+    "markets": [
+        {
+            "name": "West Coast",
+            "regions": [
+                {
+                    "name": "California",
+                    "locations": [
+                        {
+                            "name": "San Francisco",
+                            "address": "123 Market St",
+                            "zip_code": "94105"
+                        }
+                    ]
+                }
+            ]
+        }
+    ]
+})
+
+
+# Legacy config used as migration input
+_MIGRATION_OLD_YAML = _dumps({
+    "job_title": "Test Engineer",
+    "search_radius": 25,
+    "markets": [
+        {
+            "name": "Test Market",
+            "regions": [
+                {
+                    "name": "Test Region",
+                    "locations": [
+                        {
+                            "name": "Test Location",
+                            "address": "123 Test St",
+                            "zip_code": "12345"
+                        }
+                    ]
+                }
+            ]
+        }
+    ]
+})
+
+
+def _load_from_dict(data: dict) -> Config:
+    """Round-trip config data through YAML (as JSON) in memory and load it."""
+    return load_config(io.StringIO(_dumps(data)))
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    """Write config text (or data, as JSON) to a file under tmp_path."""
+    def _make(content, name: str = "config.yaml"):
+        path = tmp_path / name
+        path.write_text(content if isinstance(content, str) else _dumps(content))
+        return path
+    return _make
+
+
+@pytest.fixture(scope="module")
+def comprehensive_config() -> Config:
+    """Valid two-role config with one market and center; treat as read-only."""
+    market = Market(name="California")
+    
+    # Add paybands for both roles
+    market.paybands["junior"] = Payband(min=60000, max=80000, pay_type="salary")
+    market.paybands["senior"] = Payband(min=120000, max=180000, pay_type="salary")
+    
+    # Add centers
+    market.centers.append(Center(
+        code="SF-001",
+        name="San Francisco",
+        address_1="123 Market St",
+        city="San Francisco",
+        state="CA",
+        zip_code="94105"
+    ))
+    
+    return Config(
+        meta=Meta(version=2, currency_default="USD"),
+        roles=[
+            Role(id="junior", name="Junior Dev", pay_type="salary", default_unit="USD/year"),
+            Role(id="senior", name="Senior Dev", pay_type="salary", default_unit="USD/year")
+        ],
+        search=SearchConfig(radius_miles=50, results_per_location=100),
+        regions=[Region(name="West", markets=[market])]
+    )
+
+
+@pytest.fixture(scope="module")
+def duplicate_center_config() -> Config:
+    """Config whose two centers share a code but not a zip code."""
+    market = Market(name="Test Market")
+    market.centers.append(_center(code="DUP", name="Center 1", zip_code="12345"))
+    # Duplicate code
+    market.centers.append(_center(code="DUP", name="Center 2", zip_code="67890"))
+    
+    return Config(
+        meta=Meta(),
+        roles=[],
+        search=SearchConfig(),
+        regions=[Region(name="Test", markets=[market])]
+    )
+
+
+@pytest.fixture(scope="module")
+def oversized_search_config() -> Config:
+    """Config whose search settings all exceed the validation limits."""
+    return Config(
+        meta=Meta(),
+        roles=[Role(id="test", name="Test", pay_type="salary", default_unit="USD/year")],
+        search=SearchConfig(
+            radius_miles=150,  # Too large
+            results_per_location=600,  # Too large
+            batch_size=15  # Too large
+        ),
+        regions=[]
+    )
+
+
 class TestDataModels:
     """Test data model classes."""
     
@@ -40,40 +288,37 @@ class TestDataModels:
         assert role.pay_type == PayType.HOURLY
         assert role.default_unit == "USD/hour"
     
-    def test_payband_creation(self):
-        """Test Payband creation and auto-unit setting."""
+    @pytest.mark.parametrize("kwargs,expected_unit,expected_currency", [
         # Hourly payband
-        hourly = Payband(min=15.0, max=25.0, pay_type=PayType.HOURLY)
-        assert hourly.unit == "USD/hour"
-        assert hourly.currency == "USD"
-        
+        ({"min": 15.0, "max": 25.0, "pay_type": PayType.HOURLY}, "USD/hour", "USD"),
         # Salary payband
-        salary = Payband(min=50000, max=80000, pay_type=PayType.SALARY)
-        assert salary.unit == "USD/year"
-        
+        ({"min": 50000, "max": 80000, "pay_type": PayType.SALARY}, "USD/year", "USD"),
         # Custom unit
-        custom = Payband(min=20, max=30, unit="EUR/hour", currency="EUR", pay_type="hourly")
-        assert custom.unit == "EUR/hour"
-        assert custom.currency == "EUR"
+        ({"min": 20, "max": 30, "unit": "EUR/hour", "currency": "EUR", "pay_type": "hourly"},
+         "EUR/hour", "EUR"),
+    ])
+    def test_payband_creation(self, kwargs, expected_unit, expected_currency):
+        """Test Payband creation and auto-unit setting."""
+        payband = Payband(**kwargs)
+        assert payband.unit == expected_unit
+        assert payband.currency == expected_currency
     
-    def test_payband_validation(self):
-        """Test Payband validation."""
+    @pytest.mark.parametrize("min_pay,max_pay,expected_error", [
         # Valid payband
-        valid = Payband(min=20, max=30, pay_type="hourly")
-        errors = valid.validate()
-        assert len(errors) == 0
-        
+        (20, 30, None),
         # Invalid: negative min
-        invalid_neg = Payband(min=-10, max=30, pay_type="hourly")
-        errors = invalid_neg.validate()
-        assert len(errors) == 1
-        assert "negative" in errors[0].lower()
-        
+        (-10, 30, "Minimum pay cannot be negative"),
         # Invalid: max < min
-        invalid_range = Payband(min=40, max=30, pay_type="hourly")
-        errors = invalid_range.validate()
-        assert len(errors) == 1
-        assert "less than minimum" in errors[0]
+        (40, 30, "less than minimum"),
+    ])
+    def test_payband_validation(self, min_pay, max_pay, expected_error):
+        """Test Payband validation."""
+        errors = Payband(min=min_pay, max=max_pay, pay_type="hourly").validate()
+        if expected_error is None:
+            assert errors == []
+        else:
+            assert len(errors) == 1
+            assert expected_error in errors[0]
     
     def test_center_creation(self):
         """Test Center creation and address formatting."""
@@ -122,20 +367,13 @@ class TestDataModels:
         warnings = market.validate_paybands(roles)
         
         # Should warn about undefined role "unknown"
-        assert any("undefined role: unknown" in w for w in warnings)
+        assert "Market 'Test' has payband for undefined role: unknown" in warnings
         # Should warn about missing payband for "bcba"
-        assert any("missing payband for role: bcba" in w for w in warnings)
+        assert "Market 'Test' missing payband for role: bcba" in warnings
     
     def test_backward_compatibility_location(self):
         """Test Location backward compatibility."""
-        center = Center(
-            code="TEST",
-            name="Test Center",
-            address_1="123 Main St",
-            city="Houston",
-            state="TX",
-            zip_code="77001"
-        )
+        center = _center(name="Test Center", zip_code="77001")
         
         location = Location.from_center(center, "Test Market", "Test Region")
         assert location.name == "Test Center"
@@ -149,288 +387,119 @@ class TestConfigLoading:
     
     def test_load_new_format(self):
         """Test loading configuration in new format."""
-        config_data = {
-            "meta": {
-                "version": 1,
-                "currency_default": "USD",
-                "unit_defaults": {
-                    "hourly": "USD/hour",
-                    "salary": "USD/year"
-                }
-            },
-            "roles": [
-                {
-                    "id": "rbt",
-                    "name": "RBT",
-                    "pay_type": "hourly",
-                    "default_unit": "USD/hour"
-                }
-            ],
-            "search": {
-                "radius_miles": 25,
-                "results_per_location": 200,
-                "batch_size": 5
-            },
-            "regions": [
-                {
-                    "name": "Central",
-                    "markets": [
-                        {
-                            "name": "Texas",
-                            "paybands": {
-                                "rbt": {
-                                    "min": 15,
-                                    "max": 22.50,
-                                    "currency": "USD",
-                                    "unit": "USD/hour",
-                                    "pay_type": "hourly"
-                                }
-                            },
-                            "centers": [
-                                {
-                                    "code": "HOU-001",
-                                    "name": "Houston Center",
-                                    "address_1": "123 Main St",
-                                    "city": "Houston",
-                                    "state": "TX",
-                                    "zip_code": "77001"
-                                }
-                            ]
-                        }
-                    ]
-                }
-            ]
-        }
+        config = load_config(io.StringIO(_NEW_FORMAT_YAML))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        assert config.meta.version == 1
+        assert len(config.roles) == 1
+        assert config.roles[0].id == "rbt"
+        assert config.search.radius_miles == 25
+        assert len(config.regions) == 1
+        assert len(config.all_markets) == 1
+        assert len(config.all_centers) == 1
+        assert config.total_locations == 1
         
-        try:
-            config = load_config(config_path)
-            
-            assert config.meta.version == 1
-            assert len(config.roles) == 1
-            assert config.roles[0].id == "rbt"
-            assert config.search.radius_miles == 25
-            assert len(config.regions) == 1
-            assert len(config.all_markets) == 1
-            assert len(config.all_centers) == 1
-            assert config.total_locations == 1
-            
-            # Check payband
-            market = config.all_markets[0]
-            payband = market.get_payband("rbt")
-            assert payband is not None
-            assert payband.min == 15
-            assert payband.max == 22.50
-            
-        finally:
-            Path(config_path).unlink()
+        # Check payband
+        market = config.all_markets[0]
+        payband = market.get_payband("rbt")
+        assert payband is not None
+        assert payband.min == 15
+        assert payband.max == 22.50
     
     def test_load_legacy_format(self):
         """Test loading configuration in legacy format."""
-        config_data = {
-            "job_title": "Software Engineer",
-            "search_radius": 30,
-            "results_per_location": 150,
-            "batch_size": 3,
-            "markets": [
-                {
-                    "name": "West Coast",
-                    "regions": [
-                        {
-                            "name": "California",
-                            "locations": [
-                                {
-                                    "name": "San Francisco",
-                                    "address": "123 Market St",
-                                    "zip_code": "94105"
-                                }
-                            ]
-                        }
-                    ]
-                }
-            ]
-        }
+        with pytest.warns(DeprecationWarning):
+            config = load_config(io.StringIO(_LEGACY_FORMAT_YAML))
+        
+        # Should create synthetic role
+        assert len(config.roles) == 1
+        assert config.roles[0].id == "default"
+        assert config.roles[0].name == "Software Engineer"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        # Should preserve search parameters
+        assert config.search.radius_miles == 30
+        assert config.search.results_per_location == 150
         
-        try:
-            with pytest.warns(DeprecationWarning):
-                config = load_config(config_path)
-            
-            # Should create synthetic role
-            assert len(config.roles) == 1
-            assert config.roles[0].id == "default"
-            assert config.roles[0].name == "Software Engineer"
-            
-            # Should preserve search parameters
-            assert config.search.radius_miles == 30
-            assert config.search.results_per_location == 150
-            
-            # Should have backward compat fields
-            assert config.job_title == "Software Engineer"
-            assert config.search_radius == 30
-            
-            # Should convert locations to centers
-            assert config.total_locations == 1
-            center = config.all_centers[0]
-            assert center.zip_code == "94105"
-            
-        finally:
-            Path(config_path).unlink()
+        # Should have backward compat fields
+        assert config.job_title == "Software Engineer"
+        assert config.search_radius == 30
+        
+        # Should convert locations to centers
+        assert config.total_locations == 1
+        center = config.all_centers[0]
+        assert center.zip_code == "94105"
     
-    def test_validation_warnings(self):
+    def test_validation_warnings(self, oversized_search_config):
         """Test configuration validation warnings."""
-        config = Config(
-            meta=Meta(),
-            roles=[Role(id="test", name="Test", pay_type="salary", default_unit="USD/year")],
-            search=SearchConfig(
-                radius_miles=150,  # Too large
-                results_per_location=600,  # Too large
-                batch_size=15  # Too large
-            ),
-            regions=[]
-        )
-        
-        warnings = config.validate()
+        warnings = "\n".join(oversized_search_config.validate())
         
-        assert any("radius" in w for w in warnings)
-        assert any("results_per_location" in w for w in warnings)
-        assert any("batch_size" in w for w in warnings)
+        assert "radius" in warnings
+        assert "results_per_location" in warnings
+        assert "batch_size" in warnings
     
-    def test_duplicate_detection(self):
+    def test_duplicate_detection(self, duplicate_center_config):
         """Test duplicate center code and zip code detection."""
-        region = Region(name="Test")
-        market = Market(name="Test Market")
-        
-        # Add duplicate center codes
-        market.centers.append(Center(
-            code="DUP",
-            name="Center 1",
-            address_1="123 St",
-            city="City",
-            state="ST",
-            zip_code="12345"
-        ))
-        market.centers.append(Center(
-            code="DUP",  # Duplicate code
-            name="Center 2",
-            address_1="456 St",
-            city="City",
-            state="ST",
-            zip_code="67890"
-        ))
-        
-        region.markets.append(market)
-        
-        config = Config(
-            meta=Meta(),
-            roles=[],
-            search=SearchConfig(),
-            regions=[region]
-        )
-        
-        warnings = config.validate()
-        assert any("Duplicate center codes" in w for w in warnings)
+        warnings = duplicate_center_config.validate()
+        assert "Duplicate center codes found in configuration: DUP" in warnings
+        assert "Duplicate zip codes" not in "\n".join(warnings)
     
-    def test_config_migration(self):
+    def test_config_migration(self, yaml_file, tmp_path):
         """Test configuration migration from old to new format."""
         # Create old format config
-        old_data = {
-            "job_title": "Test Engineer",
-            "search_radius": 25,
-            "markets": [
-                {
-                    "name": "Test Market",
-                    "regions": [
-                        {
-                            "name": "Test Region",
-                            "locations": [
-                                {
-                                    "name": "Test Location",
-                                    "address": "123 Test St",
-                                    "zip_code": "12345"
-                                }
-                            ]
-                        }
-                    ]
-                }
-            ]
-        }
+        old_path = yaml_file(_MIGRATION_OLD_YAML, "old.yaml")
+        new_path = tmp_path / "new.yaml"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as old_file:
-            yaml.dump(old_data, old_file)
-            old_path = old_file.name
+        # Migrate
+        migrate_config(old_path, new_path)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as new_file:
-            new_path = new_file.name
+        # Load migrated config
+        config = load_config(new_path)
         
-        try:
-            # Migrate
-            migrate_config(old_path, new_path)
-            
-            # Load migrated config
-            config = load_config(new_path)
-            
-            # Verify structure
-            assert config.meta.version == 1
-            assert len(config.roles) == 1
-            assert config.roles[0].name == "Test Engineer"
-            assert config.search.radius_miles == 25
-            assert config.total_locations == 1
-            
-            # Should not have legacy fields in new config
-            assert config.job_title is None
-            
-        finally:
-            Path(old_path).unlink()
-            Path(new_path).unlink()
+        # Verify structure
+        assert config.meta.version == 1
+        assert len(config.roles) == 1
+        assert config.roles[0].name == "Test Engineer"
+        assert config.search.radius_miles == 25
+        assert config.total_locations == 1
+        
+        # Should not have legacy fields in new config
+        assert config.job_title is None
+
+
+class TestReadConfigFile:
+    """Test the cached YAML config reader."""
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            read_config_file(tmp_path / "missing.yaml")
+
+    def test_unchanged_file_reuses_parse(self, yaml_file, monkeypatch):
+        path = yaml_file("roles:\n  - id: rbt\n")
+        assert read_config_file(path) == {"roles": [{"id": "rbt"}]}
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config was parsed again")
+
+        monkeypatch.setattr(_yaml, "safe_load", fail)
+        assert read_config_file(path) == {"roles": [{"id": "rbt"}]}
+
+    def test_changed_file_is_reparsed(self, yaml_file):
+        path = yaml_file("roles: []\n")
+        assert read_config_file(path) == {"roles": []}
+        yaml_file("roles: [rbt, bcba]\n")
+        assert read_config_file(path) == {"roles": ["rbt", "bcba"]}
+
+    def test_result_is_a_private_copy(self, yaml_file):
+        path = yaml_file({"roles": ["rbt"]})
+        read_config_file(path)["roles"].append("bcba")
+        assert read_config_file(path) == {"roles": ["rbt"]}
 
 
 class TestConfigIntegration:
     """Integration tests for configuration usage."""
     
-    def test_full_config_workflow(self):
+    def test_full_config_workflow(self, comprehensive_config):
         """Test complete configuration workflow."""
-        # Create comprehensive config
-        meta = Meta(version=2, currency_default="USD")
-        
-        roles = [
-            Role(id="junior", name="Junior Dev", pay_type="salary", default_unit="USD/year"),
-            Role(id="senior", name="Senior Dev", pay_type="salary", default_unit="USD/year")
-        ]
-        
-        search = SearchConfig(radius_miles=50, results_per_location=100)
-        
-        region = Region(name="West")
-        market = Market(name="California")
-        
-        # Add paybands for both roles
-        market.paybands["junior"] = Payband(min=60000, max=80000, pay_type="salary")
-        market.paybands["senior"] = Payband(min=120000, max=180000, pay_type="salary")
-        
-        # Add centers
-        market.centers.append(Center(
-            code="SF-001",
-            name="San Francisco",
-            address_1="123 Market St",
-            city="San Francisco",
-            state="CA",
-            zip_code="94105"
-        ))
-        
-        region.markets.append(market)
-        
-        config = Config(
-            meta=meta,
-            roles=roles,
-            search=search,
-            regions=[region]
-        )
+        config = comprehensive_config
         
         # Test config properties
         assert config.total_locations == 1
@@ -440,6 +509,7 @@ class TestConfigIntegration:
         junior = config.get_role("junior")
         assert junior is not None
         assert junior.name == "Junior Dev"
+        assert config.get_role("missing") is None
         
         # Test market operations
         ca_market = config.all_markets[0]
@@ -451,83 +521,76 @@ class TestConfigIntegration:
         warnings = config.validate()
         # Should have no warnings for this valid config
         assert len(warnings) == 0
+        
+        # Flattened views are computed once and reused
+        assert config.all_centers is config.all_centers
+        assert config.all_markets is config.all_markets
 
 
 class TestConfigurableFields:
     """Tests for the new configurable fields (SearchConfig, SalaryFilterConfig, Role)."""
 
-    def _write_config(self, data: dict) -> str:
-        """Write config data to a temp YAML file and return its path."""
-        f = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        yaml.dump(data, f)
-        f.close()
-        return f.name
-
     def _base_config_data(self, **overrides) -> dict:
         """Return a minimal valid config dict with optional overrides."""
-        data = {
-            "roles": [
-                {
-                    "id": "rbt",
-                    "name": "RBT",
-                    "pay_type": "hourly",
-                    "default_unit": "USD/hour",
-                }
-            ],
-            "search": {"radius_miles": 25},
-            "regions": [
-                {
-                    "name": "Central",
-                    "markets": [
-                        {
-                            "name": "Texas",
-                            "paybands": {
-                                "rbt": {"min": 15, "max": 22, "pay_type": "hourly"}
-                            },
-                            "centers": [
-                                {
-                                    "code": "HOU",
-                                    "name": "Houston",
-                                    "address_1": "123 Main",
-                                    "city": "Houston",
-                                    "state": "TX",
-                                    "zip_code": "77001",
-                                }
-                            ],
-                        }
-                    ],
-                }
-            ],
-        }
-        for key, val in overrides.items():
-            data[key] = val
+        data = copy.deepcopy(_BASE_CONFIG_TEMPLATE)
+        data.update(overrides)
         return data
 
+    @pytest.fixture(scope="class")
+    def base_yaml_path(self, tmp_path_factory):
+        """The base config written once for the whole class."""
+        path = tmp_path_factory.mktemp("cfg") / "base.yaml"
+        path.write_text(_dumps(self._base_config_data()))
+        return path
+
+    @pytest.fixture(scope="class")
+    def base_cfg(self, base_yaml_path):
+        """The base config parsed once; tests using it must not mutate it."""
+        return load_config(base_yaml_path)
+
+    def test_load_config_from_parsed_data(self):
+        """load_config accepts already-parsed config data."""
+        cfg = load_config(self._base_config_data())
+        assert cfg.roles[0].id == "rbt"
+        assert cfg.total_locations == 1
+
+    def test_load_config_from_stream(self):
+        """load_config parses YAML from an open text stream."""
+        cfg = load_config(io.StringIO(_yaml.safe_dump(self._base_config_data())))
+        assert cfg.roles[0].id == "rbt"
+
+    def test_load_config_empty_stream(self):
+        with pytest.raises(ValueError, match="empty"):
+            load_config(io.StringIO(""))
+
+    def test_load_config_empty_data(self):
+        with pytest.raises(ValueError, match="empty"):
+            load_config({})
+
     # ── SearchConfig defaults ──────────────────────────────────
 
-    def test_search_config_defaults(self):
+    @pytest.mark.parametrize("field,expected", [
+        ("site_names", ["linkedin", "indeed"]),
+        ("country_indeed", "usa"),
+        ("min_search_terms", 4),
+        ("max_search_terms", 6),
+        ("inter_search_delay_min", 3.0),
+        ("inter_search_delay_max", 8.0),
+        ("delay_between_completions", 0.5),
+        ("delay_between_batches", 2.0),
+        ("max_retries", 3),
+        ("retry_backoff_base", 30.0),
+        ("min_sample_size", 100),
+    ])
+    def test_search_config_defaults(self, base_cfg, field, expected):
         """New SearchConfig fields have correct defaults when YAML omits them."""
-        path = self._write_config(self._base_config_data())
-        try:
-            cfg = load_config(path)
-            assert cfg.search.site_names == ["linkedin", "indeed"]
-            assert cfg.search.country_indeed == "usa"
-            assert cfg.search.min_search_terms == 4
-            assert cfg.search.max_search_terms == 6
-            assert cfg.search.inter_search_delay_min == 3.0
-            assert cfg.search.inter_search_delay_max == 8.0
-            assert cfg.search.delay_between_completions == 0.5
-            assert cfg.search.delay_between_batches == 2.0
-            assert cfg.search.max_retries == 3
-            assert cfg.search.retry_backoff_base == 30.0
-            assert cfg.search.min_sample_size == 100
-        finally:
-            Path(path).unlink()
+        assert getattr(base_cfg.search, field) == expected
 
     def test_search_config_custom(self):
         """SearchConfig fields can be set via YAML."""
-        data = self._base_config_data()
-        data["search"].update({
+        # Only "search" changes, so the rest of the template is shared, not copied
+        data = {**_BASE_CONFIG_TEMPLATE, "search": {
+            **_BASE_CONFIG_TEMPLATE["search"],
             "site_names": ["linkedin"],
             "country_indeed": "canada",
             "min_search_terms": 2,
@@ -539,57 +602,45 @@ class TestConfigurableFields:
             "max_retries": 5,
             "retry_backoff_base": 60.0,
             "min_sample_size": 50,
-        })
-        path = self._write_config(data)
-        try:
-            cfg = load_config(path)
-            assert cfg.search.site_names == ["linkedin"]
-            assert cfg.search.country_indeed == "canada"
-            assert cfg.search.min_search_terms == 2
-            assert cfg.search.max_search_terms == 4
-            assert cfg.search.max_retries == 5
-            assert cfg.search.min_sample_size == 50
-        finally:
-            Path(path).unlink()
+        }}
+        cfg = _load_from_dict(data)
+        assert cfg.search.site_names == ["linkedin"]
+        assert cfg.search.country_indeed == "canada"
+        assert cfg.search.min_search_terms == 2
+        assert cfg.search.max_search_terms == 4
+        assert cfg.search.max_retries == 5
+        assert cfg.search.min_sample_size == 50
 
     # ── SalaryFilterConfig ─────────────────────────────────────
 
-    def test_salary_filter_defaults(self):
+    @pytest.mark.parametrize("field,expected", [
+        ("hourly_rate_threshold", 500.0),
+        ("iqr_multiplier", 1.5),
+        ("min_data_points_for_iqr", 4),
+        ("hourly_salary_min", 31000.0),
+        ("hourly_salary_max", 125000.0),
+        ("salary_min", 40000.0),
+        ("salary_max", 300000.0),
+        ("default_salary_min", 20000.0),
+        ("default_salary_max", 500000.0),
+    ])
+    def test_salary_filter_defaults(self, base_cfg, field, expected):
         """SalaryFilterConfig defaults match prior hardcoded values."""
-        path = self._write_config(self._base_config_data())
-        try:
-            cfg = load_config(path)
-            sf = cfg.salary_filter
-            assert sf.hourly_rate_threshold == 500.0
-            assert sf.iqr_multiplier == 1.5
-            assert sf.min_data_points_for_iqr == 4
-            assert sf.hourly_salary_min == 31000.0
-            assert sf.hourly_salary_max == 125000.0
-            assert sf.salary_min == 40000.0
-            assert sf.salary_max == 300000.0
-            assert sf.default_salary_min == 20000.0
-            assert sf.default_salary_max == 500000.0
-        finally:
-            Path(path).unlink()
+        assert getattr(base_cfg.salary_filter, field) == expected
 
     def test_salary_filter_custom(self):
         """SalaryFilterConfig can be overridden via YAML."""
-        data = self._base_config_data()
-        data["salary_filter"] = {
+        data = {**_BASE_CONFIG_TEMPLATE, "salary_filter": {
             "iqr_multiplier": 2.0,
             "salary_min": 50000.0,
             "salary_max": 250000.0,
-        }
-        path = self._write_config(data)
-        try:
-            cfg = load_config(path)
-            assert cfg.salary_filter.iqr_multiplier == 2.0
-            assert cfg.salary_filter.salary_min == 50000.0
-            assert cfg.salary_filter.salary_max == 250000.0
-            # Unspecified fields keep defaults
-            assert cfg.salary_filter.hourly_rate_threshold == 500.0
-        finally:
-            Path(path).unlink()
+        }}
+        cfg = _load_from_dict(data)
+        assert cfg.salary_filter.iqr_multiplier == 2.0
+        assert cfg.salary_filter.salary_min == 50000.0
+        assert cfg.salary_filter.salary_max == 250000.0
+        # Unspecified fields keep defaults
+        assert cfg.salary_filter.hourly_rate_threshold == 500.0
 
     # ── Role excluded_title_keywords ───────────────────────────
 
@@ -597,22 +648,13 @@ class TestConfigurableFields:
         """excluded_title_keywords is parsed from YAML."""
         data = self._base_config_data()
         data["roles"][0]["excluded_title_keywords"] = ["intern", "junior"]
-        path = self._write_config(data)
-        try:
-            cfg = load_config(path)
-            assert cfg.roles[0].excluded_title_keywords == ["intern", "junior"]
-        finally:
-            Path(path).unlink()
-
-    def test_excluded_title_keywords_default_empty(self):
+        cfg = _load_from_dict(data)
+        assert cfg.roles[0].excluded_title_keywords == ["intern", "junior"]
+
+    def test_excluded_title_keywords_default_empty(self, base_cfg):
         """Non-BCBA roles get empty excluded_title_keywords by default."""
-        path = self._write_config(self._base_config_data())
-        try:
-            cfg = load_config(path)
-            # RBT role should have no excluded keywords
-            assert cfg.roles[0].excluded_title_keywords == []
-        finally:
-            Path(path).unlink()
+        # RBT role should have no excluded keywords
+        assert base_cfg.roles[0].excluded_title_keywords == []
 
     def test_bcba_backward_compat_shim(self):
         """BCBA roles get auto-populated excluded_title_keywords when not specified."""
@@ -629,14 +671,10 @@ class TestConfigurableFields:
         data["regions"][0]["markets"][0]["paybands"] = {
             "bcba": {"min": 70000, "max": 90000, "pay_type": "salary"}
         }
-        path = self._write_config(data)
-        try:
-            cfg = load_config(path)
-            assert len(cfg.roles[0].excluded_title_keywords) > 0
-            assert "teacher" in cfg.roles[0].excluded_title_keywords
-            assert "therapist" in cfg.roles[0].excluded_title_keywords
-        finally:
-            Path(path).unlink()
+        cfg = _load_from_dict(data)
+        assert len(cfg.roles[0].excluded_title_keywords) > 0
+        assert "teacher" in cfg.roles[0].excluded_title_keywords
+        assert "therapist" in cfg.roles[0].excluded_title_keywords
 
     def test_bcba_explicit_keywords_not_overridden(self):
         """Explicit excluded_title_keywords on BCBA are not overridden by shim."""
@@ -653,12 +691,8 @@ class TestConfigurableFields:
         data["regions"][0]["markets"][0]["paybands"] = {
             "bcba": {"min": 70000, "max": 90000, "pay_type": "salary"}
         }
-        path = self._write_config(data)
-        try:
-            cfg = load_config(path)
-            assert cfg.roles[0].excluded_title_keywords == ["manager"]
-        finally:
-            Path(path).unlink()
+        cfg = _load_from_dict(data)
+        assert cfg.roles[0].excluded_title_keywords == ["manager"]
 
     # ── Validation ─────────────────────────────────────────────
 
@@ -666,47 +700,42 @@ class TestConfigurableFields:
         """Warns when min_search_terms > max_search_terms."""
         cfg = Config(
             meta=Meta(),
-            roles=[Role(id="r", name="R", pay_type="salary", default_unit="USD/year")],
+            roles=[_SALARY_ROLE],
             search=SearchConfig(min_search_terms=8, max_search_terms=4),
             regions=[],
         )
         w = cfg.validate()
-        assert any("min_search_terms" in x and "max_search_terms" in x for x in w)
+        assert "min_search_terms (8) > max_search_terms (4)" in w
 
     def test_validation_delay_range(self):
         """Warns when inter_search_delay_min > inter_search_delay_max."""
         cfg = Config(
             meta=Meta(),
-            roles=[Role(id="r", name="R", pay_type="salary", default_unit="USD/year")],
+            roles=[_SALARY_ROLE],
             search=SearchConfig(inter_search_delay_min=10, inter_search_delay_max=2),
             regions=[],
         )
         w = cfg.validate()
-        assert any("inter_search_delay_min" in x for x in w)
+        assert "inter_search_delay_min (10) > inter_search_delay_max (2)" in w
 
     def test_validation_salary_bounds(self):
         """Warns when salary_min >= salary_max or hourly bounds are inverted."""
         cfg = Config(
             meta=Meta(),
-            roles=[Role(id="r", name="R", pay_type="salary", default_unit="USD/year")],
+            roles=[_SALARY_ROLE],
             search=SearchConfig(),
             regions=[],
             salary_filter=SalaryFilterConfig(salary_min=300000, salary_max=40000),
         )
         w = cfg.validate()
-        assert any("salary_min" in x and "salary_max" in x for x in w)
+        assert "salary_min (300000) >= salary_max (40000)" in w
 
-    def test_valid_config_no_extra_warnings(self):
+    def test_valid_config_no_extra_warnings(self, base_cfg):
         """A well-formed config with all defaults produces no new warnings."""
-        path = self._write_config(self._base_config_data())
-        try:
-            cfg = load_config(path)
-            w = cfg.validate()
-            # The only possible warning is missing payband for roles, not our new checks
-            assert not any("min_search_terms" in x for x in w)
-            assert not any("salary_min" in x for x in w)
-        finally:
-            Path(path).unlink()
+        w = "\n".join(base_cfg.validate())
+        # The only possible warning is missing payband for roles, not our new checks
+        assert "min_search_terms" not in w
+        assert "salary_min" not in w
 
     # ── Legacy config backward compat ──────────────────────────
 
@@ -723,15 +752,11 @@ class TestConfigurableFields:
                 }
             ],
         }
-        path = self._write_config(data)
-        try:
-            with pytest.warns(DeprecationWarning):
-                cfg = load_config(path)
-            assert cfg.search.max_retries == 3
-            assert cfg.search.min_sample_size == 100
-            assert cfg.salary_filter.iqr_multiplier == 1.5
-        finally:
-            Path(path).unlink()
+        with pytest.warns(DeprecationWarning):
+            cfg = _load_from_dict(data)
+        assert cfg.search.max_retries == 3
+        assert cfg.search.min_sample_size == 100
+        assert cfg.salary_filter.iqr_multiplier == 1.5
 
 
 if __name__ == "__main__":
@@ -15,6 +15,7 @@ from jobx.market_analysis.batch_executor import (
 )
 from jobx.market_analysis.cli import (
     _build_run_summary,
+    _dump_run_summary,
     _format_duration,
     _generate_recommendation,
 )
@@ -28,9 +29,16 @@ from jobx.market_analysis.config_loader import (
     Role,
     SearchConfig,
 )
+from jobx.market_analysis.logger import MarketAnalysisLogger
 
 # ── Helpers ────────────────────────────────────────────────────
 
+# Shared by every success result; none of these tests touch the frame
+_EMPTY_DF = pd.DataFrame()
+
+# Payband shared by every role in _make_config; tests only read it
+_DEFAULT_PAYBAND = Payband(min=20, max=40)
+
 
 def _make_role(role_id="rbt", name="RBT", pay_type="hourly"):
     return Role(id=role_id, name=name, pay_type=pay_type,
@@ -47,7 +55,7 @@ def _make_config(roles=None, centers=None, batch_size=2):
     centers = centers or [_make_center()]
     market = Market(
         name="Houston",
-        paybands={r.id: Payband(min=20, max=40) for r in roles},
+        paybands={r.id: _DEFAULT_PAYBAND for r in roles},
         centers=centers,
     )
     region = Region(name="Texas", markets=[market])
@@ -62,7 +70,7 @@ def _make_config(roles=None, centers=None, batch_size=2):
 def _make_executor(config=None, tmp_path=None, enable_safety=False):
     config = config or _make_config()
     output_dir = str(tmp_path) if tmp_path else "."
-    logger = MagicMock()
+    logger = MagicMock(spec=MarketAnalysisLogger)
     return BatchExecutor(
         config, logger, output_dir=output_dir,
         enable_safety=enable_safety,
@@ -81,7 +89,7 @@ def _make_task(role=None, center=None, market_name="Houston", region_name="Texas
 def _success_result(task, jobs_found=10, jobs_with_salary=5, duration=30.0):
     return LocationResult(
         center=task.center, role=task.role, success=True,
-        jobs_df=pd.DataFrame(), jobs_found=jobs_found,
+        jobs_df=_EMPTY_DF, jobs_found=jobs_found,
         jobs_with_salary=jobs_with_salary,
         market_name=task.market_name, region_name=task.region_name,
         duration_seconds=duration,
@@ -233,6 +241,41 @@ class TestTimingStats:
         assert stats["p50"] == 60.0  # index 5
         assert stats["p95"] == 100.0  # index 9
 
+    def test_unordered_results(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        task = _make_task()
+        for d in [70.0, 10.0, 100.0, 40.0, 90.0, 20.0, 60.0, 30.0, 80.0, 50.0]:
+            executor.results.append(_success_result(task, duration=d))
+        stats = executor.get_timing_stats()
+        assert stats == {"p50": 60.0, "p95": 100.0, "max": 100.0, "count": 10}
+
+    def test_reflects_results_added_later(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        task = _make_task()
+        executor.results.append(_success_result(task, duration=10.0))
+        assert executor.get_timing_stats()["count"] == 1
+        executor.results.append(_failure_result(task, duration=20.0))
+        assert executor.get_timing_stats()["max"] == 20.0
+        assert executor.get_error_summary()["total_failures"] == 1
+        assert executor.get_summary_stats()["successful_tasks"] == 1
+
+    def test_stats_follow_in_place_replacement(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        task = _make_task()
+        executor.results.append(_failure_result(task, duration=20.0))
+        assert executor.get_summary_stats()["successful_tasks"] == 0
+        executor.results[0] = _success_result(task, duration=10.0)
+        assert executor.get_summary_stats()["successful_tasks"] == 1
+        assert executor.get_timing_stats()["max"] == 10.0
+
+    def test_stats_follow_replaced_results_list(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        task = _make_task()
+        executor.results = [_failure_result(task)]
+        assert executor.get_error_summary()["total_failures"] == 1
+        executor.results = [_success_result(task)]
+        assert executor.get_error_summary()["total_failures"] == 0
+
     def test_ignores_none_durations(self, tmp_path):
         executor = _make_executor(tmp_path=tmp_path)
         task = _make_task()
@@ -247,6 +290,48 @@ class TestTimingStats:
         assert executor.get_timing_stats()["count"] == 1
 
 
+# ── Summary and Role Stats ────────────────────────────────────
+
+
+class TestSummaryAndRoleStats:
+    """BatchExecutor.get_summary_stats() and get_role_stats()."""
+
+    def _executor_with_two_roles(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        rbt, bcba = _make_role(), _make_role("bcba", "BCBA", "salary")
+        executor.results.append(_success_result(_make_task(role=rbt), jobs_found=10, jobs_with_salary=4))
+        executor.results.append(_failure_result(_make_task(role=rbt)))
+        executor.results.append(_success_result(
+            _make_task(role=bcba, center=_make_center("AUS-001", zip_code="78701")),
+            jobs_found=3, jobs_with_salary=1,
+        ))
+        return executor
+
+    def test_summary_totals(self, tmp_path):
+        stats = self._executor_with_two_roles(tmp_path).get_summary_stats()
+        assert stats["total_tasks"] == 3
+        assert stats["successful_tasks"] == 2
+        assert stats["total_locations"] == 2
+        assert stats["total_roles"] == 2
+        assert stats["total_jobs"] == 13
+        assert stats["jobs_with_salary"] == 5
+
+    def test_role_stats(self, tmp_path):
+        stats = self._executor_with_two_roles(tmp_path).get_role_stats("rbt")
+        assert stats == {
+            "total_tasks": 2,
+            "successful_tasks": 1,
+            "total_jobs": 10,
+            "jobs_with_salary": 4,
+            "success_rate": 50.0,
+        }
+
+    def test_unknown_role(self, tmp_path):
+        stats = self._executor_with_two_roles(tmp_path).get_role_stats("missing")
+        assert stats["total_tasks"] == 0
+        assert stats["success_rate"] == 0
+
+
 # ── Error Summary ─────────────────────────────────────────────
 
 
@@ -305,6 +390,18 @@ class TestSlowestSearches:
         assert slowest[0]["duration_seconds"] == 200.0
         assert slowest[1]["duration_seconds"] == 100.0
 
+    def test_ties_keep_result_order(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        for i, d in enumerate([10.0, 50.0, 50.0, 5.0, 50.0, 80.0]):
+            task = _make_task(center=_make_center(code=f"HOU-{i:03d}"))
+            executor.results.append(_success_result(task, duration=d))
+        executor.results.append(LocationResult(
+            center=_make_center(code="NONE"), role=_make_role(), success=True,
+        ))
+        slowest = executor.get_slowest_searches(n=3)
+        assert [s["center"] for s in slowest] == ["HOU-005", "HOU-001", "HOU-002"]
+        assert len(executor.get_slowest_searches(n=10)) == 6
+
     def test_includes_failures(self, tmp_path):
         executor = _make_executor(tmp_path=tmp_path)
         task = _make_task()
@@ -324,6 +421,7 @@ class TestFormatDuration:
         (0, "0s"),
         (45, "45s"),
         (90, "1m 30s"),
+        (3600, "1h 0m 0s"),
         (3661, "1h 1m 1s"),
         (8853, "2h 27m 33s"),
     ])
@@ -385,114 +483,124 @@ class TestGenerateRecommendation:
 # ── Run Summary ───────────────────────────────────────────────
 
 
+def _build_summary(tmp_path, successes=8, failures=2, shutdown=False):
+    """Helper to build a summary with controlled results."""
+    role = _make_role()
+    centers = [_make_center(code=f"HOU-{i:03d}", zip_code=f"7700{i}") for i in range(10)]
+    config = _make_config(roles=[role], centers=centers)
+    executor = _make_executor(config=config, tmp_path=tmp_path)
+    if shutdown:
+        executor.shutdown_requested = True
+
+    for i in range(successes):
+        task = _make_task(role=role, center=centers[i])
+        executor.results.append(_success_result(task, duration=30.0 + i * 10))
+    for i in range(failures):
+        task = _make_task(role=role, center=centers[successes + i])
+        executor.results.append(_failure_result(task, "No jobs found", duration=5.0))
+
+    exec_stats = executor.get_summary_stats()
+
+    # Minimal aggregated_markets stub
+    class FakeMarket:
+        has_sufficient_data = True
+    aggregated_markets = {"Houston": FakeMarket()}
+
+    return _build_run_summary(
+        start_time=1000000.0,
+        end_time=1008853.0,
+        config=config,
+        config_file="test_config.yaml",
+        executor=executor,
+        exec_stats=exec_stats,
+        aggregated_markets=aggregated_markets,
+    )
+
+
+@pytest.fixture(scope="module")
+def run_summary(tmp_path_factory):
+    """Summary of a partial run (8 successes, 2 failures); treat as read-only."""
+    return _build_summary(tmp_path_factory.mktemp("summary"))
+
+
+@pytest.fixture(scope="module")
+def success_summary(tmp_path_factory):
+    """Summary of a run where every task succeeded."""
+    return _build_summary(tmp_path_factory.mktemp("summary"), successes=10, failures=0)
+
+
+@pytest.fixture(scope="module")
+def interrupted_summary(tmp_path_factory):
+    """Summary of a partial run that was interrupted by a shutdown request."""
+    return _build_summary(tmp_path_factory.mktemp("summary"), shutdown=True)
+
+
 class TestBuildRunSummary:
     """_build_run_summary() produces a valid, well-structured dict."""
 
-    def _make_summary(self, tmp_path, successes=8, failures=2, shutdown=False):
-        """Helper to build a summary with controlled results."""
-        role = _make_role()
-        centers = [_make_center(code=f"HOU-{i:03d}", zip_code=f"7700{i}") for i in range(10)]
-        config = _make_config(roles=[role], centers=centers)
-        executor = _make_executor(config=config, tmp_path=tmp_path)
-        if shutdown:
-            executor.shutdown_requested = True
-
-        for i in range(successes):
-            task = _make_task(role=role, center=centers[i])
-            executor.results.append(_success_result(task, duration=30.0 + i * 10))
-        for i in range(failures):
-            task = _make_task(role=role, center=centers[successes + i])
-            executor.results.append(_failure_result(task, "No jobs found", duration=5.0))
-
-        exec_stats = executor.get_summary_stats()
-
-        # Minimal aggregated_markets stub
-        class FakeMarket:
-            has_sufficient_data = True
-        aggregated_markets = {"Houston": FakeMarket()}
-
-        return _build_run_summary(
-            start_time=1000000.0,
-            end_time=1008853.0,
-            config=config,
-            config_file="test_config.yaml",
-            executor=executor,
-            exec_stats=exec_stats,
-            aggregated_markets=aggregated_markets,
-        )
-
-    def test_schema_version(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        assert summary["schema_version"] == 1
-
-    def test_timestamps_present(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        assert "run_started_at" in summary
-        assert "run_finished_at" in summary
-
-    def test_duration(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        assert summary["duration_seconds"] == 8853.0
-        assert summary["duration_human"] == "2h 27m 33s"
-
-    def test_exit_status_partial(self, tmp_path):
-        summary = self._make_summary(tmp_path, successes=8, failures=2)
-        assert summary["exit_status"] == "partial"
-
-    def test_exit_status_success(self, tmp_path):
-        summary = self._make_summary(tmp_path, successes=10, failures=0)
-        assert summary["exit_status"] == "success"
-
-    def test_exit_status_interrupted(self, tmp_path):
-        summary = self._make_summary(tmp_path, shutdown=True)
-        assert summary["exit_status"] == "interrupted"
-
-    def test_task_counts(self, tmp_path):
-        summary = self._make_summary(tmp_path, successes=8, failures=2)
-        assert summary["tasks"]["total"] == 10
-        assert summary["tasks"]["successful"] == 8
-        assert summary["tasks"]["failed"] == 2
-        assert summary["tasks"]["success_rate_pct"] == 80.0
-
-    def test_config_summary(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        cs = summary["config_summary"]
+    @pytest.mark.parametrize("fixture_name,expected", [
+        ("run_summary", "partial"),
+        ("success_summary", "success"),
+        ("interrupted_summary", "interrupted"),
+    ], ids=["partial", "success", "interrupted"])
+    def test_exit_status(self, request, fixture_name, expected):
+        assert request.getfixturevalue(fixture_name)["exit_status"] == expected
+
+    def test_summary_structure(self, run_summary):
+        """All fields of the canonical 8-success, 2-failure summary."""
+        assert run_summary["schema_version"] == 1
+        assert "run_started_at" in run_summary
+        assert "run_finished_at" in run_summary
+        assert run_summary["duration_seconds"] == 8853.0
+        assert run_summary["duration_human"] == "2h 27m 33s"
+
+        assert run_summary["tasks"]["total"] == 10
+        assert run_summary["tasks"]["successful"] == 8
+        assert run_summary["tasks"]["failed"] == 2
+        assert run_summary["tasks"]["success_rate_pct"] == 80.0
+
+        cs = run_summary["config_summary"]
         assert cs["roles"] == ["rbt"]
         assert cs["regions"] == 1
         assert cs["markets"] == 1
         assert cs["centers"] == 10
 
-    def test_timing_section(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        assert "search_duration_p50_seconds" in summary["timing"]
-        assert "slowest_searches" in summary["timing"]
-        assert len(summary["timing"]["slowest_searches"]) <= 5
-
-    def test_errors_section(self, tmp_path):
-        summary = self._make_summary(tmp_path, failures=2)
-        assert summary["errors"]["total_failures"] == 2
-        assert "no_data" in summary["errors"]["by_category"]
-
-    def test_per_role(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        assert "rbt" in summary["per_role"]
-        assert summary["per_role"]["rbt"]["tasks"] == 10
-
-    def test_per_market(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        assert "Houston" in summary["per_market"]
-        houston = summary["per_market"]["Houston"]
+        assert "search_duration_p50_seconds" in run_summary["timing"]
+        assert "slowest_searches" in run_summary["timing"]
+        assert len(run_summary["timing"]["slowest_searches"]) <= 5
+
+        assert run_summary["errors"]["total_failures"] == 2
+        assert "no_data" in run_summary["errors"]["by_category"]
+
+        assert "rbt" in run_summary["per_role"]
+        assert run_summary["per_role"]["rbt"]["tasks"] == 10
+
+        assert "Houston" in run_summary["per_market"]
+        houston = run_summary["per_market"]["Houston"]
         assert houston["tasks"] == 10
         assert houston["with_sufficient_data"] is True
 
-    def test_recommendation_present(self, tmp_path):
-        summary = self._make_summary(tmp_path)
-        assert isinstance(summary["recommendation"], str)
-        assert len(summary["recommendation"]) > 0
+        assert isinstance(run_summary["recommendation"], str)
+        assert len(run_summary["recommendation"]) > 0
 
-    def test_json_serializable(self, tmp_path):
+    def test_json_serializable(self, run_summary):
         """The entire summary must serialize to JSON without errors."""
-        summary = self._make_summary(tmp_path)
-        serialized = json.dumps(summary, indent=2)
+        serialized = json.dumps(run_summary, indent=2)
         roundtripped = json.loads(serialized)
         assert roundtripped["schema_version"] == 1
+
+    def test_dump_run_summary(self, run_summary):
+        """The encoder used for run_summary.json round-trips the summary."""
+        assert json.loads(_dump_run_summary(run_summary)) == run_summary
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dump_run_summary_non_ascii(self, use_orjson, monkeypatch):
+        """Non-ASCII text is written as UTF-8 by both encoders."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("jobx.market_analysis.cli.orjson", None)
+        summary = {"market": "San José", "error": "Zeitüberschreitung"}
+        data = _dump_run_summary(summary)
+        assert "San José".encode("utf-8") in data
+        assert json.loads(data.decode("utf-8")) == summary
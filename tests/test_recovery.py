@@ -1,16 +1,19 @@
 """Tests for crash recovery, checkpointing, retry, and graceful shutdown."""
 
+import json
 import os
 import signal
 import threading
 import time
 from concurrent.futures import Future
+from functools import lru_cache
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
-import yaml
 
+from jobx.market_analysis import _yaml
 from jobx.market_analysis.anti_detection_utils import SafetyManager
 from jobx.market_analysis.batch_executor import (
     BatchExecutor,
@@ -34,6 +37,7 @@ from jobx.market_analysis.config_loader import (
     Role,
     SearchConfig,
 )
+from jobx.market_analysis.logger import MarketAnalysisLogger
 
 
 # ── Helpers ────────────────────────────────────────────────────
@@ -69,7 +73,7 @@ def _make_config(roles=None, centers=None, batch_size=2):
 def _make_executor(config=None, tmp_path=None, enable_safety=True, max_retries=3):
     config = config or _make_config()
     output_dir = str(tmp_path) if tmp_path else "."
-    logger = MagicMock()
+    logger = MagicMock(spec=MarketAnalysisLogger)
     return BatchExecutor(
         config, logger, output_dir=output_dir,
         enable_safety=enable_safety, max_retries=max_retries,
@@ -85,16 +89,23 @@ def _make_task(role=None, center=None, market_name="Houston", region_name="Texas
     )
 
 
-def _success_result(task, jobs_found=10, jobs_with_salary=5):
-    df = pd.DataFrame({
+@lru_cache(maxsize=32)
+def _jobs_df(jobs_found, jobs_with_salary):
+    """Jobs frame shared by every result with the same counts; do not mutate."""
+    without_salary = np.full(jobs_found - jobs_with_salary, np.nan)
+    return pd.DataFrame({
         "title": [f"Job {i}" for i in range(jobs_found)],
-        "min_amount": [50000.0] * jobs_with_salary + [None] * (jobs_found - jobs_with_salary),
-        "max_amount": [70000.0] * jobs_with_salary + [None] * (jobs_found - jobs_with_salary),
+        "min_amount": np.concatenate([np.full(jobs_with_salary, 50000.0), without_salary]),
+        "max_amount": np.concatenate([np.full(jobs_with_salary, 70000.0), without_salary]),
         "job_url": [f"https://example.com/job/{i}" for i in range(jobs_found)],
     })
+
+
+def _success_result(task, jobs_found=10, jobs_with_salary=5):
     return LocationResult(
         center=task.center, role=task.role, success=True,
-        jobs_df=df, jobs_found=jobs_found, jobs_with_salary=jobs_with_salary,
+        jobs_df=_jobs_df(jobs_found, jobs_with_salary),
+        jobs_found=jobs_found, jobs_with_salary=jobs_with_salary,
         market_name=task.market_name, region_name=task.region_name,
     )
 
@@ -109,25 +120,28 @@ def _failure_result(task, error="Connection timeout"):
 # ── SafetyManager Checkpoint Tests ────────────────────────────
 
 
+@pytest.fixture
+def sm(tmp_path):
+    """A SafetyManager writing into the test's own empty directory."""
+    return SafetyManager(str(tmp_path))
+
+
 class TestSafetyManagerCheckpoint:
-    """Test task-level checkpoint mark/query and YAML persistence."""
+    """Test task-level checkpoint mark/query and snapshot persistence."""
 
-    def test_mark_task_complete(self, tmp_path):
-        sm = SafetyManager(str(tmp_path))
+    def test_mark_task_complete(self, sm):
         sm.mark_task_complete("HOU-001", "rbt", 10, 5, "raw_jobs_HOU-001_rbt.csv")
 
         assert sm.is_task_done("HOU-001", "rbt")
         assert sm.get_completed_task_csv("HOU-001", "rbt") == "raw_jobs_HOU-001_rbt.csv"
 
-    def test_mark_task_failed(self, tmp_path):
-        sm = SafetyManager(str(tmp_path))
+    def test_mark_task_failed(self, sm):
         sm.mark_task_failed("ATL-001", "rbt", "Connection timeout", 3)
 
         assert sm.is_task_done("ATL-001", "rbt")
         assert sm.get_completed_task_csv("ATL-001", "rbt") is None
 
-    def test_not_done_for_unknown_task(self, tmp_path):
-        sm = SafetyManager(str(tmp_path))
+    def test_not_done_for_unknown_task(self, sm):
         assert not sm.is_task_done("UNKNOWN", "rbt")
 
     def test_persistence_across_loads(self, tmp_path):
@@ -138,8 +152,7 @@ class TestSafetyManagerCheckpoint:
         assert sm2.is_task_done("HOU-001", "rbt")
         assert sm2.get_completed_task_csv("HOU-001", "rbt") == "raw.csv"
 
-    def test_retry_success_clears_failed(self, tmp_path):
-        sm = SafetyManager(str(tmp_path))
+    def test_retry_success_clears_failed(self, sm):
         sm.mark_task_failed("HOU-001", "rbt", "timeout", 2)
         assert "HOU-001:rbt" in sm.progress["failed_tasks"]
 
@@ -157,7 +170,7 @@ class TestSafetyManagerCheckpoint:
         }
         progress_file = tmp_path / "search_progress.yaml"
         with open(progress_file, 'w') as f:
-            yaml.dump(v1_data, f)
+            _yaml.safe_dump(v1_data, f)
 
         sm = SafetyManager(str(tmp_path))
         assert sm.progress["schema_version"] == 2
@@ -165,13 +178,23 @@ class TestSafetyManagerCheckpoint:
         assert "Texas" in sm.progress["completed_regions"]
         assert sm.progress["completed_tasks"] == {}
 
-    def test_set_total_tasks(self, tmp_path):
-        sm = SafetyManager(str(tmp_path))
+    def test_legacy_yaml_snapshot_converted(self, tmp_path, sm):
+        """A v2 snapshot from the YAML era is loaded and rewritten as JSON."""
+        sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
+        with open(tmp_path / "search_progress.yaml", "w") as f:
+            _yaml.safe_dump(sm.progress, f)
+        sm.journal_file.unlink()
+
+        reloaded = SafetyManager(str(tmp_path))
+        assert reloaded.get_completed_task_csv("C1", "r1") == "a.csv"
+        assert (tmp_path / "search_progress.json").exists()
+        assert not (tmp_path / "search_progress.yaml").exists()
+
+    def test_set_total_tasks(self, sm):
         sm.set_total_tasks(42)
         assert sm.progress["total_tasks"] == 42
 
-    def test_progress_summary(self, tmp_path):
-        sm = SafetyManager(str(tmp_path))
+    def test_progress_summary(self, sm):
         sm.set_total_tasks(10)
         sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
         sm.mark_task_failed("C2", "r1", "error", 3)
@@ -179,9 +202,8 @@ class TestSafetyManagerCheckpoint:
         summary = sm.get_progress_summary()
         assert summary == {"total": 10, "completed": 1, "failed": 1, "remaining": 8}
 
-    def test_thread_safety(self, tmp_path):
+    def test_thread_safety(self, tmp_path, sm):
         """Concurrent mark_task_complete calls should not lose entries."""
-        sm = SafetyManager(str(tmp_path))
         errors = []
 
         def mark(i):
@@ -199,28 +221,101 @@ class TestSafetyManagerCheckpoint:
         assert not errors
         assert len(sm.progress["completed_tasks"]) == 20
 
-    def test_atomic_save(self, tmp_path):
-        """No .yaml.tmp file should be left after save."""
-        sm = SafetyManager(str(tmp_path))
+        sm.flush()
+        assert len(SafetyManager(str(tmp_path)).progress["completed_tasks"]) == 20
+
+    def test_marks_survive_reload_before_compaction(self, tmp_path, sm):
+        """Marks live in the journal until compaction and are replayed on load."""
         sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
+        sm.mark_task_failed("C2", "r1", "timeout", 3)
 
-        tmp_file = tmp_path / "search_progress.yaml.tmp"
-        assert not tmp_file.exists()
-        assert (tmp_path / "search_progress.yaml").exists()
+        assert not (tmp_path / "search_progress.json").exists()
+        reloaded = SafetyManager(str(tmp_path))
+        assert reloaded.get_completed_task_csv("C1", "r1") == "a.csv"
+        assert reloaded.is_task_done("C2", "r1")
+
+    def test_flush_compacts_journal(self, sm):
+        sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
+        sm.mark_center_complete("C1")
+        sm.flush()
 
-    def test_legacy_mark_center_still_works(self, tmp_path):
+        assert not sm.journal_file.exists()
+        with open(sm.progress_file) as f:
+            snapshot = json.load(f)
+        assert list(snapshot["completed_tasks"]) == ["C1:r1"]
+        assert snapshot["completed_centers"] == ["C1"]
+
+    def test_compacts_after_threshold(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(SafetyManager, "COMPACT_AFTER", 3)
         sm = SafetyManager(str(tmp_path))
+        for i in range(3):
+            sm.mark_task_complete(f"C{i}", "r1", 1, 0, f"{i}.csv")
+
+        assert not sm.journal_file.exists()
+        assert sm.progress_file.exists()
+        sm.mark_task_complete("C3", "r1", 1, 0, "3.csv")
+        assert sm.journal_file.exists()
+
+    def test_truncated_journal_line_is_skipped(self, tmp_path, sm):
+        sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
+        with open(sm.journal_file, "a") as f:
+            f.write('{"op": "complete", "key": "C2:r1"')
+
+        reloaded = SafetyManager(str(tmp_path))
+        assert reloaded.is_task_done("C1", "r1")
+        assert not reloaded.is_task_done("C2", "r1")
+
+    def test_retry_success_survives_replay(self, tmp_path, sm):
+        sm.mark_task_failed("HOU-001", "rbt", "timeout", 2)
+        sm.mark_task_complete("HOU-001", "rbt", 10, 5, "raw.csv")
+
+        reloaded = SafetyManager(str(tmp_path))
+        assert "HOU-001:rbt" not in reloaded.progress["failed_tasks"]
+        assert "HOU-001:rbt" in reloaded.progress["completed_tasks"]
+
+    def test_atomic_save(self, tmp_path, sm):
+        """No .json.tmp file should be left after save."""
+        sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
+        sm.flush()
+
+        tmp_file = tmp_path / "search_progress.json.tmp"
+        assert not tmp_file.exists()
+        assert (tmp_path / "search_progress.json").exists()
+
+    def test_fsync_mode(self, tmp_path):
+        sm = SafetyManager(str(tmp_path), fsync=True)
+        with patch("jobx.market_analysis.anti_detection_utils.os.fsync") as mock_fsync:
+            sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
+            assert mock_fsync.call_count == 1
+            sm.flush()
+        # journal append, snapshot file, parent directory
+        assert mock_fsync.call_count == (3 if hasattr(os, "O_DIRECTORY") else 2)
+        assert SafetyManager(str(tmp_path)).is_task_done("C1", "r1")
+
+    def test_legacy_mark_center_still_works(self, sm):
         sm.mark_center_complete("HOU-001")
         assert sm.is_center_complete("HOU-001")
 
-    def test_reset_progress(self, tmp_path):
-        sm = SafetyManager(str(tmp_path))
+    def test_reset_progress(self, sm):
         sm.mark_task_complete("C1", "r1", 5, 2, "a.csv")
         sm.reset_progress()
         assert not sm.is_task_done("C1", "r1")
         assert sm.progress["schema_version"] == 2
 
 
+class TestRoleSearchTask:
+
+    def test_derived_names(self):
+        task = _make_task()
+        assert task.key == "HOU-001:rbt"
+        assert task.csv_name == "raw_jobs_HOU-001_rbt.csv"
+
+    def test_is_frozen(self):
+        task = _make_task()
+        with pytest.raises(AttributeError):
+            task.market_name = "Dallas"
+
+
 # ── Retry Search Tests ─────────────────────────────────────────
 
 
@@ -364,6 +459,32 @@ class TestResumeFromCheckpoint:
         assert reloaded[0].jobs_found == 2
         assert reloaded[0].jobs_with_salary == 1
 
+    def test_reload_counts_come_from_checkpoint(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        task = _make_task()
+        csv_path = tmp_path / f"raw_jobs_{task.center.code}_{task.role.id}.csv"
+        pd.DataFrame({"title": ["Job 1"], "min_amount": [None], "max_amount": [None]}).to_csv(
+            csv_path, index=False
+        )
+        executor.safety.mark_task_complete(task.center.code, task.role.id, 7, 3, str(csv_path))
+
+        reloaded = executor._reload_completed_tasks([task])
+        assert (reloaded[0].jobs_found, reloaded[0].jobs_with_salary) == (7, 3)
+        assert len(reloaded[0].jobs_df) == 1
+
+    def test_reload_entry_without_counts(self, tmp_path):
+        executor = _make_executor(tmp_path=tmp_path)
+        task = _make_task()
+        csv_path = tmp_path / f"raw_jobs_{task.center.code}_{task.role.id}.csv"
+        pd.DataFrame({"title": ["Job 1"], "min_amount": [None], "max_amount": [None]}).to_csv(
+            csv_path, index=False
+        )
+        executor.safety.progress["completed_tasks"][task.key] = {"csv_file": str(csv_path)}
+
+        reloaded = executor._reload_completed_tasks([task])
+        assert (reloaded[0].jobs_found, reloaded[0].jobs_with_salary) == (0, 0)
+        executor.logger.warning.assert_not_called()
+
     def test_missing_csv_skips_and_reruns(self, tmp_path):
         executor = _make_executor(tmp_path=tmp_path)
         task = _make_task()
@@ -2,6 +2,7 @@
 
 """Tests for the jobx.scoring module."""
 
+import numpy as np
 import pytest
 
 from jobx.model import JobPost, Location
@@ -48,6 +49,11 @@ class TestTextUtilities:
         similarity = calculate_text_similarity("software engineer", "software developer")
         assert 0.5 < similarity < 1.0
 
+    def test_text_similarity_is_indel_ratio(self):
+        """Test the score is 2 * LCS / combined length."""
+        # LCS of "kitten" and "sitting" is "ittn"
+        assert calculate_text_similarity("kitten", "sitting") == pytest.approx(8 / 13)
+
 
 class TestKeywordMatching:
     """Test keyword matching functionality."""
@@ -127,6 +133,14 @@ class TestDescriptionScoring:
         assert calculate_description_score("", description) == 0.0
         assert calculate_description_score("query", "") == 0.0
         assert calculate_description_score("query", None) == 0.0
+    
+    def test_description_not_kept_in_normalize_cache(self):
+        """Test descriptions are normalized outside the normalize_text cache."""
+        description = "A long description mentioning Python and Django " * 50
+        normalize_text.cache_clear()
+        calculate_description_score.cache_clear()
+        calculate_description_score("python django", description)
+        assert normalize_text.cache_info().currsize == 1  # the query only
 
 
 class TestLocationScoring:
@@ -262,6 +276,36 @@ class TestJobScoring:
         assert remote_job_score > 0.5
 
 
+    @pytest.mark.parametrize("weights", [None, {'title': 1.0}, {'title': 0.7, 'location': 0.6}])
+    def test_score_jobs_matches_confidence_score(self, weights):
+        """Batch scores equal per-job scores, with ties kept in input order."""
+        jobs = [
+            JobPost(title="Python Developer", company_name=None, job_url="https://example.com/1",
+                    location=Location(city="Austin", state="TX")),
+            JobPost(title="Data Analyst", company_name=None, job_url="https://example.com/2",
+                    location=None, description="SQL and Python"),
+            JobPost(title="Python Developer", company_name=None, job_url="https://example.com/3",
+                    location=Location(city="Austin", state="TX")),
+            JobPost(title="Remote Python Engineer", company_name=None, job_url="https://example.com/4",
+                    location=None, is_remote=True),
+        ]
+
+        scored = score_jobs(jobs, "python developer", "Austin, TX", weights)
+
+        expected = [(job, calculate_confidence_score(job, "python developer", "Austin, TX", weights))
+                    for job in jobs]
+        expected.sort(key=lambda x: x[1], reverse=True)
+        assert [job.job_url for job, _ in scored] == [job.job_url for job, _ in expected]
+        assert [score for _, score in scored] == [score for _, score in expected]
+        assert all(type(score) is float for _, score in scored)
+
+        ranked_jobs, scores = score_jobs(jobs, "python developer", "Austin, TX", weights,
+                                         return_arrays=True)
+        assert list(ranked_jobs) == [job for job, _ in scored]
+        assert scores.dtype == np.float64
+        assert scores.tolist() == [score for _, score in scored]
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
     
@@ -284,6 +328,9 @@ class TestEdgeCases:
         """Test scoring empty job list."""
         scored = score_jobs([], "python", "New York")
         assert scored == []
+
+        ranked_jobs, scores = score_jobs([], "python", "New York", return_arrays=True)
+        assert len(ranked_jobs) == 0 and len(scores) == 0
     
     def test_special_characters(self):
         """Test handling of special characters."""
@@ -0,0 +1,94 @@
+"""Tests for SearchMonitor failure tracking and pause heuristics."""
+
+import json
+from datetime import datetime, timedelta
+
+from jobx.market_analysis.anti_detection_utils import SearchMonitor
+
+
+class TestFailureLog:
+    """Failures are appended to a JSONL log, not embedded in the stats file."""
+
+    def test_failure_appended_as_jsonl(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        monitor.record_search("Houston (77001)", False, error="Connection timeout")
+        monitor.record_search("Austin (73301)", False, error="429")
+
+        lines = monitor.failure_log.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["location"] == "Houston (77001)"
+        assert json.loads(lines[1])["error"] == "429"
+
+    def test_stats_file_holds_only_counters(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        monitor.record_search("Houston (77001)", False, error="boom")
+
+        stats = json.loads(monitor.log_file.read_text())
+        assert "failure_patterns" not in stats
+        assert stats["total_failures"] == 1
+        assert stats["locations"]["Houston (77001)"]["failures"] == 1
+
+    def test_recent_failures_restored_on_reload(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        for _ in range(3):
+            monitor.record_search("Houston (77001)", False, error="boom")
+
+        reloaded = SearchMonitor(str(tmp_path))
+        assert reloaded.should_pause() == (True, "3 consecutive failures within 5 minutes")
+
+    def test_legacy_failure_patterns_migrated(self, tmp_path):
+        now = datetime.now().isoformat()
+        legacy = {
+            "locations": {},
+            "failure_patterns": [{"time": now, "location": "X", "error": "e"}],
+            "last_success": None,
+            "total_searches": 1,
+            "total_failures": 1,
+            "session_start": now,
+        }
+        (tmp_path / "search_monitor.json").write_text(json.dumps(legacy))
+
+        monitor = SearchMonitor(str(tmp_path))
+        assert "failure_patterns" not in monitor.stats
+        assert len(monitor.failure_log.read_text().splitlines()) == 1
+
+
+class TestShouldPause:
+    def test_no_failures_ok(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        assert monitor.should_pause() == (False, "OK")
+
+    def test_spread_out_failures_do_not_pause(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        start = datetime.now() - timedelta(minutes=50)
+        monitor._recent_failures.extend(start + timedelta(minutes=10 * i) for i in range(3))
+        assert monitor.should_pause() == (False, "OK")
+
+    def test_many_recent_failures_pause(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        start = datetime.now() - timedelta(minutes=59)
+        monitor._recent_failures.extend(start + timedelta(minutes=10 * i) for i in range(6))
+        assert monitor.should_pause() == (True, "Too many recent failures (6 in last hour)")
+
+    def test_old_failures_pruned(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        start = datetime.now() - timedelta(hours=3)
+        monitor._recent_failures.extend(start + timedelta(minutes=i) for i in range(10))
+
+        assert monitor.should_pause() == (False, "OK")
+        assert len(monitor._recent_failures) == 0
+
+
+class TestGetSummary:
+    def test_no_searches(self, tmp_path):
+        assert SearchMonitor(str(tmp_path)).get_summary() == "No searches recorded yet"
+
+    def test_summary_counts(self, tmp_path):
+        monitor = SearchMonitor(str(tmp_path))
+        monitor.record_search("Houston (77001)", True, jobs_found=4)
+        monitor.record_search("Austin (73301)", False, error="boom")
+
+        summary = monitor.get_summary()
+        assert "Total searches: 2" in summary
+        assert "Success rate: 50.0%" in summary
+        assert "Unique locations: 2" in summary
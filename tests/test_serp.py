@@ -98,6 +98,20 @@ class TestLinkedInSerpParser:
         assert items[1].index_on_page == 1
         assert items[1].company_name == "Company XYZ"
         assert items[1].is_sponsored is True  # Contains "Promoted"
+
+    def test_widget_cards_do_not_take_a_position(self, parser):
+        """Cards without a job link are skipped and leave no gap in positions."""
+        html = """
+        <div class="base-search-card"><a class="base-card__full-link" href="/jobs/view/1">A</a></div>
+        <div class="base-search-card"><span>People also searched</span></div>
+        <div class="base-search-card"><a class="base-card__full-link" href="/jobs/view/2">B</a></div>
+        """
+        items = parser.parse_serp_items(BeautifulSoup(html, "html.parser"), page_index=1)
+
+        assert [(item.job_id, item.index_on_page) for item in items] == [
+            ("/jobs/view/1", 0),
+            ("/jobs/view/2", 1),
+        ]
         
     def test_detect_sponsored(self, parser):
         """Test sponsored detection."""
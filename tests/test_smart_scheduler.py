@@ -0,0 +1,98 @@
+"""Tests for SmartScheduler search windows."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from jobx.market_analysis.anti_detection_utils import SmartScheduler
+
+# 2024-01-03 is a Wednesday, 2024-01-06 a Saturday
+WEDNESDAY = (2024, 1, 3)
+SATURDAY = (2024, 1, 6)
+
+
+def _check_at(day, hour, minute, second=0):
+    return SmartScheduler.is_good_time_to_search(datetime(*day, hour, minute, second))
+
+
+class TestIsGoodTimeToSearch:
+    """Window boundaries match the original wall-clock comparisons."""
+
+    @pytest.mark.parametrize(
+        "hour,minute,expected",
+        [
+            (9, 0, (True, "Peak hour window: 09:00-11:30")),
+            (11, 30, (True, "Peak hour window: 09:00-11:30")),
+            (13, 0, (True, "Peak hour window: 12:30-14:30")),
+            (17, 59, (True, "Peak hour window: 16:00-18:00")),
+            (21, 30, (True, "Peak hour window: 19:30-21:30")),
+            (11, 45, (True, "Weekday off-peak (acceptable)")),
+            (2, 0, (False, "Too early - wait until business hours")),
+            (6, 0, (False, "Too early - wait until business hours")),
+            (22, 30, (False, "Outside optimal search hours")),
+            (1, 0, (False, "Outside optimal search hours")),
+        ],
+    )
+    def test_weekday_windows(self, hour, minute, expected):
+        assert _check_at(WEDNESDAY, hour, minute) == expected
+
+    def test_weekend_off_peak(self):
+        assert _check_at(SATURDAY, 8, 0) == (True, "Weekend hours (lower traffic expected)")
+
+    def test_inclusive_end_respects_seconds(self):
+        # 11:30:30 is past the 11:30 peak end, 06:00:30 past the night window
+        assert _check_at(WEDNESDAY, 11, 30, 30) == (True, "Weekday off-peak (acceptable)")
+        assert _check_at(WEDNESDAY, 6, 0, 30) == (True, "Weekday off-peak (acceptable)")
+
+
+class TestWaitForGoodTime:
+    """Waiting sleeps once until the next window instead of polling."""
+
+    @pytest.mark.parametrize(
+        "day,hour,minute,expected",
+        [
+            (WEDNESDAY, 3, 0, 3 * 3600 + 1),
+            (WEDNESDAY, 6, 0, 1),
+            (WEDNESDAY, 23, 0, 7 * 3600 + 1),
+            (WEDNESDAY, 1, 30, 4.5 * 3600 + 1),
+        ],
+    )
+    def test_seconds_until_next_window(self, day, hour, minute, expected):
+        now = datetime(*day, hour, minute)
+        assert SmartScheduler._seconds_until_next_window(now) == pytest.approx(expected)
+
+    def test_single_sleep_until_window(self):
+        times = iter([datetime(*WEDNESDAY, 3, 0), datetime(*WEDNESDAY, 6, 1)])
+        with patch("jobx.market_analysis.anti_detection_utils.datetime") as mock_dt, \
+                patch("jobx.market_analysis.anti_detection_utils.random.uniform", return_value=0), \
+                patch("jobx.market_analysis.anti_detection_utils.time.sleep") as mock_sleep:
+            mock_dt.now.side_effect = lambda: next(times)
+            SmartScheduler.wait_for_good_time()
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(3 * 3600 + 1)
+
+
+class TestHumanLikeDelays:
+    """Batch delays stay within the scalar delay's bounds."""
+
+    def test_batch_shape_and_bounds(self):
+        with patch.object(SmartScheduler, "get_delay_multiplier", return_value=1.0):
+            delays = SmartScheduler.get_human_like_delays(1000, base_delay=5.0)
+
+        assert delays.shape == (1000,)
+        # base + typing (0.5-2) + reading (2-5), plus an optional 10-30s distraction
+        assert delays.min() >= 7.5
+        assert delays.max() <= 42.0
+
+    def test_multiplier_uses_given_time(self):
+        sunday = datetime(2024, 1, 7, 12, 0)
+        assert SmartScheduler.get_delay_multiplier(sunday) == SmartScheduler.SUNDAY_MULTIPLIER
+
+    def test_scalar_wrapper(self):
+        with patch.object(SmartScheduler, "get_delay_multiplier", return_value=2.0):
+            delay = SmartScheduler.get_human_like_delay(60)
+
+        assert isinstance(delay, float)
+        assert 122.5 <= delay <= 157.0
@@ -11,7 +11,7 @@ from unittest.mock import patch
 import pandas as pd
 import pytest
 
-from jobx.cli import main
+from jobx.cli import _build_parser, main
 
 
 @pytest.fixture
@@ -54,6 +54,10 @@ class TestCLI:
         assert len(df) == 3
         assert list(df.columns) == ["title", "company", "location", "salary_source"]
 
+        pq = pytest.importorskip("pyarrow.parquet")
+        column = pq.ParquetFile(output_file).metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+
     def test_parquet_output_without_file(self):
         """Test that Parquet format requires output file."""
         test_args = [
@@ -149,3 +153,13 @@ class TestCLI:
         # Invalid format should raise error
         with pytest.raises(SystemExit):
             parser.parse_args(["-f", "json"])
+
+    def test_parser_is_built_once(self):
+        """main reuses one parser, which parses repeatedly without leaking state."""
+        parser = _build_parser()
+        assert _build_parser() is parser
+
+        first = parser.parse_args(["-q", "python", "-l", "Austin", "-f", "csv"])
+        second = parser.parse_args(["-q", "golang", "-l", "Denver"])
+        assert (first.query, first.format) == ("python", "csv")
+        assert (second.query, second.format) == ("golang", "json")
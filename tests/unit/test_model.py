@@ -22,41 +22,47 @@ from jobx.model import (
 )
 
 
+# Shared across the module; tests must not mutate them
+@pytest.fixture(scope="module")
+def ny_location():
+    """New York location used by display and JobPost tests."""
+    return Location(city="New York", state="NY", country=Country.USA)
+
+
+@pytest.fixture(scope="module")
+def yearly_compensation():
+    """Yearly 80k-120k compensation in the default currency."""
+    return Compensation(
+        interval=CompensationInterval.YEARLY,
+        min_amount=80000,
+        max_amount=120000
+    )
+
+
 class TestLocation:
     """Test Location model."""
     
-    def test_location_display_basic(self):
-        """Test basic location display."""
-        location = Location(city="New York", state="NY", country=Country.USA)
+    @pytest.mark.parametrize("location,expected_parts", [
+        pytest.param(Location(city="New York", state="NY", country=Country.USA),
+                     ("New York", "NY"), id="basic"),
+        pytest.param(Location(city="Remote", country=Country.WORLDWIDE),
+                     ("Remote",), id="worldwide"),
+        pytest.param(Location(city="London", country="UK"),
+                     ("London", "UK"), id="string_country"),
+    ])
+    def test_location_display(self, location, expected_parts):
+        """Test location display for enum and string countries."""
         display = location.display_location()
-        assert "New York" in display
-        assert "NY" in display
-    
-    def test_location_display_worldwide(self):
-        """Test worldwide location display."""
-        location = Location(city="Remote", country=Country.WORLDWIDE)
-        display = location.display_location()
-        assert "Remote" in display
-    
-    def test_location_display_string_country(self):
-        """Test location with string country."""
-        location = Location(city="London", country="UK")
-        display = location.display_location()
-        assert "London" in display
-        assert "UK" in display
+        for part in expected_parts:
+            assert part in display
 
 
 class TestCompensation:
     """Test Compensation model."""
     
-    def test_compensation_basic(self):
+    def test_compensation_basic(self, yearly_compensation):
         """Test basic compensation creation."""
-        comp = Compensation(
-            interval=CompensationInterval.YEARLY,
-            min_amount=80000,
-            max_amount=120000,
-            currency="USD"
-        )
+        comp = yearly_compensation
         assert comp.interval == CompensationInterval.YEARLY
         assert comp.min_amount == 80000
         assert comp.max_amount == 120000
@@ -86,23 +92,16 @@ class TestJobPost:
         assert job.company_name == "Test Company"
         assert job.job_url == "https://example.com/job/123"
     
-    def test_job_post_complete(self):
+    def test_job_post_complete(self, ny_location, yearly_compensation):
         """Test JobPost with all fields."""
-        location = Location(city="New York", state="NY", country=Country.USA)
-        compensation = Compensation(
-            interval=CompensationInterval.YEARLY,
-            min_amount=80000,
-            max_amount=120000
-        )
-        
         job = JobPost(
             id="job-123",
             title="Senior Software Engineer",
             company_name="Tech Corp",
             job_url="https://example.com/job/123",
-            location=location,
+            location=ny_location,
             description="Great opportunity...",
-            compensation=compensation,
+            compensation=yearly_compensation,
             date_posted=date(2025, 1, 1),
             job_type=[JobType.FULL_TIME],
             is_remote=True
@@ -115,6 +114,20 @@ class TestJobPost:
         assert job.job_type[0] == JobType.FULL_TIME
 
 
+    def test_job_post_keeps_nested_instances(self, ny_location, yearly_compensation):
+        """Prebuilt nested models are stored as-is, not copied or revalidated."""
+        job = JobPost(
+            title="Engineer",
+            company_name=None,
+            job_url="https://example.com/job/1",
+            location=ny_location,
+            compensation=yearly_compensation
+        )
+        assert job.location is ny_location
+        assert job.compensation is yearly_compensation
+        assert JobResponse(jobs=[job]).jobs[0] is job
+
+
 class TestJobResponse:
     """Test JobResponse model."""
     
@@ -147,12 +160,21 @@ class TestJobResponse:
 class TestCountry:
     """Test Country enum."""
     
-    def test_country_from_string(self):
+    @pytest.mark.parametrize("country_str,expected", [
+        ("usa", Country.USA),
+        ("US", Country.USA),
+        ("united states", Country.USA),
+        ("worldwide", Country.WORLDWIDE),
+    ])
+    def test_country_from_string(self, country_str, expected):
         """Test Country.from_string method."""
-        assert Country.from_string("usa") == Country.USA
-        assert Country.from_string("US") == Country.USA
-        assert Country.from_string("united states") == Country.USA
-        assert Country.from_string("worldwide") == Country.WORLDWIDE
+        assert Country.from_string(country_str) == expected
+    
+    def test_country_from_string_every_alias(self):
+        """Test every listed alias resolves, ignoring case and padding."""
+        for country in Country:
+            for name in country.value[0].split(","):
+                assert Country.from_string(f"  {name.upper()} ") is country
     
     def test_country_from_string_invalid(self):
         """Test Country.from_string with invalid input."""
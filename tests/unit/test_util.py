@@ -6,17 +6,23 @@ Unit tests for jobx.util module.
 
 import json
 import logging
-from unittest.mock import patch
+import os
 
 import pytest
 
 from jobx.util import (
+    JSONFormatter,
     LogConfig,
+    convert_to_annual,
+    convert_to_annual_df,
     create_logger,
     currency_parser,
     extract_salary,
     is_remote_job,
+    markdown_converter,
     parse_job_type_enum,
+    remove_attributes,
+    set_logger_level,
 )
 from jobx.model import JobType
 
@@ -24,6 +30,20 @@ from jobx.model import JobType
 class TestLogConfig:
     """Test LogConfig dataclass."""
     
+    @pytest.fixture(autouse=True)
+    def clear_env_cache(self):
+        """Reset the cached environment config around each test."""
+        LogConfig.from_env.cache_clear()
+        yield
+        LogConfig.from_env.cache_clear()
+    
+    @pytest.fixture
+    def clean_env(self, monkeypatch):
+        """Unset the JOBX_ variables; monkeypatch restores only what it touched."""
+        for key in [k for k in os.environ if k.startswith("JOBX_")]:
+            monkeypatch.delenv(key)
+        return monkeypatch
+    
     def test_default_values(self):
         """Test default LogConfig values."""
         config = LogConfig()
@@ -31,26 +51,31 @@ class TestLogConfig:
         assert config.level == "INFO"
         assert config.include_context is True
     
-    def test_from_env_defaults(self):
+    def test_from_env_defaults(self, clean_env):
         """Test LogConfig.from_env with default environment."""
-        with patch.dict("os.environ", {}, clear=True):
-            config = LogConfig.from_env()
-            assert config.use_json is False
-            assert config.level == "INFO"
-            assert config.include_context is True
+        config = LogConfig.from_env()
+        assert config.use_json is False
+        assert config.level == "INFO"
+        assert config.include_context is True
     
-    def test_from_env_custom(self):
+    def test_from_env_custom(self, clean_env):
         """Test LogConfig.from_env with custom environment."""
-        env_vars = {
-            "JOBX_LOG_JSON": "true",
-            "JOBX_LOG_LEVEL": "DEBUG",
-            "JOBX_LOG_CONTEXT": "false",
-        }
-        with patch.dict("os.environ", env_vars):
-            config = LogConfig.from_env()
-            assert config.use_json is True
-            assert config.level == "DEBUG"
-            assert config.include_context is False
+        clean_env.setenv("JOBX_LOG_JSON", "true")
+        clean_env.setenv("JOBX_LOG_LEVEL", "DEBUG")
+        clean_env.setenv("JOBX_LOG_CONTEXT", "false")
+        config = LogConfig.from_env()
+        assert config.use_json is True
+        assert config.level == "DEBUG"
+        assert config.include_context is False
+    
+    def test_from_env_cached(self, clean_env):
+        """Test LogConfig.from_env is read once until the cache is cleared."""
+        clean_env.setenv("JOBX_LOG_LEVEL", "DEBUG")
+        first = LogConfig.from_env()
+        clean_env.setenv("JOBX_LOG_LEVEL", "ERROR")
+        assert LogConfig.from_env() is first
+        LogConfig.from_env.cache_clear()
+        assert LogConfig.from_env().level == "ERROR"
 
 
 class TestCreateLogger:
@@ -62,6 +87,24 @@ class TestCreateLogger:
         assert logger.name == "JobX:test"
         assert len(logger.handlers) > 0
     
+    def test_create_logger_reuses_instance(self):
+        """Test repeated calls return the same configured logger."""
+        logger = create_logger("test_reuse")
+        assert create_logger("test_reuse") is logger
+        assert len(logger.handlers) == 1
+    
+    def test_set_logger_level(self):
+        """Test verbosity applies to loggers from create_logger."""
+        logger = create_logger("test_level")
+        try:
+            set_logger_level(0)
+            assert logger.level == logging.ERROR
+            set_logger_level(1)
+            assert logger.level == logging.WARNING
+        finally:
+            set_logger_level(2)
+        assert logger.level == logging.INFO
+    
     def test_create_logger_json_format(self):
         """Test logger creation with JSON format."""
         logger = create_logger("test_json", use_json=True)
@@ -69,6 +112,17 @@ class TestCreateLogger:
         # Check that JSON formatter is used
         formatter = logger.handlers[0].formatter
         assert hasattr(formatter, "format")
+    
+    def test_json_formatter_output(self):
+        """Test JSON formatter emits parseable records with extra data."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord("JobX:test", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+        record.extra_data = {"job_id": "123", "huge": 2**70}
+        data = json.loads(formatter.format(record))
+        assert data["message"] == "hello world"
+        assert data["level"] == "INFO"
+        assert data["job_id"] == "123"
+        assert data["huge"] == 2**70
 
 
 class TestCurrencyParser:
@@ -84,29 +138,50 @@ class TestCurrencyParser:
         """Test currency parser edge cases."""
         assert currency_parser("100") == 100.0
         assert currency_parser("1,000.00") == 1000.0
+    
+    @pytest.mark.parametrize("cur_str,expected", [
+        ("1.234,56 €", 1234.56),
+        ("1 234,00", 1234.0),
+        ("-$1,500", -1500.0),
+    ])
+    def test_currency_parser_separators(self, cur_str, expected):
+        """Test decimal commas and negative amounts."""
+        assert currency_parser(cur_str) == expected
 
 
 class TestExtractSalary:
     """Test salary extraction functionality."""
     
-    def test_extract_salary_range(self):
-        """Test extracting salary range."""
-        text = "Salary: $80,000 - $120,000 per year"
-        interval, min_amt, max_amt, currency = extract_salary(text)
-        assert interval == "yearly"
-        assert min_amt == 80000
-        assert max_amt == 120000
-        assert currency == "USD"
+    @pytest.mark.parametrize("text,interval,min_amt,max_amt", [
+        ("Salary: $80,000 - $120,000 per year", "yearly", 80000, 120000),
+        ("Hourly rate: $25 - $35 per hour", "hourly", 25, 35),
+    ])
+    def test_extract_salary_range(self, text, interval, min_amt, max_amt):
+        """Test extracting yearly and hourly salary ranges."""
+        assert extract_salary(text) == (interval, min_amt, max_amt, "USD")
     
-    def test_extract_salary_hourly(self):
-        """Test extracting hourly salary."""
+    def test_extract_salary_cached(self):
+        """Test repeated descriptions are served from the cache."""
+        extract_salary.cache_clear()
+        text = "Pay: $90,000 - $110,000 per year"
+        first = extract_salary(text)
+        assert extract_salary(text) is first
+        assert extract_salary.cache_info().hits == 1
+    
+    def test_extract_salary_enforce_annual(self):
+        """Test hourly amounts are annualized when requested."""
         text = "Hourly rate: $25 - $35 per hour"
-        interval, min_amt, max_amt, currency = extract_salary(text)
+        interval, min_amt, max_amt, currency = extract_salary(text, enforce_annual_salary=True)
         assert interval == "hourly"
-        assert min_amt == 25
-        assert max_amt == 35
+        assert min_amt == 25 * 2080
+        assert max_amt == 35 * 2080
         assert currency == "USD"
     
+    def test_extract_salary_out_of_limits(self):
+        """Test annualized values outside the limits are rejected."""
+        text = "Hourly rate: $25 - $35 per hour"
+        assert extract_salary(text, upper_limit=60000) == (None, None, None, None)
+    
     def test_extract_salary_none(self):
         """Test salary extraction returns None for invalid input."""
         result = extract_salary("")
@@ -116,45 +191,157 @@ class TestExtractSalary:
         assert result == (None, None, None, None)
 
 
-class TestIsRemoteJob:
-    """Test remote job detection."""
+class TestConvertToAnnual:
+    """Test scalar and vectorized salary annualization."""
+    
+    def test_convert_to_annual_df_matches_scalar(self):
+        """Test the DataFrame version agrees with the per-row version."""
+        import pandas as pd
+        
+        rows = [
+            {"interval": "hourly", "min_amount": 20.0, "max_amount": 30.0},
+            {"interval": "monthly", "min_amount": 4000.0, "max_amount": 5000.0},
+            {"interval": "weekly", "min_amount": 1000.0, "max_amount": 1200.0},
+            {"interval": "daily", "min_amount": 200.0, "max_amount": 250.0},
+            {"interval": "yearly", "min_amount": 90000.0, "max_amount": 110000.0},
+        ]
+        df = pd.DataFrame(rows)
+        convert_to_annual_df(df)
+        for row in rows:
+            convert_to_annual(row)
+        assert df.to_dict("records") == rows
+    
+    def test_convert_to_annual_df_mask(self):
+        """Test only masked rows are converted."""
+        import pandas as pd
+        
+        df = pd.DataFrame({
+            "interval": ["hourly", "hourly"],
+            "min_amount": [20.0, 20.0],
+            "max_amount": [30.0, None],
+        })
+        convert_to_annual_df(df, [True, False])
+        assert df["interval"].tolist() == ["yearly", "hourly"]
+        assert df["min_amount"].tolist() == [41600.0, 20.0]
+        assert df["max_amount"].iloc[0] == 62400.0
+        assert pd.isna(df["max_amount"].iloc[1])
+
+
+class TestMarkdownConverter:
+    """Test HTML to Markdown conversion."""
     
-    def test_is_remote_job_positive(self):
-        """Test detecting remote jobs."""
-        assert is_remote_job("Remote Software Engineer", "", "")
-        assert is_remote_job("", "Work from home opportunity", "")
-        assert is_remote_job("", "", "Remote location")
-        assert is_remote_job("", "WFH position available", "")
+    def test_markdown_converter_none(self):
+        """Test None passes through."""
+        assert markdown_converter(None) is None
     
-    def test_is_remote_job_negative(self):
-        """Test non-remote job detection."""
-        assert not is_remote_job("On-site Engineer", "Office based role", "New York")
-        assert not is_remote_job("", "", "")
+    def test_markdown_converter_plaintext(self):
+        """Test plaintext skips parsing and keeps its line breaks."""
+        assert markdown_converter("  Line one\n\nLine two  ") == "Line one\n\nLine two"
+        assert markdown_converter("Fish &amp; chips") == "Fish & chips"
     
-    def test_is_remote_job_case_insensitive(self):
-        """Test case insensitive remote detection."""
-        assert is_remote_job("REMOTE position", "", "")
-        assert is_remote_job("", "WORK FROM HOME", "")
+    def test_markdown_converter_inline(self):
+        """Test emphasis, links and whitespace collapsing."""
+        html = "<p>\n  Join as a <strong>\n Senior Engineer\n </strong> at <a href=\"https://x.com\">X</a> &amp; grow.\n</p>"
+        assert markdown_converter(html) == "Join as a **Senior Engineer** at [X](https://x.com) & grow."
+    
+    @pytest.mark.parametrize("html,expected", [
+        ("<h2>Duties</h2>", "Duties\n------"),
+        ("<ul><li>a<ul><li>b</li></ul></li></ul>", "* a\n  + b"),
+        ("<ol><li>first</li><li>second</li></ol>", "1. first\n2. second"),
+        ("<blockquote>Ship it</blockquote>", "> Ship it"),
+        (
+            "<table><tr><th>Level</th><th>Pay</th></tr><tr><td>Senior</td><td>150k</td></tr></table>",
+            "| Level | Pay |\n| --- | --- |\n| Senior | 150k |",
+        ),
+        ("<p><img src=\"a.png\" alt=\"Logo\">Done<script>x()</script></p>", "![Logo](a.png)Done"),
+        ("<p>Example:</p><pre>def f():\n    return 1</pre>", "Example:\n\n```\ndef f():\n    return 1\n```"),
+        ("<p>Know snake_case and *nix</p>", "Know snake\\_case and \\*nix"),
+        ("<p>1. not a list</p>", "1. not a list"),
+    ])
+    def test_markdown_converter_constructs(self, html, expected):
+        """Test each block construct renders to one fixed Markdown form."""
+        assert markdown_converter(html) == expected
+    
+    def test_markdown_converter_linkedin_description(self):
+        """Test a LinkedIn-style description end to end."""
+        html = (
+            "<div class=\"show-more-less-html__markup\"><strong>About the role</strong><br><br>"
+            "Acme is hiring a <em>Senior Data Engineer</em> to build pipelines in Python &amp; SQL.<br><br>"
+            "<strong>Responsibilities</strong><ul><li>Design ETL for snake_case schemas</li>"
+            "<li>Own *nix tooling &mdash; caf&eacute; hours</li></ul>"
+            "<p>Pay: $120,000 - $150,000 <a href=\"https://acme.example/apply\">Apply</a></p></div>"
+        )
+        assert markdown_converter(html) == (
+            "**About the role**  \n  \n"
+            "Acme is hiring a *Senior Data Engineer* to build pipelines in Python & SQL.  \n  \n"
+            "**Responsibilities**\n\n"
+            "* Design ETL for snake\\_case schemas\n"
+            "* Own \\*nix tooling \u2014 caf\u00e9 hours\n\n"
+            "Pay: $120,000 - $150,000 [Apply](https://acme.example/apply)"
+        )
+
+
+class TestRemoveAttributes:
+    """Test attribute stripping on BeautifulSoup tags."""
+    
+    def test_remove_attributes(self):
+        """Test all attributes are dropped from the tag."""
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup('<div class="a" id="b"><p>hi</p></div>', "html.parser")
+        tag = remove_attributes(soup.div)
+        assert tag.attrs == {}
+        assert str(tag) == "<div><p>hi</p></div>"
+
+
+class TestIsRemoteJob:
+    """Test remote job detection."""
+    
+    @pytest.mark.parametrize("title,description,location,expected", [
+        pytest.param("Remote Software Engineer", "", "", True, id="title"),
+        pytest.param("", "Work from home opportunity", "", True, id="description"),
+        pytest.param("", "", "Remote location", True, id="location"),
+        pytest.param("", "WFH position available", "", True, id="wfh"),
+        pytest.param("On-site Engineer", "Office based role", "New York", False, id="on_site"),
+        pytest.param("", "", "", False, id="empty"),
+        pytest.param("REMOTE position", "", "", True, id="upper_title"),
+        pytest.param("", "WORK FROM HOME", "", True, id="upper_description"),
+    ])
+    def test_is_remote_job(self, title, description, location, expected):
+        """Test remote detection across fields, case-insensitively."""
+        assert is_remote_job(title, description, location) is expected
 
 
 class TestParseJobTypeEnum:
     """Test job type enum parsing."""
     
-    def test_parse_job_type_enum_success(self):
+    @pytest.mark.parametrize("job_type_str,expected", [
+        ("fulltime", JobType.FULL_TIME),
+        ("part-time", JobType.PART_TIME),
+        ("contract", JobType.CONTRACT),
+        ("internship", JobType.INTERNSHIP),
+    ])
+    def test_parse_job_type_enum_success(self, job_type_str, expected):
         """Test successful job type parsing."""
-        assert parse_job_type_enum("fulltime") == JobType.FULL_TIME
-        assert parse_job_type_enum("part-time") == JobType.PART_TIME
-        assert parse_job_type_enum("contract") == JobType.CONTRACT
-        assert parse_job_type_enum("internship") == JobType.INTERNSHIP
+        assert parse_job_type_enum(job_type_str) == expected
     
-    def test_parse_job_type_enum_normalization(self):
+    @pytest.mark.parametrize("job_type_str,expected", [
+        ("Full Time", JobType.FULL_TIME),
+        ("part-time", JobType.PART_TIME),
+        ("CONTRACT", JobType.CONTRACT),
+    ])
+    def test_parse_job_type_enum_normalization(self, job_type_str, expected):
         """Test job type string normalization."""
-        assert parse_job_type_enum("Full Time") == JobType.FULL_TIME
-        assert parse_job_type_enum("part-time") == JobType.PART_TIME
-        assert parse_job_type_enum("CONTRACT") == JobType.CONTRACT
+        assert parse_job_type_enum(job_type_str) == expected
+    
+    def test_parse_job_type_enum_first_member_wins(self):
+        """Test every alias resolves to the first job type that lists it."""
+        for job_type in JobType:
+            for alias in job_type.value:
+                expected = next(jt for jt in JobType if alias in jt.value)
+                assert parse_job_type_enum(alias) == expected
     
-    def test_parse_job_type_enum_none(self):
+    @pytest.mark.parametrize("job_type_str", [None, "", "invalid"])
+    def test_parse_job_type_enum_none(self, job_type_str):
         """Test job type parsing returns None for invalid input."""
-        assert parse_job_type_enum(None) is None
-        assert parse_job_type_enum("") is None
-        assert parse_job_type_enum("invalid") is None
\ No newline at end of file
+        assert parse_job_type_enum(job_type_str) is None
\ No newline at end of file